@@ -6,9 +6,16 @@ incluindo cadastro, busca, atualização, remoção e geração de relatórios.
 """
 
 from models import Student
-from validators import StudentValidator
+from validators import StudentValidator, ValidationMask
 from database import DatabaseManager
+from backends import StorageBackend, JsonBackend, ShardedJsonBackend, SQLiteBackend
+from readonly import ReadOnlyDatabaseManager
 from reports import ReportManager
+from commands import CommandRunner
+from server import StudentServer
+from metrics import Metrics, metrics
+from changefeed import ChangeFeed
+from rendercache import RenderCache
 from handlers import (
     MenuHandler,
     StudentInputHandler, 
@@ -19,8 +26,20 @@ from handlers import (
 __all__ = [
     'Student',
     'StudentValidator', 
+    'ValidationMask',
     'DatabaseManager',
+    'StorageBackend',
+    'JsonBackend',
+    'ShardedJsonBackend',
+    'SQLiteBackend',
+    'ReadOnlyDatabaseManager',
     'ReportManager',
+    'CommandRunner',
+    'StudentServer',
+    'Metrics',
+    'metrics',
+    'ChangeFeed',
+    'RenderCache',
     'MenuHandler',
     'StudentInputHandler',
     'StudentUpdateHandler', 
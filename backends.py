@@ -0,0 +1,673 @@
+"""
+Backends - Armazenamento do cadastro em arquivos JSON ou em banco SQLite.
+"""
+
+import heapq
+import json
+import os
+import sqlite3
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from models import Student
+from snapshot import BinarySnapshot, SnapshotError
+from indexes import CourseAggregate, FuzzyNameIndex, course_key, email_key, normalize_text
+
+
+def _files_state(paths: Iterable[str]) -> tuple:
+    """Identificação (inode, modificação, tamanho) de cada arquivo; None se ausente."""
+    state = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            state.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            state.append(None)
+    return tuple(state)
+
+
+class StorageBackend:
+    """Interface de armazenamento usada pelo DatabaseManager.
+
+    Todo backend sabe carregar e gravar o cadastro inteiro (``load`` e
+    ``save``) e persistir alterações avulsas (``append``), no formato de
+    registros do journal. Backends com ``pushdown`` verdadeiro também
+    respondem às consultas e alterações diretamente; com eles o
+    DatabaseManager não mantém o cadastro em memória.
+    """
+
+    pushdown = False
+
+    def __init__(self, path: str):
+        self.path = path
+        # Bytes gravados em arquivos desde a criação do backend (o SQLite
+        # não os informa).
+        self.bytes_written = 0
+
+    def _sync(self, file):
+        """Força a gravação de um arquivo recém-escrito e contabiliza seu tamanho."""
+        file.flush()
+        os.fsync(file.fileno())
+        self.bytes_written += os.fstat(file.fileno()).st_size
+
+    def load(self) -> List[Student]:
+        """Estudantes do último snapshot, na ordem de cadastro."""
+        raise NotImplementedError
+
+    def replay(self) -> Iterator[Dict]:
+        """Alterações registradas depois do snapshot, em ordem."""
+        return iter(())
+
+    def save(self, students: Iterable[Student], changes: Optional[List[Dict]] = None):
+        """Substitui o conteúdo armazenado pelos estudantes dados.
+
+        ``changes`` lista as alterações desde a última gravação (None se
+        desconhecidas); backends podem usá-la para reescrever menos dados.
+        """
+        raise NotImplementedError
+
+    def append(self, records: List[Dict]):
+        """Persiste alterações avulsas de forma durável."""
+        raise NotImplementedError
+
+    def state(self) -> tuple:
+        """Versão do armazenamento em disco, para detectar alterações externas."""
+        return ()
+
+    def close(self):
+        """Libera os recursos abertos pelo backend."""
+
+
+class JsonBackend(StorageBackend):
+    """Snapshot JSON com journal opcional e snapshot binário opcional."""
+
+    JOURNAL_SUFFIX = ".journal"
+    BINARY_SUFFIX = ".bin"
+
+    def __init__(self, filename: str = "students_data.json", binary_snapshot: bool = False):
+        super().__init__(filename)
+        self.filename = filename
+        self.journal_filename = filename + self.JOURNAL_SUFFIX
+        self.binary_filename = filename + self.BINARY_SUFFIX
+        self.binary_snapshot = binary_snapshot
+
+    def load(self) -> List[Student]:
+        """Lê o snapshot binário, se estiver em dia, ou o JSON."""
+        students = self._load_binary_snapshot() if self.binary_snapshot else None
+        if students is None and os.path.exists(self.filename):
+            with open(self.filename, 'r', encoding='utf-8') as file:
+                students = [Student.from_dict(data) for data in json.load(file)]
+            if self.binary_snapshot:
+                # Prepara o caminho rápido para as próximas inicializações.
+                self.write_binary_snapshot(students)
+        return students or []
+
+    def binary_current(self) -> bool:
+        """Indica se o snapshot binário existe e não é mais antigo que o JSON."""
+        if not os.path.exists(self.binary_filename):
+            return False
+        return not (os.path.exists(self.filename) and
+                    os.stat(self.binary_filename).st_mtime_ns < os.stat(self.filename).st_mtime_ns)
+
+    def _load_binary_snapshot(self) -> Optional[List[Student]]:
+        """Lê o snapshot binário se ele estiver em dia com o JSON.
+
+        Retorna None (e o JSON é usado) se o binário não existir, for mais
+        antigo que o JSON ou estiver corrompido.
+        """
+        if not self.binary_current():
+            return None
+
+        try:
+            return BinarySnapshot.read(self.binary_filename)
+        except SnapshotError as e:
+            print(f"Snapshot binário ignorado: {e}")
+            return None
+
+    def write_binary_snapshot(self, students: Iterable[Student]):
+        """Grava o snapshot binário; falhas não afetam o JSON já salvo."""
+        try:
+            BinarySnapshot.write(self.binary_filename, students)
+            self.bytes_written += os.path.getsize(self.binary_filename)
+        except (SnapshotError, OSError, ValueError, OverflowError) as e:
+            print(f"Snapshot binário não gravado: {e}")
+
+    def replay(self) -> Iterator[Dict]:
+        """Percorre os registros do journal.
+
+        Uma última linha incompleta (escrita interrompida) é descartada e
+        o arquivo é truncado no último registro íntegro.
+        """
+        if not os.path.exists(self.journal_filename):
+            return
+
+        valid_size = 0
+        with open(self.journal_filename, 'rb') as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                yield json.loads(line.decode('utf-8'))
+                valid_size += len(line)
+
+        if valid_size < os.path.getsize(self.journal_filename):
+            with open(self.journal_filename, 'r+b') as file:
+                file.truncate(valid_size)
+
+    def save(self, students: Iterable[Student], changes: Optional[List[Dict]] = None):
+        """Grava o JSON de forma atômica.
+
+        O snapshot é escrito em um arquivo temporário e renomeado sobre o
+        original; só então o journal, já incorporado, é descartado.
+        """
+        students = list(students)
+        data = [student.to_dict() for student in students]
+        tmp_filename = self.filename + ".tmp"
+
+        with open(tmp_filename, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False, indent=2)
+            self._sync(file)
+        os.replace(tmp_filename, self.filename)
+
+        if self.binary_snapshot:
+            self.write_binary_snapshot(students)
+
+        if os.path.exists(self.journal_filename):
+            os.remove(self.journal_filename)
+
+    def append(self, records: List[Dict]):
+        """Anexa registros ao journal e força a gravação em disco."""
+        payload = "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in records
+        ).encode('utf-8')
+        with open(self.journal_filename, 'ab') as file:
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+        self.bytes_written += len(payload)
+
+    def state(self) -> tuple:
+        """Identifica a versão em disco do arquivo principal e do journal."""
+        return _files_state((self.filename, self.journal_filename))
+
+
+def _read_shard(path: str) -> List[tuple]:
+    """Lê um shard e devolve tuplas (ordem, campos do estudante).
+
+    Executada nos processos do pool: devolve tuplas em vez de estudantes,
+    que são mais baratas de transferir entre processos.
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as file:
+        return [(data['ordem'], data['matricula'], data['name'], data['email'],
+                 data['course'], data['age'], data['registration_date'])
+                for data in json.load(file)]
+
+
+def _aggregate_shard(path: str) -> Tuple[Counter, Counter]:
+    """Contagens (curso, idade) e por dia de cadastro de um shard."""
+    rows = _read_shard(path)
+    return (Counter((row[4], row[5]) for row in rows),
+            Counter(row[6] for row in rows))
+
+
+class ShardedJsonBackend(JsonBackend):
+    """Cadastro dividido em vários arquivos JSON (shards).
+
+    Cada estudante vai para o shard dado pelo hash (CRC32) da matrícula ou
+    do curso normalizado. Os shards são lidos em paralelo, em um pool de
+    processos (ou threads), e cada gravação reescreve só os shards afetados
+    pelas alterações. Cada registro guarda sua posição no cadastro
+    (``ordem``), usada para intercalar os shards na carga.
+
+    Uma gravação que envolve vários shards (como a mudança de curso com
+    ``by='course'``) troca cada arquivo de forma atômica, mas não o conjunto:
+    uma queda entre duas trocas pode deixar um estudante em nenhum ou em
+    dois shards.
+
+    A quantidade de shards e o critério ficam em ``<arquivo>.shards``; se
+    mudarem, a próxima gravação redistribui o cadastro. Sem esse arquivo,
+    um ``<arquivo>`` JSON comum existente é carregado e dividido na
+    primeira gravação. O journal (``DatabaseManager(journal=True)``) é o
+    mesmo do ``JsonBackend``.
+    """
+
+    STRATEGIES = ('matricula', 'course')
+    MANIFEST_SUFFIX = ".shards"
+
+    def __init__(self, filename: str = "students_data.json", shards: int = 4,
+                 by: str = 'matricula', workers: Optional[int] = None,
+                 processes: bool = True):
+        if shards < 1:
+            raise ValueError("A quantidade de shards deve ser positiva")
+        if by not in self.STRATEGIES:
+            raise ValueError(f"Critério de divisão inválido: {by}")
+        super().__init__(filename)
+        self.shards = shards
+        self.by = by
+        self.workers = workers
+        self.processes = processes
+        self.manifest_filename = filename + self.MANIFEST_SUFFIX
+        # Posição de cadastro e shard de cada matrícula gravada.
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self._shard_of: Dict[str, int] = {}
+        self._layout: Optional[Tuple[int, str]] = None
+
+    def shard_filename(self, index: int, shards: Optional[int] = None) -> str:
+        return f"{self.filename}.shard-{index:02d}of{shards or self.shards:02d}"
+
+    def shard_for(self, student: Student) -> int:
+        """Índice do shard do estudante, estável entre execuções."""
+        key = student.matricula if self.by == 'matricula' else course_key(student.course)
+        return zlib.crc32(key.encode('utf-8')) % self.shards
+
+    def _read_manifest(self) -> Optional[Tuple[int, str]]:
+        if not os.path.exists(self.manifest_filename):
+            return None
+        with open(self.manifest_filename, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+        return manifest['shards'], manifest['by']
+
+    def _map(self, function, items: List) -> List:
+        """Aplica a função aos itens no pool configurado."""
+        workers = min(self.workers or os.cpu_count() or 1, len(items))
+        if workers < 2:
+            return [function(item) for item in items]
+        executor = ProcessPoolExecutor if self.processes else ThreadPoolExecutor
+        with executor(max_workers=workers) as pool:
+            return list(pool.map(function, items))
+
+    def _shard_paths(self) -> List[str]:
+        """Arquivos dos shards gravados, segundo o manifesto."""
+        shards, _ = self._layout
+        return [self.shard_filename(i, shards) for i in range(shards)]
+
+    def load(self) -> List[Student]:
+        """Lê os shards em paralelo e os intercala na ordem de cadastro."""
+        self._layout = self._read_manifest()
+        if self._layout is None:
+            # Cadastro ainda monolítico: será dividido na primeira gravação.
+            students = super().load()
+            self._order = {s.matricula: i for i, s in enumerate(students)}
+            self._next_order = len(students)
+            self._shard_of = {}
+            return students
+
+        shards = self._map(_read_shard, self._shard_paths())
+        # As posições são únicas: basta colocar cada linha na sua posição,
+        # sem intercalar comparando.
+        self._next_order = max((row[0] + 1 for rows in shards for row in rows), default=0)
+        slots: List[Optional[tuple]] = [None] * self._next_order
+        self._shard_of = {}
+        for index, rows in enumerate(shards):
+            for row in rows:
+                slots[row[0]] = row
+                self._shard_of[row[1]] = index
+        rows = [row for row in slots if row is not None]
+        self._order = {row[1]: row[0] for row in rows}
+        return [Student.from_fields(*row[1:]) for row in rows]
+
+    def save(self, students: Iterable[Student], changes: Optional[List[Dict]] = None):
+        """Grava os shards afetados pelas alterações (todos, sem ``changes``)."""
+        layout = (self.shards, self.by)
+        full = changes is None or self._layout != layout
+        changed = set()
+        if full:
+            # Gravação completa: as posições são renumeradas na ordem atual.
+            self._order = {}
+            self._next_order = 0
+        else:
+            for record in changes:
+                if record['op'] == 'add':
+                    changed.add(record['student']['matricula'])
+                else:
+                    changed.add(record['matricula'])
+                    if record['op'] == 'remove':
+                        # Se voltar no mesmo lote, entra no fim do cadastro.
+                        self._order.pop(record['matricula'], None)
+
+        parts: List[List[Student]] = [[] for _ in range(self.shards)]
+        shard_of = {}
+        for student in students:
+            matricula = student.matricula
+            index = None if full or matricula in changed else self._shard_of.get(matricula)
+            if index is None:
+                index = self.shard_for(student)
+            shard_of[matricula] = index
+            parts[index].append(student)
+            if matricula not in self._order:
+                self._order[matricula] = self._next_order
+                self._next_order += 1
+
+        if full:
+            dirty = set(range(self.shards))
+        else:
+            dirty = {index for matricula in changed
+                     for index in (self._shard_of.get(matricula), shard_of.get(matricula))
+                     if index is not None}
+        # Se algo falhar, a próxima gravação refaz todos os shards.
+        self._layout = None
+        for index in sorted(dirty):
+            self._write_shard(self.shard_filename(index), parts[index])
+        if full:
+            self._write_manifest(layout)
+        for matricula in changed - shard_of.keys():
+            self._order.pop(matricula, None)
+        self._shard_of = shard_of
+        self._layout = layout
+
+        if os.path.exists(self.journal_filename):
+            os.remove(self.journal_filename)
+
+    def _write_shard(self, path: str, students: List[Student]):
+        """Grava um shard de forma atômica."""
+        order = self._order
+        data = [dict(ordem=order[s.matricula], **s.to_dict()) for s in students]
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+            self._sync(file)
+        os.replace(tmp_path, path)
+
+    def _write_manifest(self, layout: Tuple[int, str]):
+        """Registra a divisão atual e apaga shards de divisões anteriores."""
+        previous = self._read_manifest()
+        tmp_path = self.manifest_filename + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump({'shards': layout[0], 'by': layout[1]}, file)
+            self._sync(file)
+        os.replace(tmp_path, self.manifest_filename)
+        if previous is not None and previous[0] != layout[0]:
+            for index in range(previous[0]):
+                path = self.shard_filename(index, previous[0])
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def state(self) -> tuple:
+        paths = [self.manifest_filename, self.journal_filename]
+        paths.extend(self.shard_filename(i) for i in range(self.shards))
+        return _files_state(paths)
+
+    def aggregates(self) -> Tuple[Dict[str, CourseAggregate], Dict[str, int]]:
+        """Agregados por curso e por dia, calculados por shard em paralelo.
+
+        Refletem o que está gravado nos shards; alterações ainda no
+        journal só entram depois de ``compact()``.
+        """
+        layout = self._read_manifest()
+        if layout is None:
+            return {}, {}
+        by_course_age, per_day = Counter(), Counter()
+        paths = [self.shard_filename(i, layout[0]) for i in range(layout[0])]
+        for course_ages, days in self._map(_aggregate_shard, paths):
+            by_course_age.update(course_ages)
+            per_day.update(days)
+
+        stats: Dict[str, CourseAggregate] = {}
+        for (course, age), count in by_course_age.items():
+            aggregate = stats.get(course)
+            if aggregate is None:
+                aggregate = stats[course] = CourseAggregate()
+            aggregate.add(age, count)
+        return stats, dict(per_day)
+
+
+class SQLiteBackend(StorageBackend):
+    """Cadastro em um banco SQLite, com consultas executadas no banco.
+
+    O banco usa WAL (leitores não esperam o escritor) e sincronização
+    completa a cada transação. Nome, email e curso são gravados também
+    normalizados, em colunas indexadas, de modo que as buscas do
+    DatabaseManager viram consultas SQL com os mesmos critérios da versão
+    em memória. Os comandos usam parâmetros e texto fixo, aproveitando o
+    cache de comandos preparados do módulo ``sqlite3``.
+    """
+
+    pushdown = True
+    COLUMNS = "matricula, name, email, course, age, registration_date"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS students (
+            id INTEGER PRIMARY KEY,
+            matricula TEXT NOT NULL UNIQUE,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            course TEXT NOT NULL,
+            age INTEGER NOT NULL,
+            registration_date TEXT NOT NULL,
+            name_key TEXT NOT NULL,
+            email_key TEXT NOT NULL,
+            course_key TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS students_name ON students (name_key);
+        CREATE INDEX IF NOT EXISTS students_email ON students (email_key);
+        CREATE INDEX IF NOT EXISTS students_course ON students (course_key);
+        CREATE INDEX IF NOT EXISTS students_age ON students (age);
+        CREATE INDEX IF NOT EXISTS students_date ON students (registration_date, matricula);
+    """
+    INSERT = ("INSERT INTO students (matricula, name, email, course, age, registration_date, "
+              "name_key, email_key, course_key) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)")
+    # Colunas normalizadas que acompanham cada campo alterável.
+    KEY_COLUMNS = {
+        'name': ('name_key', normalize_text),
+        'email': ('email_key', email_key),
+        'course': ('course_key', course_key),
+    }
+
+    def __init__(self, path: str = "students.db"):
+        super().__init__(path)
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False,
+                                     cached_statements=256)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.executescript(self.SCHEMA)
+        self._depth = 0
+        # Versão das escritas feitas por esta conexão; junto com o
+        # data_version do SQLite invalida o índice de busca aproximada.
+        self._version = 0
+        self._fuzzy: Optional[FuzzyNameIndex] = None
+        self._fuzzy_version = None
+
+    @classmethod
+    def _row(cls, student: Student) -> tuple:
+        return (student.matricula, student.name, student.email, student.course,
+                int(student.age), student.registration_date, normalize_text(student.name),
+                email_key(student.email), course_key(student.course))
+
+    @contextmanager
+    def transaction(self):
+        """Transação de escrita; blocos aninhados fazem parte da externa."""
+        if self._depth:
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        self._depth = 1
+        try:
+            yield
+        except BaseException:
+            self._depth = 0
+            self._conn.execute("ROLLBACK")
+            self._version += 1
+            raise
+        self._depth = 0
+        self._conn.execute("COMMIT")
+
+    def _select(self, where: str = "", params: tuple = (),
+                order: str = "id") -> List[Student]:
+        """Estudantes que satisfazem a condição, na ordem pedida."""
+        sql = f"SELECT {self.COLUMNS} FROM students {where} ORDER BY {order}"
+        return [Student.from_fields(*row) for row in self._conn.execute(sql, params)]
+
+    def load(self) -> List[Student]:
+        return self._select()
+
+    def save(self, students: Iterable[Student], changes: Optional[List[Dict]] = None):
+        with self.transaction():
+            self._conn.execute("DELETE FROM students")
+            self._conn.executemany(self.INSERT, map(self._row, students))
+        self._version += 1
+
+    def append(self, records: List[Dict]):
+        with self.transaction():
+            for record in records:
+                if record['op'] == 'add':
+                    self.add(Student.from_dict(record['student']))
+                elif record['op'] == 'update':
+                    self.update(record['matricula'], record['changes'])
+                elif record['op'] == 'remove':
+                    self.remove(record['matricula'])
+                else:
+                    raise ValueError(f"Operação desconhecida: {record['op']}")
+
+    def compact(self) -> bool:
+        """Incorpora o WAL ao arquivo do banco."""
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return True
+
+    def close(self):
+        self._conn.close()
+
+    def add(self, student: Student) -> bool:
+        """Inclui o estudante; recusa matrícula ou email já cadastrados."""
+        try:
+            with self.transaction():
+                if self.email_owner(email_key(student.email)) is not None:
+                    return False
+                self._conn.execute(self.INSERT, self._row(student))
+        except sqlite3.IntegrityError:
+            return False
+        self._version += 1
+        return True
+
+    def update(self, matricula: str, changes: Dict) -> bool:
+        """Altera os campos dados (já validados pelo DatabaseManager)."""
+        assignments = {}
+        for field, value in changes.items():
+            assignments[field] = int(value) if field == 'age' else value
+            if field in self.KEY_COLUMNS:
+                column, key = self.KEY_COLUMNS[field]
+                assignments[column] = key(value)
+        if not assignments:
+            return self.find_by_matricula(matricula) is not None
+
+        sql = "UPDATE students SET {} WHERE matricula = ?".format(
+            ", ".join(f"{column} = ?" for column in assignments))
+        with self.transaction():
+            cursor = self._conn.execute(sql, (*assignments.values(), matricula))
+        self._version += 1
+        return cursor.rowcount > 0
+
+    def remove(self, matricula: str) -> bool:
+        """Exclui o estudante da matrícula."""
+        with self.transaction():
+            cursor = self._conn.execute("DELETE FROM students WHERE matricula = ?", (matricula,))
+        self._version += 1
+        return cursor.rowcount > 0
+
+    def find_by_matricula(self, matricula: str) -> Optional[Student]:
+        students = self._select("WHERE matricula = ?", (matricula,))
+        return students[0] if students else None
+
+    def email_owner(self, key: str) -> Optional[str]:
+        """Matrícula do primeiro cadastro com a chave de email dada."""
+        row = self._conn.execute(
+            "SELECT matricula FROM students WHERE email_key = ? ORDER BY id LIMIT 1",
+            (key,)).fetchone()
+        return row[0] if row else None
+
+    def find_by_email(self, key: str) -> Optional[Student]:
+        students = self._select("WHERE email_key = ?", (key,), "id LIMIT 1")
+        return students[0] if students else None
+
+    def find_by_name(self, folded: str) -> List[Student]:
+        """Estudantes cujo nome normalizado contém o texto dado.
+
+        Busca por trecho não usa a ordem do índice de nomes, mas percorrer
+        o índice (só a chave e o id) lê bem menos páginas que a tabela.
+        """
+        return self._select(
+            "WHERE id IN (SELECT id FROM students INDEXED BY students_name "
+            "WHERE instr(name_key, ?) > 0)", (folded,))
+
+    def data_version(self) -> tuple:
+        """Muda a cada escrita no banco: (escritas desta conexão, PRAGMA data_version).
+
+        A primeira parte avança um a cada alteração ou lote desfeito nesta
+        conexão; a segunda, quando outra conexão grava.
+        """
+        return (self._version, self._conn.execute("PRAGMA data_version").fetchone()[0])
+
+    def _fuzzy_index(self) -> FuzzyNameIndex:
+        """Índice de busca aproximada, refeito quando o banco muda."""
+        version = self.data_version()
+        if self._fuzzy is None or self._fuzzy_version != version:
+            index = FuzzyNameIndex()
+            for rowid, name_key in self._conn.execute("SELECT id, name_key FROM students"):
+                index.add(rowid, name_key)
+            self._fuzzy, self._fuzzy_version = index, version
+        return self._fuzzy
+
+    def find_fuzzy(self, folded: str, max_distance: int, limit: int) -> List[Student]:
+        """Busca aproximada, dos mais próximos para os mais distantes."""
+        costs = self._fuzzy_index().search(folded, max_distance)
+        ranked = heapq.nsmallest(limit, costs, key=lambda rowid: (costs[rowid], rowid))
+        by_id = {}
+        for rowid in ranked:
+            row = self._conn.execute(
+                f"SELECT {self.COLUMNS} FROM students WHERE id = ?", (rowid,)).fetchone()
+            if row:
+                by_id[rowid] = Student.from_fields(*row)
+        return [by_id[rowid] for rowid in ranked if rowid in by_id]
+
+    def find(self, course: Optional[str] = None,
+             age_min: Optional[int] = None, age_max: Optional[int] = None,
+             date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Student]:
+        """Filtros combinados; o planejador do SQLite escolhe o índice."""
+        conditions, params = [], []
+        for condition, value in (("course_key = ?", course), ("age >= ?", age_min),
+                                 ("age <= ?", age_max), ("registration_date >= ?", date_from),
+                                 ("registration_date <= ?", date_to)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        where = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return self._select(where, tuple(params))
+
+    def page(self, order_by: str, limit: int, after: Optional[Tuple] = None,
+             offset: int = 0) -> List[Student]:
+        """Página pela ordenação dada, a partir da posição ``after``."""
+        if order_by == 'matricula':
+            order, where = "matricula", "WHERE matricula > ?"
+            params = (after[1],) if after else ()
+        else:
+            order = "registration_date, matricula"
+            where = "WHERE (registration_date, matricula) > (?, ?)"
+            params = tuple(after) if after else ()
+        if after is None:
+            return self._select("", (limit, offset), f"{order} LIMIT ? OFFSET ?")
+        return self._select(where, (*params, limit), f"{order} LIMIT ?")
+
+    def count(self) -> int:
+        return self._conn.execute("SELECT count(*) FROM students").fetchone()[0]
+
+    def course_stats(self) -> Dict[str, CourseAggregate]:
+        """Agregados por curso calculados com GROUP BY no banco."""
+        stats: Dict[str, CourseAggregate] = {}
+        for course, age, count in self._conn.execute(
+                "SELECT course, age, count(*) FROM students GROUP BY course, age"):
+            aggregate = stats.get(course)
+            if aggregate is None:
+                aggregate = stats[course] = CourseAggregate()
+            aggregate.add(age, count)
+        return stats
+
+    def registrations_per_day(self) -> Dict[str, int]:
+        return dict(self._conn.execute(
+            "SELECT registration_date, count(*) FROM students GROUP BY registration_date"))
@@ -0,0 +1,330 @@
+"""
+Benchmark - Medição de desempenho do cadastro, das buscas, da validação e dos relatórios.
+
+Uso:
+    python benchmark.py run --tamanhos 1000 10000 --saida base.json
+    python benchmark.py compare base.json atual.json --tolerancia 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from backends import JsonBackend
+from database import DatabaseManager
+from models import Student
+from reports import ReportManager
+from validators import StudentValidator
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+FORMAT_VERSION = 1
+
+FIRST_NAMES = ("Ana", "João", "Maria", "José", "Beatriz", "Lucas", "Fernanda", "Pedro",
+               "Júlia", "Gabriel", "Larissa", "Mateus", "Camila", "Rafael", "Letícia")
+LAST_NAMES = ("Silva", "Souza", "Oliveira", "Santos", "Pereira", "Lima", "Carvalho",
+              "Gomes", "Ribeiro", "Almeida", "Araújo", "Conceição", "Gorri", "Zanettin")
+COURSES = ("Análise e Desenvolvimento de Sistemas", "Engenharia de Software",
+           "Ciência da Computação", "Sistemas de Informação", "Redes de Computadores")
+
+
+def synthetic_students(count: int, start: int = 0, seed: int = 0) -> List[Student]:
+    """Gera estudantes sintéticos válidos, com matrícula e email únicos.
+
+    As matrículas seguem a ordem de ``start`` em diante, então lotes gerados
+    com ``start`` diferentes não colidem.
+    """
+    rng = random.Random(seed + start)
+    students = []
+    for i in range(start, start + count):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+        student = Student(name, f"aluno{i}@gmail.com", rng.choice(COURSES), rng.randint(16, 80))
+        student.matricula = f"STU{i:010d}"
+        student.registration_date = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        students.append(student)
+    return students
+
+
+class Measurement:
+    """Tempo de ``ops`` operações e pico de memória alocada por uma delas."""
+
+    def __init__(self, ops: int, seconds: float, peak_bytes: Optional[int] = None):
+        self.ops = ops
+        self.seconds = seconds
+        self.peak_bytes = peak_bytes
+
+    @property
+    def per_op(self) -> float:
+        return self.seconds / self.ops if self.ops else 0.0
+
+    def to_dict(self) -> Dict:
+        return {'ops': self.ops, 'seconds': self.seconds, 'per_op': self.per_op,
+                'peak_bytes': self.peak_bytes}
+
+    def __str__(self) -> str:
+        text = f"{_format_seconds(self.per_op)}/op ({self.ops} op)"
+        if self.peak_bytes is not None:
+            text += f", pico {_format_bytes(self.peak_bytes)}"
+        return text
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.2f} µs"
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class BenchmarkSuite:
+    """Mede as operações do cadastro sobre cadastros sintéticos de vários tamanhos.
+
+    Para cada tamanho o cadastro é gravado em ``directory`` e carregado por
+    um ``DatabaseManager``. Cada caso roda ``ops`` vezes (``write_ops`` para
+    as alterações, que regravam o arquivo), em ``repeat`` rodadas das quais
+    vale a mais rápida, e, com ``memory=True``, mais uma vez sob
+    ``tracemalloc`` para medir o pico de memória, já que o rastreamento
+    deixaria a medição de tempo mais lenta.
+    """
+
+    OPS = 1000
+    WRITE_OPS = 20
+    REPEAT = 3
+
+    def __init__(self, directory: str, ops: int = OPS, write_ops: int = WRITE_OPS,
+                 repeat: int = REPEAT, memory: bool = True,
+                 progress: Optional[Callable[[str], None]] = None):
+        self.directory = directory
+        self.ops = ops
+        self.write_ops = write_ops
+        self.repeat = repeat
+        self.memory = memory
+        self.progress = progress
+
+    def run(self, sizes: Iterable[int] = SIZES) -> Dict:
+        """Executa todos os casos em cada tamanho e devolve o resultado completo."""
+        results = {str(size): self.run_size(size) for size in sizes}
+        return {
+            'format': FORMAT_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'ops': self.ops,
+            'write_ops': self.write_ops,
+            'repeat': self.repeat,
+            'results': results,
+        }
+
+    def run_size(self, size: int) -> Dict[str, Dict]:
+        """Mede todos os casos sobre um cadastro com ``size`` estudantes."""
+        path = os.path.join(self.directory, f"benchmark_{size}.json")
+        students = synthetic_students(size)
+        JsonBackend(path).save(students)
+        matriculas = [student.matricula for student in students]
+        names = sorted({student.name for student in students})
+        del students
+
+        db = DatabaseManager(path)
+        reports = ReportManager(db)
+        rng = random.Random(size)
+        next_new = [size]
+
+        def load(ops):
+            for _ in range(ops):
+                db._load_data()
+
+        def add_student(ops):
+            for student in synthetic_students(ops, start=next_new[0]):
+                db.add_student(student)
+            next_new[0] += ops
+
+        def find_student_by_matricula(ops):
+            for matricula in rng.choices(matriculas, k=ops):
+                db.find_student_by_matricula(matricula)
+
+        def build_name_index(ops):
+            # A carga descarta o índice de nomes; o primeiro uso o monta.
+            for _ in range(ops):
+                db._name_index = None
+                db.find_students_by_name(names[0])
+
+        def find_students_by_name(ops):
+            for name in rng.choices(names, k=ops):
+                db.find_students_by_name(name)
+
+        def update_student(ops):
+            for matricula in rng.choices(matriculas, k=ops):
+                db.update_student(matricula, {'age': rng.randint(16, 80)})
+
+        def remove_student(ops):
+            for _ in range(ops):
+                db.remove_student(matriculas.pop())
+
+        def report_case(report, cached):
+            def case(ops):
+                if cached:
+                    # Garante o relatório no cache antes da medição.
+                    for _ in report():
+                        pass
+                for _ in range(ops):
+                    if not cached:
+                        db.render_cache.clear()
+                    for _ in report():
+                        pass
+            return case
+
+        validation_rows = [s.to_dict() for s in db.get_all_students()[:self.ops * 10]]
+
+        def validate(ops):
+            validator = StudentValidator
+            for row in validation_rows[:ops]:
+                (validator.validate_name(row['name']) and validator.validate_email(row['email'])
+                 and validator.validate_course(row['course']) and validator.validate_age(row['age']))
+
+        def validate_records(ops):
+            StudentValidator.validate_records(validation_rows[:ops])
+
+        cases = [
+            ('load', load, 1),
+            ('name_index', build_name_index, 1),
+            ('find_student_by_matricula', find_student_by_matricula, self.ops),
+            ('find_students_by_name', find_students_by_name, max(1, self.ops // 10)),
+            ('update_student', update_student, self.write_ops),
+            ('add_student', add_student, self.write_ops),
+            ('remove_student', remove_student, self.write_ops),
+            ('report_all', report_case(reports.iter_all_students_report, False), 1),
+            ('report_all_cached', report_case(reports.iter_all_students_report, True), 1),
+            ('report_course', report_case(reports.iter_course_report, False), 1),
+            ('report_course_cached', report_case(reports.iter_course_report, True), 1),
+            ('validate', validate, len(validation_rows)),
+            ('validate_records', validate_records, len(validation_rows)),
+        ]
+        results = {}
+        for name, case, ops in cases:
+            measurement = self._measure(case, ops)
+            results[name] = measurement.to_dict()
+            if self.progress:
+                self.progress(f"{size:>9} {name:<28} {measurement}")
+        os.remove(path)
+        return results
+
+    def _measure(self, case: Callable[[int], None], ops: int) -> Measurement:
+        seconds = float('inf')
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            case(ops)
+            seconds = min(seconds, time.perf_counter() - start)
+
+        peak = None
+        if self.memory:
+            tracemalloc.start()
+            try:
+                case(1)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+        return Measurement(ops, seconds, peak)
+
+
+def compare(baseline: Dict, current: Dict, tolerance: float = 0.25) -> List[Dict]:
+    """Compara duas execuções, caso a caso, em tempo por operação e pico de memória.
+
+    Cada linha traz o valor anterior, o atual, a variação relativa e se ela
+    passa de ``tolerance`` (0.25 = 25% mais lento ou maior), o que conta
+    como regressão. Só entram os casos presentes nas duas execuções.
+    """
+    rows = []
+    for size, cases in current['results'].items():
+        for name, after in cases.items():
+            before = baseline['results'].get(size, {}).get(name)
+            if before is None:
+                continue
+            for metric in ('per_op', 'peak_bytes'):
+                old, new = before.get(metric), after.get(metric)
+                if not old or new is None:
+                    continue
+                change = new / old - 1
+                rows.append({'size': int(size), 'case': name, 'metric': metric,
+                             'before': old, 'after': new, 'change': change,
+                             'regression': change > tolerance})
+    return rows
+
+
+def _format_row(row: Dict) -> str:
+    formatter = _format_seconds if row['metric'] == 'per_op' else _format_bytes
+    flag = "  REGRESSÃO" if row['regression'] else ""
+    return (f"{row['size']:>9} {row['case']:<28} {row['metric']:<10} "
+            f"{formatter(row['before']):>11} -> {formatter(row['after']):>11} "
+            f"{row['change']:+8.1%}{flag}")
+
+
+def parse_args(argv=None):
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Benchmarks do TrackStudent")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Executa os benchmarks")
+    run_parser.add_argument("--tamanhos", type=int, nargs="+", default=list(SIZES),
+                            help="Quantidades de estudantes (padrão: 1k, 10k, 100k e 1M)")
+    run_parser.add_argument("--saida", default="benchmark.json",
+                            help="Arquivo JSON com os resultados (padrão: benchmark.json)")
+    run_parser.add_argument("--operacoes", type=int, default=BenchmarkSuite.OPS,
+                            help="Operações por caso de consulta")
+    run_parser.add_argument("--escritas", type=int, default=BenchmarkSuite.WRITE_OPS,
+                            help="Operações por caso de alteração")
+    run_parser.add_argument("--repeticoes", type=int, default=BenchmarkSuite.REPEAT,
+                            help="Rodadas por caso; vale a mais rápida")
+    run_parser.add_argument("--sem-memoria", action="store_true",
+                            help="Não mede o pico de memória")
+    run_parser.add_argument("--diretorio", help="Diretório para os cadastros gerados")
+
+    compare_parser = subparsers.add_parser("compare", help="Compara duas execuções")
+    compare_parser.add_argument("base", help="Resultado de referência")
+    compare_parser.add_argument("atual", help="Resultado a comparar")
+    compare_parser.add_argument("--tolerancia", type=float, default=0.25,
+                                help="Variação aceita antes de acusar regressão (padrão: 0.25)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Executa os benchmarks ou compara duas execuções."""
+    args = parse_args(argv)
+    if args.command == "compare":
+        with open(args.base, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        with open(args.atual, 'r', encoding='utf-8') as file:
+            current = json.load(file)
+        rows = compare(baseline, current, args.tolerancia)
+        for row in rows:
+            print(_format_row(row))
+        regressions = sum(1 for row in rows if row['regression'])
+        print(f"{regressions} regressão(ões) acima de {args.tolerancia:.0%}")
+        return 1 if regressions else 0
+
+    with tempfile.TemporaryDirectory(dir=args.diretorio) as directory:
+        suite = BenchmarkSuite(directory, args.operacoes, args.escritas, args.repeticoes,
+                               not args.sem_memoria, progress=print)
+        result = suite.run(args.tamanhos)
+    with open(args.saida, 'w', encoding='utf-8') as file:
+        json.dump(result, file, indent=2)
+    print(f"Resultados gravados em {args.saida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
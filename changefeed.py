@@ -0,0 +1,183 @@
+"""
+Changefeed - Fluxo ordenado das alterações do cadastro (change data capture).
+"""
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_right
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional
+
+from locking import FileLock
+
+
+def change_from_record(record: Dict, before: Optional[Dict] = None) -> Dict:
+    """Monta o evento de uma alteração a partir do registro do journal.
+
+    ``before`` traz os valores anteriores: os campos alterados numa
+    atualização ou o estudante inteiro numa remoção.
+    """
+    op = record['op']
+    if op == 'add':
+        return {'op': op, 'matricula': record['student']['matricula'],
+                'before': None, 'after': record['student']}
+    if op == 'update':
+        return {'op': op, 'matricula': record['matricula'],
+                'before': before, 'after': record['changes']}
+    if op == 'remove':
+        return {'op': op, 'matricula': record['matricula'], 'before': before, 'after': None}
+    raise ValueError(f"Operação desconhecida: {op}")
+
+
+class ChangeFeed:
+    """Alterações do cadastro, numeradas em ordem, em um arquivo JSONL.
+
+    Cada evento traz ``seq`` (crescente, a partir de 1), ``op`` (add,
+    update ou remove), ``matricula``, os valores ``before`` e ``after`` e o
+    horário. Os eventos são anexados ao arquivo só depois que a alteração
+    foi gravada no cadastro e então entregues aos assinantes do processo;
+    outros processos acompanham o arquivo com ``tail``. Uma queda entre a
+    gravação no cadastro e a publicação perde o evento: a entrega é no
+    máximo uma vez. Um índice esparso de posições no arquivo permite
+    começar de qualquer ``seq`` sem ler o arquivo desde o início.
+
+    Os processos que publicam se revezam por uma trava em
+    ``<arquivo>.lock``; leitores não a usam e ignoram uma última linha
+    ainda incompleta.
+    """
+
+    SUFFIX = ".changes"
+    LOCK_SUFFIX = ".lock"
+    INDEX_EVERY = 1000
+
+    def __init__(self, path: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+        self.last_seq = 0
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(path + self.LOCK_SUFFIX)
+        self._subscribers: List[Callable[[Dict], None]] = []
+        # (seq, posição no arquivo) a cada INDEX_EVERY eventos, e até onde
+        # o arquivo já foi lido.
+        self._index_seqs: List[int] = []
+        self._index_offsets: List[int] = []
+        self._scanned = 0
+        self._catch_up()
+
+    def _catch_up(self, repair: bool = False):
+        """Lê eventos anexados por outros processos, atualizando seq e índice.
+
+        Uma última linha incompleta fica para a próxima leitura. Com
+        ``repair``, usado só por quem publica e sob a trava de arquivo,
+        ela é de uma gravação interrompida e é descartada do arquivo.
+        """
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == self._scanned:
+            return
+        with open(self.path, 'rb') as file:
+            file.seek(self._scanned)
+            offset = self._scanned
+            for line in file:
+                if not line.endswith(b"\n"):
+                    if repair:
+                        with open(self.path, 'r+b') as damaged:
+                            damaged.truncate(offset)
+                    break
+                seq = json.loads(line)['seq']
+                if seq % self.INDEX_EVERY == 1:
+                    self._index_seqs.append(seq)
+                    self._index_offsets.append(offset)
+                self.last_seq = seq
+                offset += len(line)
+        self._scanned = offset
+
+    def publish(self, changes: List[Dict]) -> List[Dict]:
+        """Numera, grava e entrega aos assinantes os eventos de uma gravação."""
+        if not changes:
+            return []
+        with self._lock, self._file_lock.exclusive():
+            self._catch_up(repair=True)
+            now = datetime.now().isoformat(timespec='seconds')
+            events = []
+            for change in changes:
+                self.last_seq += 1
+                events.append({'seq': self.last_seq, **change, 'time': now})
+
+            offset = self._scanned
+            lines = [json.dumps(event, ensure_ascii=False).encode('utf-8') + b"\n"
+                     for event in events]
+            with open(self.path, 'ab') as file:
+                file.write(b"".join(lines))
+                file.flush()
+                if self.fsync:
+                    os.fsync(file.fileno())
+            for event, line in zip(events, lines):
+                if event['seq'] % self.INDEX_EVERY == 1:
+                    self._index_seqs.append(event['seq'])
+                    self._index_offsets.append(offset)
+                offset += len(line)
+            self._scanned = offset
+
+            for callback in list(self._subscribers):
+                for event in events:
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        print(f"Erro no assinante do feed de alterações: {e}")
+        return events
+
+    def _start_offset(self, since: int) -> int:
+        """Posição no arquivo de onde a leitura após ``since`` pode começar."""
+        position = bisect_right(self._index_seqs, since + 1) - 1
+        return self._index_offsets[position] if position >= 0 else 0
+
+    def read(self, since: int = 0) -> Iterator[Dict]:
+        """Eventos gravados com ``seq`` maior que ``since``, em ordem."""
+        with self._lock:
+            self._catch_up()
+            start, end = self._start_offset(since), self._scanned
+        if not end:
+            return
+        with open(self.path, 'rb') as file:
+            file.seek(start)
+            while file.tell() < end:
+                event = json.loads(file.readline())
+                if event['seq'] > since:
+                    yield event
+
+    def tail(self, since: int = 0, poll_interval: float = 0.5,
+             stop: Optional[threading.Event] = None) -> Iterator[Dict]:
+        """Acompanha o arquivo como ``tail -f``: eventos após ``since`` e os que vierem.
+
+        Serve para consumidores em outros processos. Termina quando ``stop``
+        for sinalizado.
+        """
+        while stop is None or not stop.is_set():
+            for event in self.read(since):
+                since = event['seq']
+                yield event
+            if stop is not None:
+                stop.wait(poll_interval)
+            else:
+                time.sleep(poll_interval)
+
+    def subscribe(self, callback: Callable[[Dict], None],
+                  since: Optional[int] = None) -> Callable[[], None]:
+        """Entrega a ``callback`` cada evento publicado por este processo.
+
+        Com ``since``, os eventos já gravados depois dele são entregues
+        antes, sem lacunas nem repetições. Retorna a função que cancela a
+        assinatura.
+        """
+        with self._lock:
+            if since is not None:
+                for event in self.read(since):
+                    callback(event)
+            self._subscribers.append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+        return unsubscribe
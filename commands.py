@@ -0,0 +1,247 @@
+"""
+Commands - Execução não interativa de comandos (arquivo de script ou stdin).
+"""
+
+import json
+import shlex
+import time
+from datetime import date
+from typing import Dict, Iterable, Optional, TextIO
+from models import Student
+from database import DatabaseManager
+from importer import StudentImporter
+from reports import ReportManager
+from validators import StudentValidator
+
+
+class CommandError(Exception):
+    """Comando inválido ou que não pôde ser executado."""
+
+
+class BatchSummary:
+    """Resumo de uma execução: comandos, falhas e vazão."""
+
+    def __init__(self):
+        self.commands = 0
+        self.failed = 0
+        self.elapsed = 0.0
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.commands / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict:
+        return {'commands': self.commands, 'failed': self.failed,
+                'seconds': round(self.elapsed, 6),
+                'ops_per_second': round(self.ops_per_second, 1)}
+
+    def __str__(self) -> str:
+        return (f"{self.commands} comando(s), {self.failed} com erro, "
+                f"{self.elapsed:.3f}s ({self.ops_per_second:.0f} ops/s)")
+
+
+class CommandRunner:
+    """Executa comandos add, search, update, remove e report sem menu.
+
+    Cada linha é um objeto JSON (``{"cmd": "add", "name": ...}``) ou um
+    comando com argumentos ``chave=valor`` no estilo do shell
+    (``add name="Ana Souza" email=ana@gmail.com course=ADS age=20``).
+    Linhas vazias e iniciadas por ``#`` são ignoradas. Todas as
+    alterações são agrupadas em um único lote, gravado uma vez no fim.
+    """
+
+    UPDATABLE_FIELDS = {
+        'name': (StudentValidator.validate_name, "Nome inválido"),
+        'email': (StudentValidator.validate_email, "Email inválido"),
+        'course': (StudentValidator.validate_course, "Curso inválido"),
+        'age': (StudentValidator.validate_age, "Idade inválida"),
+    }
+
+    def __init__(self, db_manager: DatabaseManager, json_output: bool = False,
+                 output: Optional[TextIO] = None):
+        self.db_manager = db_manager
+        self.report_manager = ReportManager(db_manager)
+        self.importer = StudentImporter()
+        self.json_output = json_output
+        self.output = output
+        self.commands = {
+            'add': self._add,
+            'search': self._search,
+            'update': self._update,
+            'remove': self._remove,
+            'report': self._report,
+        }
+
+    @staticmethod
+    def parse(line: str) -> Dict:
+        """Converte uma linha em um dicionário com a chave ``cmd``."""
+        line = line.strip()
+        if line.startswith('{'):
+            try:
+                command = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise CommandError(f"JSON inválido: {e.msg}") from e
+            if not isinstance(command, dict) or 'cmd' not in command:
+                raise CommandError("Comando sem o campo 'cmd'")
+            if not isinstance(command['cmd'], str):
+                raise CommandError("O campo 'cmd' deve ser texto")
+            return command
+
+        try:
+            tokens = shlex.split(line)
+        except ValueError as e:
+            raise CommandError(f"Linha inválida: {e}") from e
+        command = {'cmd': tokens[0]}
+        for token in tokens[1:]:
+            key, separator, value = token.partition('=')
+            if not separator:
+                raise CommandError(f"Argumento sem '=': {token}")
+            command[key] = value
+        return command
+
+    def run(self, lines: Iterable[str]) -> BatchSummary:
+        """Executa as linhas em ordem e devolve o resumo com a vazão."""
+        summary = BatchSummary()
+        start = time.perf_counter()
+        with self.db_manager.batch():
+            for number, line in enumerate(lines, 1):
+                if not line.strip() or line.lstrip().startswith('#'):
+                    continue
+                summary.commands += 1
+                result = self.execute_line(line)
+                if not result['ok']:
+                    summary.failed += 1
+                    result['line'] = number
+                self._emit(result)
+        summary.elapsed = time.perf_counter() - start
+        return summary
+
+    def execute_line(self, line: str) -> Dict:
+        """Executa uma linha; erros viram um resultado com ``ok`` falso."""
+        try:
+            command = self.parse(line)
+        except CommandError as e:
+            return {'ok': False, 'error': str(e)}
+        return self.execute(command)
+
+    def execute(self, command: Dict) -> Dict:
+        """Executa um comando já interpretado, como devolvido por ``parse``.
+        
+        Qualquer erro vira um resultado com ``ok`` falso, sem interromper o
+        lote nem desfazer os comandos anteriores.
+        """
+        try:
+            handler = self.commands.get(command['cmd'])
+            if handler is None:
+                raise CommandError(f"Comando desconhecido: {command['cmd']}")
+            result = handler(command)
+        except CommandError as e:
+            return {'ok': False, 'error': str(e)}
+        except Exception as e:
+            return {'ok': False, 'error': f"Erro inesperado: {e}"}
+        return dict({'ok': True, 'cmd': command['cmd']}, **result)
+
+    def _emit(self, result: Dict):
+        """Escreve o resultado como linha JSON ou como texto."""
+        if self.output is None:
+            return
+        if self.json_output:
+            self.output.write(json.dumps(result, ensure_ascii=False) + "\n")
+        elif not result['ok']:
+            self.output.write(f"Linha {result['line']}: {result['error']}\n")
+        elif 'lines' in result:
+            self.report_manager.write_report(result['lines'], self.output)
+        elif 'students' in result:
+            for student in result['students']:
+                self.output.write(f"{Student.from_dict(student)}\n")
+            self.output.write(f"{len(result['students'])} estudante(s) encontrado(s)\n")
+        else:
+            self.output.write(f"{result['cmd']}: {result.get('matricula', 'ok')}\n")
+
+    @staticmethod
+    def _matricula(command: Dict) -> str:
+        matricula = str(command.get('matricula', '')).strip()
+        if not matricula:
+            raise CommandError("Informe a matrícula")
+        return matricula
+
+    def _add(self, command: Dict) -> Dict:
+        error = self.importer.validate_row(command)
+        if error:
+            raise CommandError(error)
+        if self.db_manager.is_email_taken(str(command['email'])):
+            raise CommandError("Email já cadastrado para outro estudante")
+        student = self.importer.row_to_student(command)
+        if not self.db_manager.add_student(student):
+            raise CommandError("Erro ao cadastrar estudante")
+        return {'matricula': student.matricula}
+
+    def _search(self, command: Dict) -> Dict:
+        db = self.db_manager
+        if 'matricula' in command:
+            student = db.find_student_by_matricula(str(command['matricula']))
+            students = [student] if student else []
+        elif 'email' in command:
+            student = db.find_student_by_email(str(command['email']))
+            students = [student] if student else []
+        elif 'name' in command:
+            students = db.find_students_by_name(str(command['name']), accent_insensitive=True)
+        elif 'fuzzy' in command:
+            students = db.find_students_fuzzy(str(command['fuzzy']))
+        else:
+            filters = {key: command[key] for key in
+                       ('course', 'age_min', 'age_max', 'registered_from', 'registered_to')
+                       if key in command}
+            if not filters:
+                raise CommandError("Informe matricula, email, name, fuzzy ou filtros")
+            if 'course' in filters and not isinstance(filters['course'], str):
+                raise CommandError("Curso inválido")
+            try:
+                for key in ('age_min', 'age_max'):
+                    if key in filters:
+                        filters[key] = int(filters[key])
+            except (TypeError, ValueError) as e:
+                raise CommandError("Idade inválida") from e
+            try:
+                for key in ('registered_from', 'registered_to'):
+                    if key in filters:
+                        date.fromisoformat(filters[key])
+            except (TypeError, ValueError) as e:
+                raise CommandError("Data inválida (use AAAA-MM-DD)") from e
+            students = db.find_students(**filters)
+        return {'students': [student.to_dict() for student in students]}
+
+    def _update(self, command: Dict) -> Dict:
+        matricula = self._matricula(command)
+        if not self.db_manager.find_student_by_matricula(matricula):
+            raise CommandError("Estudante não encontrado")
+
+        changes = {}
+        for field, (validate, message) in self.UPDATABLE_FIELDS.items():
+            if field in command:
+                if not validate(command[field]):
+                    raise CommandError(message)
+                changes[field] = int(command[field]) if field == 'age' else str(command[field]).strip()
+        if not changes:
+            raise CommandError("Nenhum campo para atualizar")
+        if 'email' in changes and self.db_manager.is_email_taken(changes['email'], matricula):
+            raise CommandError("Email já cadastrado para outro estudante")
+        if not self.db_manager.update_student(matricula, changes):
+            raise CommandError("Erro ao atualizar dados")
+        return {'matricula': matricula}
+
+    def _remove(self, command: Dict) -> Dict:
+        matricula = self._matricula(command)
+        if not self.db_manager.remove_student(matricula):
+            raise CommandError("Estudante não encontrado")
+        return {'matricula': matricula}
+
+    def _report(self, command: Dict) -> Dict:
+        kind = command.get('type', 'all')
+        if kind == 'all':
+            lines = self.report_manager.iter_all_students_report()
+        elif kind == 'course':
+            lines = self.report_manager.iter_course_report()
+        else:
+            raise CommandError(f"Tipo de relatório inválido: {kind}")
+        return {'lines': list(lines)}
@@ -2,77 +2,798 @@
 Database - Módulo de gerenciamento de persistência de dados.
 """
 
+import base64
+import gc
+import heapq
 import json
-import os
-from typing import List, Dict, Optional
+from contextlib import contextmanager
+from datetime import date
+from functools import wraps
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from models import Student
+from importer import ImportResult, StudentImporter
+from backends import JsonBackend, StorageBackend
+from changefeed import ChangeFeed, change_from_record
+from rendercache import RenderCache
+from locking import FileLock, ReadWriteLock
+from indexes import (
+    CourseAggregate, FuzzyNameIndex, HashIndex, RosterAggregates, SortedIndex,
+    TrigramIndex, course_key, email_key, normalize_text,
+)
+
+
+@contextmanager
+def _gc_paused():
+    """Pausa o coletor cíclico enquanto muitos objetos são criados de uma vez.
+    
+    Os estudantes carregados não formam ciclos; sem a pausa, o coletor
+    percorreria o cadastro inteiro várias vezes durante a carga.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _reading(method):
+    """Executa o método sob a trava de leitura, no modo concorrente.
+    
+    Antes de travar, o cadastro é recarregado se outro processo o alterou.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        if lock is None or lock.held():
+            return method(self, *args, **kwargs)
+        self.refresh()
+        with lock.read():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _writing(method):
+    """Executa o método sob as travas de escrita, no modo concorrente."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._lock is None:
+            return method(self, *args, **kwargs)
+        with self._exclusive():
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class DatabaseManager:
     """Gerenciador de persistência de dados dos estudantes."""
     
-    def __init__(self, filename: str = "students_data.json"):
-        """Inicializa o gerenciador de banco de dados."""
-        self.filename = filename
-        self.students: List[Student] = []
-        self._load_data()
+    LOCK_SUFFIX = ".lock"
+    PAGE_SIZE = 100
+    
+    def __init__(self, filename: str = "students_data.json", journal: bool = False,
+                 binary_snapshot: bool = False, concurrent: bool = False,
+                 backend: Optional[StorageBackend] = None, change_feed: bool = False):
+        """Inicializa o gerenciador de banco de dados.
+        
+        Com ``journal=True`` cada alteração é anexada (e sincronizada em
+        disco) ao arquivo de journal em vez de reescrever o arquivo inteiro;
+        use ``compact()`` para consolidar o journal no arquivo principal.
+        
+        Com ``binary_snapshot=True`` cada snapshot também é gravado no
+        formato binário (``<arquivo>.bin``), usado no carregamento sempre
+        que estiver tão atualizado quanto o JSON.
+        
+        Com ``concurrent=True`` o gerenciador pode ser usado por várias
+        threads e por vários processos sobre o mesmo arquivo: leituras
+        compartilham uma trava de leitores e escritor, cada alteração trava
+        o arquivo ``<arquivo>.lock`` e parte do cadastro mais recente em
+        disco, e alterações feitas por outros processos são recarregadas
+        antes da próxima consulta.
+        
+        ``backend`` substitui o arquivo JSON único (``filename`` e
+        ``binary_snapshot`` são ignorados), por exemplo por shards
+        (``ShardedJsonBackend``). Com um backend de consultas, como o
+        ``SQLiteBackend``, buscas, relatórios e alterações são repassados ao
+        banco e o cadastro não fica em memória.
+        
+        Com ``change_feed=True`` cada alteração gravada é publicada, com os
+        valores anteriores e novos, no ``ChangeFeed`` em ``change_feed``
+        (arquivo ``<arquivo>.changes``), que aceita assinantes no processo e
+        pode ser acompanhado do disco por outros processos.
+        """
+        if backend is None:
+            backend = JsonBackend(filename, binary_snapshot)
+        self.backend = backend
+        self.filename = backend.path
+        self.journal = journal
+        # Backend que responde às consultas, ou None no modo em memória.
+        self._queries = backend if backend.pushdown else None
+        # Índice primário matrícula -> estudante; a ordem de inserção do
+        # dicionário é a ordem do cadastro.
+        self._by_matricula: Dict[str, Student] = {}
+        # Índices secundários, mantidos incrementalmente a cada alteração.
+        # _rowids guarda a posição de cadastro para ordenar resultados.
+        self._rowids: Dict[str, int] = {}
+        self._next_rowid = 0
+        # Os índices de nome são os mais caros de montar; ficam como None até
+        # a primeira busca que precisar deles.
+        self._name_index: Optional[TrigramIndex] = None
+        self._fuzzy_index: Optional[FuzzyNameIndex] = None
+        self._email_index: Dict[str, str] = {}
+        # Demais donos de emails repetidos (dados antigos), em ordem de
+        # cadastro: assumem o email quando o dono indexado sai.
+        self._email_others: Dict[str, List[str]] = {}
+        self._course_index = HashIndex()
+        self._age_index = SortedIndex()
+        self._date_index = SortedIndex()
+        self._matricula_order = SortedIndex()
+        self._aggregates = RosterAggregates()
+        # Estado do lote aberto por batch(): registros pendentes, ordem
+        # original do cadastro e valores anteriores dos campos alterados.
+        self._pending: Optional[List[Dict]] = None
+        self._batch_snapshot: List[Student] = []
+        self._batch_undo: List = []
+        # Alterações ainda não gravadas no snapshot, repassadas ao backend.
+        self._changes: Optional[List[Dict]] = None
+        # Feed de alterações e os eventos do lote aberto, publicados só
+        # depois que o lote for gravado.
+        self.change_feed = ChangeFeed(self.filename + ChangeFeed.SUFFIX) if change_feed else None
+        self._feed_pending: Optional[List[Dict]] = None
+        # Versão do cadastro, avançada a cada alteração ou recarga, e o cache
+        # de textos formatados que depende dela.
+        self._version = 0
+        self._backend_version = None
+        self.render_cache = RenderCache()
+        # Travas do modo concorrente e a versão do disco já carregada.
+        self._lock = ReadWriteLock() if concurrent else None
+        self._file_lock = FileLock(self.filename + self.LOCK_SUFFIX) if concurrent else None
+        self._disk_state = None
+        if self._file_lock is not None:
+            with self._file_lock.shared():
+                self._load_data()
+                self._disk_state = self._read_disk_state()
+        else:
+            self._load_data()
+            self._disk_state = self._read_disk_state()
+    
+    @property
+    def students(self) -> List[Student]:
+        """Lista dos estudantes na ordem de cadastro."""
+        return self.get_all_students()
     
     def _load_data(self) -> bool:
-        """Carrega dados dos estudantes do arquivo JSON."""
+        """Carrega o snapshot do backend e reaplica o journal pendente."""
+        with _gc_paused():
+            return self._load_data_unchecked()
+    
+    def _load_data_unchecked(self) -> bool:
+        """Corpo de ``_load_data``, executado com a coleta de lixo pausada."""
         try:
-            if not os.path.exists(self.filename):
-                return True
-            
-            with open(self.filename, 'r', encoding='utf-8') as file:
-                data = json.load(file)
-                self.students = [Student.from_dict(student_data) for student_data in data]
-            
+            self._by_matricula = {}
+            if self._queries is None:
+                for student in self.backend.load():
+                    self._by_matricula[student.matricula] = student
+                self._replay_journal()
+            self._rebuild_indexes()
+            self.loaded = True
             return True
         except (json.JSONDecodeError, Exception) as e:
             print(f"Erro ao carregar dados: {e}")
-            self.students = []
+            self._by_matricula = {}
+            self._rebuild_indexes()
+            self.loaded = False
+            return False
+    
+    @property
+    def version(self) -> int:
+        """Versão do cadastro: muda a cada alteração, recarga ou escrita externa."""
+        if self._queries is not None:
+            backend_version = self._queries.data_version()
+            if backend_version != self._backend_version:
+                self._backend_version = backend_version
+                self._version += 1
+        elif self._lock is not None:
+            self.refresh()
+        return self._version
+    
+    def _touch(self, matricula: str):
+        """Avança a versão e descarta a linha formatada do estudante alterado."""
+        if self._queries is not None:
+            # A escrita desta conexão avança em um a versão do backend. Se ela
+            # mudou mais que isso (outra conexão gravou, lote desfeito), a
+            # versão salta e o cache inteiro é descartado.
+            current = self._queries.data_version()
+            previous = self._backend_version
+            if previous is None or current != (previous[0] + 1, previous[1]):
+                self._version += 1
+            self._backend_version = current
+        self._version += 1
+        self.render_cache.invalidate(matricula, self._version)
+    
+    def format_student(self, student: Student) -> str:
+        """``str(student)`` pelo cache de linhas formatadas."""
+        return self.format_students([student])[0]
+    
+    def format_students(self, students: Iterable[Student]) -> List[str]:
+        """Textos dos estudantes pelo cache, consultando a versão uma só vez."""
+        version = self.version
+        line = self.render_cache.student_line
+        return [line(student, version) for student in students]
+    
+    def _read_disk_state(self) -> tuple:
+        """Versão em disco do armazenamento, informada pelo backend."""
+        return self.backend.state()
+    
+    def _reload_if_changed(self) -> bool:
+        """Recarrega o cadastro se o disco mudou desde a última leitura."""
+        if self._read_disk_state() == self._disk_state:
             return False
+        self._load_data()
+        self._disk_state = self._read_disk_state()
+        return True
+    
+    def refresh(self) -> bool:
+        """Recarrega o cadastro se outro processo alterou os arquivos.
+        
+        Retorna True se houve recarga. No modo concorrente é chamado antes
+        de cada consulta.
+        """
+        if self._read_disk_state() == self._disk_state:
+            return False
+        if self._lock is None:
+            return self._reload_if_changed()
+        with self._lock.write(), self._file_lock.shared():
+            return self._reload_if_changed()
+    
+    @contextmanager
+    def _exclusive(self):
+        """Travas de escrita (threads e processos) sobre o cadastro em dia.
+        
+        Dentro do bloco nenhum outro processo altera os arquivos, então o
+        que foi recarregado na entrada continua sendo a versão mais recente.
+        """
+        if self._lock is None or self._lock.held_for_write():
+            yield
+            return
+        
+        with self._lock.write(), self._file_lock.exclusive():
+            self._reload_if_changed()
+            try:
+                yield
+            finally:
+                self._disk_state = self._read_disk_state()
+    
+    def _rebuild_indexes(self):
+        """Reconstrói todos os índices secundários a partir do índice primário.
+        
+        Os índices ordenados são carregados com uma única ordenação e os de
+        nome só serão montados na primeira busca por nome.
+        """
+        self._version += 1
+        students = self._by_matricula.values()
+        self._rowids = {matricula: rowid for rowid, matricula in enumerate(self._by_matricula)}
+        self._next_rowid = len(self._rowids)
+        self._name_index = None
+        self._fuzzy_index = None
+        # Em emails repetidos no arquivo prevalece o primeiro cadastro.
+        self._email_index = {}
+        self._email_others = {}
+        for student in students:
+            key = self._email_key(student.email)
+            if key in self._email_index:
+                self._email_others.setdefault(key, []).append(student.matricula)
+            else:
+                self._email_index[key] = student.matricula
+        course_keys: Dict[str, str] = {}
+        self._course_index.clear()
+        for student in students:
+            course_key = course_keys.get(student.course)
+            if course_key is None:
+                course_key = course_keys[student.course] = self._course_key(student.course)
+            self._course_index.add(course_key, student.matricula)
+        self._aggregates.load(students)
+        self._age_index.load((s.age, s.matricula) for s in students)
+        self._date_index.load((s.registration_date, s.matricula) for s in students)
+        self._matricula_order.load((s.matricula, s.matricula) for s in students)
+    
+    def _get_name_index(self) -> TrigramIndex:
+        """Índice de trigramas dos nomes, montado na primeira utilização."""
+        if self._name_index is None:
+            index = TrigramIndex()
+            for student in self._by_matricula.values():
+                index.add(student.matricula, normalize_text(student.name))
+            self._name_index = index
+        return self._name_index
+    
+    def _get_fuzzy_index(self) -> FuzzyNameIndex:
+        """Índice de busca aproximada, montado na primeira utilização."""
+        if self._fuzzy_index is None:
+            index = FuzzyNameIndex()
+            for student in self._by_matricula.values():
+                index.add(student.matricula, normalize_text(student.name))
+            self._fuzzy_index = index
+        return self._fuzzy_index
+    
+    def _assign_rowid(self, student: Student):
+        """Registra a posição de cadastro do estudante."""
+        self._rowids[student.matricula] = self._next_rowid
+        self._next_rowid += 1
+    
+    def _index_student(self, student: Student):
+        """Inclui o estudante nos índices secundários."""
+        if self._name_index is not None or self._fuzzy_index is not None:
+            folded_name = normalize_text(student.name)
+            if self._name_index is not None:
+                self._name_index.add(student.matricula, folded_name)
+            if self._fuzzy_index is not None:
+                self._fuzzy_index.add(student.matricula, folded_name)
+        email_key = self._email_key(student.email)
+        owner = self._email_index.setdefault(email_key, student.matricula)
+        if owner != student.matricula:
+            self._email_others.setdefault(email_key, []).append(student.matricula)
+        self._course_index.add(self._course_key(student.course), student.matricula)
+        self._age_index.add(student.age, student.matricula)
+        self._date_index.add(student.registration_date, student.matricula)
+        self._matricula_order.add(student.matricula, student.matricula)
+        self._aggregates.add(student.course, student.age, student.registration_date)
+    
+    def _unindex_student(self, student: Student):
+        """Retira o estudante dos índices secundários."""
+        if self._name_index is not None:
+            self._name_index.remove(student.matricula)
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.remove(student.matricula)
+        email_key = self._email_key(student.email)
+        others = self._email_others.get(email_key)
+        if self._email_index.get(email_key) == student.matricula:
+            if others:
+                self._email_index[email_key] = others.pop(0)
+            else:
+                del self._email_index[email_key]
+        elif others and student.matricula in others:
+            others.remove(student.matricula)
+        if others is not None and not others:
+            del self._email_others[email_key]
+        self._course_index.remove(self._course_key(student.course), student.matricula)
+        self._age_index.remove(student.age, student.matricula)
+        self._date_index.remove(student.registration_date, student.matricula)
+        self._matricula_order.remove(student.matricula, student.matricula)
+        self._aggregates.remove(student.course, student.age, student.registration_date)
+    
+    @staticmethod
+    def _email_key(email: str) -> str:
+        """Chave do índice de emails: sem espaços nas pontas e em minúsculas."""
+        return email_key(email)
+    
+    @staticmethod
+    def _course_key(course: str) -> str:
+        """Chave do índice de cursos: sem espaços nas pontas, caixa e acentos."""
+        return course_key(course)
+    
+    def _in_roster_order(self, matriculas) -> List[Student]:
+        """Estudantes das matrículas dadas, na ordem de cadastro."""
+        if len(matriculas) * 8 > len(self._by_matricula):
+            # Muitas matrículas: percorrer o cadastro sai mais barato do que
+            # ordená-las.
+            wanted = matriculas if isinstance(matriculas, (set, frozenset)) else set(matriculas)
+            return [s for m, s in self._by_matricula.items() if m in wanted]
+        return [self._by_matricula[m] for m in sorted(matriculas, key=self._rowids.get)]
+    
+    def _replay_journal(self):
+        """Reaplica as operações registradas pelo backend após o snapshot."""
+        for record in self.backend.replay():
+            self._apply_record(record)
+    
+    def _apply_record(self, record: Dict):
+        """Aplica em memória uma operação registrada no journal."""
+        op = record['op']
+        if op == 'add':
+            student = Student.from_dict(record['student'])
+            self._by_matricula.setdefault(student.matricula, student)
+        elif op == 'update':
+            student = self._by_matricula.get(record['matricula'])
+            if student:
+                for field, value in record['changes'].items():
+                    setattr(student, field, value)
+        elif op == 'remove':
+            self._by_matricula.pop(record['matricula'], None)
+        else:
+            raise ValueError(f"Operação desconhecida no journal: {op}")
     
     def _save_data(self) -> bool:
-        """Salva dados dos estudantes no arquivo JSON."""
+        """Grava o cadastro inteiro pelo backend (de forma atômica no JSON)."""
+        changes, self._changes = self._changes, None
         try:
-            data = [student.to_dict() for student in self.students]
-            
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump(data, file, ensure_ascii=False, indent=2)
-            
+            self.backend.save(self._by_matricula.values(), changes)
             return True
         except Exception as e:
             print(f"Erro ao salvar dados: {e}")
             return False
     
+    def _append_journal(self, records: List[Dict]) -> bool:
+        """Anexa registros ao journal e força a gravação em disco."""
+        try:
+            self.backend.append(records)
+            return True
+        except Exception as e:
+            print(f"Erro ao gravar journal: {e}")
+            return False
+    
+    def _commit(self, record: Dict, before: Optional[Dict] = None) -> bool:
+        """Persiste uma alteração já aplicada em memória.
+        
+        ``before`` traz os valores anteriores, para o feed de alterações.
+        """
+        if self._pending is not None:
+            self._pending.append(record)
+            self._publish(record, before)
+            return True
+        if self.journal:
+            committed = self._append_journal([record])
+        else:
+            self._changes = [record]
+            committed = self._save_data()
+        if committed:
+            self._publish(record, before)
+        return committed
+    
+    def _publish(self, record: Dict, before: Optional[Dict] = None):
+        """Publica a alteração no feed; dentro de um lote, só quando ele for gravado."""
+        if self.change_feed is None:
+            return
+        change = change_from_record(record, before)
+        if self._feed_pending is not None:
+            self._feed_pending.append(change)
+            return
+        try:
+            self.change_feed.publish([change])
+        except OSError as e:
+            print(f"Erro ao gravar feed de alterações: {e}")
+    
+    def _flush_feed(self):
+        """Publica os eventos acumulados pelo lote já gravado."""
+        changes, self._feed_pending = self._feed_pending, None
+        if changes:
+            try:
+                self.change_feed.publish(changes)
+            except OSError as e:
+                print(f"Erro ao gravar feed de alterações: {e}")
+    
+    @contextmanager
+    def batch(self):
+        """Agrupa alterações em uma única gravação (group commit).
+        
+        Dentro do bloco as operações só alteram a memória; na saída é feita
+        uma única escrita durável. Se o bloco levantar exceção, o estado em
+        memória volta ao que era antes do bloco. Lotes aninhados são
+        incorporados ao lote externo. No modo concorrente o lote inteiro
+        ocorre sob as travas de escrita.
+        """
+        with self._exclusive(), self._batch():
+            yield self
+    
+    @contextmanager
+    def _batch(self):
+        """Corpo de ``batch``, executado sob as travas de escrita."""
+        if self._queries is not None:
+            # No banco, o lote é uma transação.
+            outermost = self.change_feed is not None and self._feed_pending is None
+            if outermost:
+                self._feed_pending = []
+            try:
+                with self._queries.transaction():
+                    yield self
+            except BaseException:
+                if outermost:
+                    self._feed_pending = None
+                raise
+            if outermost:
+                self._flush_feed()
+            return
+        
+        if self._pending is not None:
+            yield self
+            return
+        
+        self.begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self.end_batch(commit=False)
+            raise
+        
+        if not self.end_batch():
+            self.end_batch(commit=False)
+            raise IOError("Erro ao gravar lote de alterações")
+    
+    def begin_batch(self):
+        """Abre um lote sem o bloco ``with`` de ``batch()``.
+        
+        Permite aplicar as alterações em um momento e gravá-las em outro,
+        por exemplo em outra thread, como faz o servidor assíncrono. Não
+        toma travas nem vale para backends de consultas; feche o lote com
+        ``end_batch``.
+        """
+        if self._queries is not None:
+            raise RuntimeError("Lotes manuais não são suportados por este backend")
+        if self._pending is not None:
+            raise RuntimeError("Já existe um lote aberto")
+        self._pending = []
+        self._batch_snapshot = list(self._by_matricula.values())
+        self._batch_undo = []
+        if self.change_feed is not None:
+            self._feed_pending = []
+    
+    def end_batch(self, commit: bool = True) -> bool:
+        """Fecha o lote aberto por ``begin_batch``.
+        
+        Com ``commit=True`` as alterações são gravadas em uma única escrita;
+        com ``commit=False`` são desfeitas em memória. Se a gravação falhar,
+        retorna False e as alterações continuam em memória até serem
+        desfeitas com ``end_batch(commit=False)``.
+        """
+        if not commit:
+            self._rollback_batch()
+            return True
+        records = self._pending
+        if records and not self._flush_batch(records):
+            return False
+        if self.change_feed is not None:
+            self._flush_feed()
+        self._end_batch()
+        return True
+    
+    def _flush_batch(self, records: List[Dict]) -> bool:
+        """Grava de uma só vez os registros acumulados no lote."""
+        self._pending = None
+        if self.journal:
+            return self._append_journal(records)
+        self._changes = records
+        return self._save_data()
+    
+    def _rollback_batch(self):
+        """Desfaz em memória as alterações feitas dentro do lote."""
+        for student, old_values in reversed(self._batch_undo):
+            for field, value in old_values.items():
+                setattr(student, field, value)
+        self._by_matricula = {s.matricula: s for s in self._batch_snapshot}
+        self._rebuild_indexes()
+        self._end_batch()
+    
+    def _end_batch(self):
+        """Limpa o estado do lote."""
+        self._pending = None
+        self._feed_pending = None
+        self._batch_snapshot = []
+        self._batch_undo = []
+    
+    @_writing
+    def import_students(self, path: str,
+                        chunk_size: int = StudentImporter.CHUNK_SIZE,
+                        commit_size: int = 50000) -> ImportResult:
+        """Importa estudantes de um arquivo CSV ou JSONL em modo streaming.
+        
+        O arquivo é lido em blocos de ``chunk_size`` linhas, cada registro é
+        validado e os aceitos são gravados em lotes de até ``commit_size``
+        estudantes. Linhas rejeitadas são contadas e as primeiras são
+        informadas com seu número (ver ``ImportResult``).
+        """
+        importer = StudentImporter()
+        result = ImportResult()
+        chunks = importer.iter_chunks(path, chunk_size)
+        
+        more = True
+        while more:
+            more = False
+            with self.batch():
+                in_batch = 0
+                for chunk in chunks:
+                    in_batch += self._import_chunk(importer, chunk, result)
+                    if in_batch >= commit_size:
+                        more = True
+                        break
+        
+        return result
+    
+    def _import_chunk(self, importer: StudentImporter, chunk: List,
+                      result: ImportResult) -> int:
+        """Valida e adiciona um bloco de registros; retorna quantos entraram."""
+        valid = []
+        errors = importer.validate_rows([row for _, row in chunk])
+        for (line_number, row), error in zip(chunk, errors):
+            if error:
+                result.reject(line_number, error)
+            else:
+                valid.append((line_number, row))
+        
+        # Cada aceito entra no índice de emails na hora, então uma consulta
+        # ao índice cobre tanto o cadastro quanto as linhas já importadas.
+        accepted = 0
+        for line_number, row in valid:
+            if self.is_email_taken(str(row['email'])):
+                result.reject(line_number, "Email duplicado")
+            elif not self.add_student(importer.row_to_student(row)):
+                result.reject(line_number, "Matrícula duplicada")
+            else:
+                accepted += 1
+        
+        result.accepted += accepted
+        return accepted
+    
+    @_writing
+    def compact(self) -> bool:
+        """Consolida o journal em um novo snapshot do arquivo principal."""
+        if self._queries is not None:
+            return self._queries.compact()
+        return self._save_data()
+    
+    @_writing
     def add_student(self, student: Student) -> bool:
         """Adiciona um novo estudante ao banco de dados."""
         if not isinstance(student, Student):
             return False
         
-        if any(s.matricula == student.matricula for s in self.students):
+        if self._queries is not None:
+            record = {'op': 'add', 'student': student.to_dict()}
+            if not self._queries.add(student):
+                return False
+            self._touch(student.matricula)
+            self._publish(record)
+            return True
+        
+        if student.matricula in self._by_matricula:
             return False
         
-        self.students.append(student)
-        return self._save_data()
+        if self._email_key(student.email) in self._email_index:
+            return False
+        
+        self._by_matricula[student.matricula] = student
+        self._assign_rowid(student)
+        self._index_student(student)
+        self._touch(student.matricula)
+        return self._commit({'op': 'add', 'student': student.to_dict()})
     
+    @_reading
     def find_student_by_matricula(self, matricula: str) -> Optional[Student]:
         """Busca um estudante pela matrícula."""
         if not matricula:
             return None
         
-        matricula_clean = matricula.strip()
-        return next((s for s in self.students if s.matricula == matricula_clean), None)
+        if self._queries is not None:
+            return self._queries.find_by_matricula(matricula.strip())
+        return self._by_matricula.get(matricula.strip())
+    
+    @_reading
+    def find_student_by_email(self, email: str) -> Optional[Student]:
+        """Busca um estudante pelo email (sem diferenciar maiúsculas)."""
+        if not email:
+            return None
+        
+        if self._queries is not None:
+            return self._queries.find_by_email(self._email_key(email))
+        matricula = self._email_index.get(self._email_key(email))
+        return self._by_matricula.get(matricula) if matricula else None
+    
+    @_reading
+    def is_email_taken(self, email: str, exclude_matricula: Optional[str] = None) -> bool:
+        """Indica se o email já pertence a outro estudante."""
+        if self._queries is not None:
+            owner = self._queries.email_owner(self._email_key(email))
+        else:
+            owner = self._email_index.get(self._email_key(email))
+        return owner is not None and owner != exclude_matricula
     
-    def find_students_by_name(self, name: str) -> List[Student]:
-        """Busca estudantes pelo nome (busca parcial, case-insensitive)."""
+    @_reading
+    def find_students_by_name(self, name: str,
+                              accent_insensitive: bool = False) -> List[Student]:
+        """Busca estudantes pelo nome (busca parcial, case-insensitive).
+        
+        Com ``accent_insensitive=True`` os acentos são ignorados, de modo
+        que "joao" encontra "João". Consultas com três ou mais caracteres
+        verificam apenas os candidatos do índice de trigramas.
+        """
         if not name:
             return []
         
         name_lower = name.strip().lower()
-        return [s for s in self.students if name_lower in s.name.lower()]
+        folded = normalize_text(name_lower)
+        if self._queries is not None:
+            matches = self._queries.find_by_name(folded)
+            if accent_insensitive:
+                return matches
+            return [s for s in matches if name_lower in s.name.lower()]
+        
+        name_index = self._get_name_index()
+        candidates = name_index.candidates(folded)
+        if candidates is None:
+            pool = self._by_matricula.values()
+        else:
+            pool = self._in_roster_order(candidates)
+        
+        if accent_insensitive:
+            return [s for s in pool if folded in name_index.text(s.matricula)]
+        return [s for s in pool if name_lower in s.name.lower()]
     
+    @_reading
+    def find_students_fuzzy(self, name: str, max_distance: int = 2,
+                            limit: int = 10) -> List[Student]:
+        """Busca aproximada pelo nome, tolerante a erros de digitação.
+        
+        Cada palavra da consulta é comparada (sem acentos) com as palavras
+        do nome; a soma das distâncias de edição não pode passar de
+        ``max_distance``. Retorna até ``limit`` estudantes, dos mais
+        próximos para os mais distantes.
+        """
+        if not name or not name.strip():
+            return []
+        
+        if self._queries is not None:
+            return self._queries.find_fuzzy(normalize_text(name.strip()), max_distance, limit)
+        
+        costs = self._get_fuzzy_index().search(normalize_text(name.strip()), max_distance)
+        ranked = heapq.nsmallest(limit, costs, key=lambda m: (costs[m], self._rowids[m]))
+        return [self._by_matricula[m] for m in ranked]
+    
+    @_reading
+    def find_students(self, course: Optional[str] = None,
+                      age_min: Optional[int] = None, age_max: Optional[int] = None,
+                      registered_from: Union[date, str, None] = None,
+                      registered_to: Union[date, str, None] = None) -> List[Student]:
+        """Busca estudantes combinando filtros (todos opcionais e cumulativos).
+        
+        O curso é comparado sem diferenciar caixa e acentos; idade e data de
+        cadastro são intervalos inclusivos. O filtro mais seletivo, estimado
+        pelos índices, gera os candidatos e os demais são conferidos só
+        sobre eles. O resultado segue a ordem de cadastro.
+        """
+        date_from = self._date_key(registered_from)
+        date_to = self._date_key(registered_to)
+        course_key = self._course_key(course) if course is not None else None
+        if self._queries is not None:
+            return self._queries.find(course_key, age_min, age_max, date_from, date_to)
+        
+        filters = []
+        if course_key is not None:
+            matches = self._course_index.get(course_key)
+            filters.append((len(matches), lambda: matches,
+                            lambda s: self._course_key(s.course) == course_key))
+        if age_min is not None or age_max is not None:
+            filters.append((self._age_index.count_range(age_min, age_max),
+                            lambda: self._age_index.range(age_min, age_max),
+                            lambda s: ((age_min is None or s.age >= age_min)
+                                       and (age_max is None or s.age <= age_max))))
+        if date_from is not None or date_to is not None:
+            filters.append((self._date_index.count_range(date_from, date_to),
+                            lambda: self._date_index.range(date_from, date_to),
+                            lambda s: ((date_from is None or s.registration_date >= date_from)
+                                       and (date_to is None or s.registration_date <= date_to))))
+        
+        if not filters:
+            return self.get_all_students()
+        
+        filters.sort(key=lambda f: f[0])
+        _, candidates, _ = filters[0]
+        checks = [check for _, _, check in filters[1:]]
+        
+        result = []
+        for matricula in candidates():
+            student = self._by_matricula[matricula]
+            if all(check(student) for check in checks):
+                result.append(student)
+        
+        if len(result) > 1:
+            result = self._in_roster_order([s.matricula for s in result])
+        return result
+    
+    @staticmethod
+    def _date_key(value: Union[date, str, None]) -> Optional[str]:
+        """Converte datas para o formato AAAA-MM-DD usado no cadastro."""
+        if value is None or isinstance(value, str):
+            return value
+        return value.strftime("%Y-%m-%d")
+    
+    @_writing
     def update_student(self, matricula: str, updated_data: Dict) -> bool:
         """Atualiza dados de um estudante existente."""
         student = self.find_student_by_matricula(matricula)
@@ -80,26 +801,151 @@ class DatabaseManager:
             return False
         
         valid_fields = ['name', 'email', 'course', 'age']
+        changes = {field: value for field, value in updated_data.items()
+                   if field in valid_fields}
+        if 'age' in changes:
+            # Convertida antes de mexer nos índices: a idade é chave ordenada.
+            try:
+                changes['age'] = int(changes['age'])
+            except (TypeError, ValueError):
+                print(f"Erro ao atualizar dados: idade inválida ({changes['age']!r})")
+                return False
         
-        for field, value in updated_data.items():
-            if field in valid_fields:
-                setattr(student, field, value)
+        if 'email' in changes and self.is_email_taken(changes['email'], student.matricula):
+            return False
         
-        return self._save_data()
+        before = {field: getattr(student, field) for field in changes}
+        record = {'op': 'update', 'matricula': student.matricula, 'changes': changes}
+        if self._queries is not None:
+            if not self._queries.update(student.matricula, changes):
+                return False
+            self._touch(student.matricula)
+            self._publish(record, before)
+            return True
+        
+        if self._pending is not None:
+            self._batch_undo.append((student, before))
+        
+        self._unindex_student(student)
+        for field, value in changes.items():
+            setattr(student, field, value)
+        self._index_student(student)
+        self._touch(student.matricula)
+        
+        return self._commit(record, before)
     
+    @_writing
     def remove_student(self, matricula: str) -> bool:
         """Remove um estudante do banco de dados."""
         student = self.find_student_by_matricula(matricula)
         if not student:
             return False
         
-        self.students.remove(student)
-        return self._save_data()
+        record = {'op': 'remove', 'matricula': student.matricula}
+        if self._queries is not None:
+            if not self._queries.remove(student.matricula):
+                return False
+            self._touch(student.matricula)
+            self._publish(record, student.to_dict())
+            return True
+        
+        self._unindex_student(student)
+        del self._by_matricula[student.matricula]
+        del self._rowids[student.matricula]
+        self._touch(student.matricula)
+        return self._commit(record, student.to_dict())
+    
+    def _ordering(self, order_by: str) -> SortedIndex:
+        """Índice ordenado usado para paginar pela ordenação pedida."""
+        orderings = {
+            'matricula': self._matricula_order,
+            'registration_date': self._date_index,
+        }
+        if order_by not in orderings:
+            raise ValueError(f"Ordenação inválida: {order_by}")
+        return orderings[order_by]
+    
+    @_reading
+    def get_students_page(self, order_by: str = 'matricula', page_size: int = PAGE_SIZE,
+                          token: Optional[str] = None,
+                          offset: int = 0) -> Tuple[List[Student], Optional[str]]:
+        """Retorna uma página de estudantes e o token da próxima página.
+        
+        A ordenação é por matrícula ou por data de cadastro (desempatada
+        pela matrícula). O token identifica o último estudante entregue, de
+        modo que alterações no cadastro entre uma página e outra não geram
+        repetições nem saltos. Sem token, a página começa em ``offset``.
+        O token é ``None`` quando não há mais páginas.
+        """
+        index = self._ordering(order_by)
+        after = self._decode_token(token, order_by) if token else None
+        if self._queries is not None:
+            students = self._queries.page(order_by, page_size + 1, after, offset)
+            items = [(getattr(s, order_by), s.matricula) for s in students]
+        else:
+            items = index.page(page_size + 1, after, offset)
+            students = [self._by_matricula[key] for _, key in items]
+        
+        has_more = len(items) > page_size
+        items = items[:page_size]
+        students = students[:page_size]
+        next_token = self._encode_token(order_by, items[-1]) if has_more else None
+        return students, next_token
     
+    def iter_students(self, order_by: str = 'matricula', page_size: int = PAGE_SIZE,
+                      offset: int = 0) -> Iterator[Student]:
+        """Percorre os estudantes página a página, sem copiar o cadastro."""
+        students, token = self.get_students_page(order_by, page_size, offset=offset)
+        while True:
+            yield from students
+            if token is None:
+                return
+            students, token = self.get_students_page(order_by, page_size, token)
+    
+    @staticmethod
+    def _encode_token(order_by: str, item: tuple) -> str:
+        """Codifica a posição de continuação de uma página."""
+        raw = json.dumps([order_by, item[0], item[1]], ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+    
+    @staticmethod
+    def _decode_token(token: str, order_by: str) -> tuple:
+        """Decodifica um token gerado por ``_encode_token``."""
+        try:
+            token_order, value, key = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Token de página inválido: {token}") from e
+        if token_order != order_by:
+            raise ValueError("Token de página gerado para outra ordenação")
+        return value, key
+    
+    @_reading
     def get_all_students(self) -> List[Student]:
-        """Retorna uma cópia da lista de todos os estudantes."""
-        return self.students.copy()
+        """Retorna uma cópia da lista de todos os estudantes.
+        
+        Para cadastros grandes prefira ``iter_students``/``get_students_page``.
+        """
+        if self._queries is not None:
+            return self._queries.load()
+        return list(self._by_matricula.values())
     
+    @_reading
     def get_students_count(self) -> int:
         """Retorna o número total de estudantes cadastrados."""
-        return len(self.students)
\ No newline at end of file
+        if self._queries is not None:
+            return self._queries.count()
+        return len(self._by_matricula)
+    
+    @_reading
+    def get_course_stats(self) -> Dict[str, CourseAggregate]:
+        """Retorna os agregados por curso (quantidade e idades), em O(cursos)."""
+        if self._queries is not None:
+            return self._queries.course_stats()
+        return dict(self._aggregates.courses())
+    
+    @_reading
+    def get_registrations_per_day(self) -> Dict[str, int]:
+        """Retorna a quantidade de cadastros por dia (AAAA-MM-DD)."""
+        if self._queries is not None:
+            return self._queries.registrations_per_day()
+        return self._aggregates.registrations_per_day()
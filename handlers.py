@@ -21,6 +21,7 @@ class MenuHandler:
             "3. Atualizar Dados",
             "4. Remover Estudante",
             "5. Gerar Relatórios",
+            "6. Métricas de Desempenho",
             "0. Sair",
             "="*50
         ]
@@ -145,6 +146,10 @@ class StudentUpdateHandler:
 class SearchHandler:
     """Classe responsável por operações de busca de estudantes."""
     
+    FUZZY_MAX_DISTANCE = 2
+    FUZZY_LIMIT = 10
+    PAGE_SIZE = 20
+    
     def __init__(self, db_manager):
         self.db_manager = db_manager
     
@@ -153,6 +158,8 @@ class SearchHandler:
         print("\n=== BUSCAR ESTUDANTE ===")
         print("1. Buscar por matrícula")
         print("2. Buscar por nome")
+        print("3. Busca aproximada por nome (tolera erros de digitação)")
+        print("4. Listar todos (paginado)")
         
         choice = input("Escolha o tipo de busca: ").strip()
         
@@ -160,6 +167,10 @@ class SearchHandler:
             self._search_by_matricula()
         elif choice == '2':
             self._search_by_name()
+        elif choice == '3':
+            self._search_fuzzy()
+        elif choice == '4':
+            self._list_students()
         else:
             print("Opção inválida!")
     
@@ -169,18 +180,60 @@ class SearchHandler:
         student = self.db_manager.find_student_by_matricula(matricula)
         
         if student:
-            print(f"\nEstudante encontrado:\n{student}")
+            print(f"\nEstudante encontrado:\n{self.db_manager.format_student(student)}")
         else:
             print("Estudante não encontrado!")
     
     def _search_by_name(self):
         """Realiza busca por nome."""
         name = input("Digite o nome (ou parte dele): ").strip()
-        students = self.db_manager.find_students_by_name(name)
+        students = self.db_manager.find_students_by_name(name, accent_insensitive=True)
         
         if students:
             print(f"\n{len(students)} estudante(s) encontrado(s):")
-            for i, student in enumerate(students, 1):
-                print(f"{i}. {student}")
+            for i, line in enumerate(self.db_manager.format_students(students), 1):
+                print(f"{i}. {line}")
+        else:
+            print("Nenhum estudante encontrado!")
+    
+    def _search_fuzzy(self):
+        """Realiza busca aproximada por nome."""
+        name = input("Digite o nome (mesmo com erros): ").strip()
+        max_distance = self._read_int("Máximo de erros", self.FUZZY_MAX_DISTANCE)
+        limit = self._read_int("Máximo de resultados", self.FUZZY_LIMIT)
+        
+        students = self.db_manager.find_students_fuzzy(name, max_distance, limit)
+        
+        if students:
+            print(f"\n{len(students)} estudante(s) mais próximo(s):")
+            for i, line in enumerate(self.db_manager.format_students(students), 1):
+                print(f"{i}. {line}")
         else:
-            print("Nenhum estudante encontrado!")
\ No newline at end of file
+            print("Nenhum estudante encontrado!")
+    
+    def _list_students(self):
+        """Lista os estudantes página a página, por matrícula ou data."""
+        order = input("Ordenar por (1) matrícula ou (2) data de cadastro [1]: ").strip()
+        order_by = 'registration_date' if order == '2' else 'matricula'
+        
+        position, token = 0, None
+        while True:
+            students, token = self.db_manager.get_students_page(order_by, self.PAGE_SIZE, token)
+            if not students and position == 0:
+                print("Nenhum estudante cadastrado.")
+                return
+            
+            for i, line in enumerate(self.db_manager.format_students(students), position + 1):
+                print(f"{i}. {line}")
+            position += len(students)
+            
+            if token is None:
+                return
+            if input("\nEnter para a próxima página, 'q' para sair: ").strip().lower() == 'q':
+                return
+    
+    @staticmethod
+    def _read_int(label, default):
+        """Lê um inteiro não negativo, usando o padrão se vazio ou inválido."""
+        value = input(f"{label} [{default}]: ").strip()
+        return int(value) if value.isdigit() else default
@@ -0,0 +1,136 @@
+"""
+Importer - Importação em lote de estudantes a partir de arquivos CSV ou JSONL.
+"""
+
+import csv
+import json
+import os
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from models import Student
+from validators import StudentValidator
+
+
+class ImportResult:
+    """Resumo de uma importação: quantidade aceita e linhas rejeitadas.
+
+    Todas as rejeições são contadas em ``rejected_count``, mas só as
+    primeiras ``max_rejected`` ficam em ``rejected`` (linha, motivo), para
+    que a memória não cresça com o tamanho de um arquivo cheio de erros.
+    """
+
+    MAX_REJECTED = 1000
+
+    def __init__(self, max_rejected: Optional[int] = None):
+        self.accepted = 0
+        self.max_rejected = self.MAX_REJECTED if max_rejected is None else max_rejected
+        self.rejected: List[Tuple[int, str]] = []
+        self.rejected_count = 0
+
+    def reject(self, line: int, message: str):
+        """Registra uma linha rejeitada com o motivo."""
+        self.rejected_count += 1
+        if len(self.rejected) < self.max_rejected:
+            self.rejected.append((line, message))
+
+    def __str__(self) -> str:
+        return (f"{self.accepted} estudante(s) importado(s), "
+                f"{self.rejected_count} linha(s) rejeitada(s)")
+
+
+class StudentImporter:
+    """Lê arquivos de estudantes em blocos e valida cada registro."""
+
+    CHUNK_SIZE = 1000
+    FIELDS = ('name', 'email', 'course', 'age')
+    ERROR_MESSAGES = {
+        'name': "Nome inválido",
+        'email': "Email inválido",
+        'course': "Curso inválido",
+        'age': "Idade inválida",
+    }
+
+    def __init__(self, validator: StudentValidator = StudentValidator):
+        self.validator = validator
+
+    def iter_rows(self, path: str) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """Percorre o arquivo devolvendo (número da linha, registro).
+
+        O formato é escolhido pela extensão (.csv ou .jsonl/.ndjson). Linhas
+        JSON malformadas são devolvidas com registro ``None``.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.csv':
+            return self._iter_csv(path)
+        if extension in ('.jsonl', '.ndjson'):
+            return self._iter_jsonl(path)
+        raise ValueError(f"Formato de arquivo não suportado: {extension}")
+
+    @staticmethod
+    def _iter_csv(path: str) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """Lê um CSV com cabeçalho, linha a linha."""
+        with open(path, 'r', encoding='utf-8', newline='') as file:
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield reader.line_num, row
+
+    @staticmethod
+    def _iter_jsonl(path: str) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """Lê um arquivo com um objeto JSON por linha."""
+        with open(path, 'r', encoding='utf-8') as file:
+            for line_number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    row = None
+                yield line_number, row if isinstance(row, dict) else None
+
+    def iter_chunks(self, path: str, chunk_size: int = CHUNK_SIZE):
+        """Agrupa as linhas do arquivo em blocos de tamanho fixo."""
+        rows = self.iter_rows(path)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def validate_row(self, row: Optional[Dict]) -> Optional[str]:
+        """Retorna a mensagem de erro do registro, ou None se for válido."""
+        return self.validate_rows([row])[0]
+
+    def validate_rows(self, rows: Sequence[Optional[Dict]]) -> List[Optional[str]]:
+        """Mensagem de erro de cada registro (None se válido), validando o bloco de uma vez."""
+        messages: List[Optional[str]] = [None] * len(rows)
+        complete = []
+        for i, row in enumerate(rows):
+            if row is None:
+                messages[i] = "Registro malformado"
+                continue
+            missing = [field for field in self.FIELDS if row.get(field) in (None, '')]
+            if missing:
+                messages[i] = f"Campo(s) ausente(s): {', '.join(missing)}"
+                continue
+            complete.append(i)
+
+        columns = {field: [str(rows[i][field]) for i in complete]
+                   for field in ('name', 'email', 'course')}
+        columns['age'] = [rows[i]['age'] for i in complete]
+        mask = self.validator.validate_columns(columns)
+        for position, i in enumerate(complete):
+            if mask.rows[position]:
+                messages[i] = "; ".join(self.ERROR_MESSAGES[field]
+                                        for field in mask.invalid_fields(position))
+        return messages
+
+    @staticmethod
+    def row_to_student(row: Dict) -> Student:
+        """Cria o estudante a partir de um registro já validado."""
+        student = Student(str(row['name']).strip(), str(row['email']).strip(),
+                          str(row['course']).strip(), int(row['age']))
+        if row.get('matricula'):
+            student.matricula = str(row['matricula']).strip()
+        if row.get('registration_date'):
+            student.registration_date = str(row['registration_date']).strip()
+        return student
@@ -0,0 +1,457 @@
+"""
+Indexes - Estruturas de índice em memória usadas pelo DatabaseManager.
+"""
+
+import unicodedata
+from collections import Counter
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, List, Optional, Set
+
+
+def normalize_text(text: str, fold_accents: bool = True) -> str:
+    """Converte para minúsculas e, opcionalmente, remove acentos."""
+    lowered = text.lower()
+    if not fold_accents:
+        return lowered
+    decomposed = unicodedata.normalize('NFKD', lowered)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def email_key(email: str) -> str:
+    """Chave de email: sem espaços nas pontas e em minúsculas."""
+    return email.strip().lower()
+
+
+def course_key(course: str) -> str:
+    """Chave de curso: sem espaços nas pontas, caixa e acentos."""
+    return normalize_text(course.strip())
+
+
+class _MaxKey:
+    """Sentinela que compara como maior que qualquer chave."""
+
+    def __lt__(self, other):
+        return False
+
+    def __gt__(self, other):
+        return True
+
+
+_MAX_KEY = _MaxKey()
+
+
+class HashIndex:
+    """Índice de igualdade: valor -> conjunto de chaves."""
+
+    def __init__(self):
+        self._buckets: Dict[Any, Set[str]] = {}
+
+    def add(self, value, key: str):
+        """Associa a chave ao valor."""
+        self._buckets.setdefault(value, set()).add(key)
+
+    def remove(self, value, key: str):
+        """Desassocia a chave do valor."""
+        keys = self._buckets.get(value)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._buckets[value]
+
+    def get(self, value) -> Set[str]:
+        """Chaves associadas ao valor (não modifique o conjunto retornado)."""
+        return self._buckets.get(value, set())
+
+    def clear(self):
+        """Remove todas as chaves."""
+        self._buckets.clear()
+
+
+class SortedIndex:
+    """Índice ordenado de pares (valor, chave) para consultas por intervalo.
+
+    A lista é mantida ordenada com bisect; inclusão e remoção localizam a
+    posição em O(log n).
+    """
+
+    def __init__(self):
+        self._items: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def load(self, pairs):
+        """Substitui o conteúdo pelos pares dados, ordenando uma única vez."""
+        self._items = sorted(pairs)
+
+    def add(self, value, key: str):
+        """Inclui o par (valor, chave)."""
+        insort(self._items, (value, key))
+
+    def remove(self, value, key: str):
+        """Remove o par (valor, chave), se existir."""
+        position = bisect_left(self._items, (value, key))
+        if position < len(self._items) and self._items[position] == (value, key):
+            del self._items[position]
+
+    def _bounds(self, low=None, high=None):
+        """Posições [início, fim) dos valores entre low e high (inclusive)."""
+        start = 0 if low is None else bisect_left(self._items, (low,))
+        end = len(self._items) if high is None else bisect_right(self._items, (high, _MAX_KEY))
+        return start, max(start, end)
+
+    def count_range(self, low=None, high=None) -> int:
+        """Quantidade de chaves com valor no intervalo."""
+        start, end = self._bounds(low, high)
+        return end - start
+
+    def range(self, low=None, high=None) -> List[str]:
+        """Chaves com valor no intervalo, em ordem crescente de valor."""
+        start, end = self._bounds(low, high)
+        return [key for _, key in self._items[start:end]]
+
+    def page(self, count: int, after: Optional[tuple] = None, offset: int = 0) -> List[tuple]:
+        """Até ``count`` pares (valor, chave) após o par ``after``.
+
+        Sem ``after``, começa na posição ``offset``. Como a posição é
+        recalculada a partir do último par visto, inclusões e remoções entre
+        páginas não causam repetições nem saltos.
+        """
+        start = offset if after is None else bisect_right(self._items, after)
+        return self._items[start:start + count]
+
+    def clear(self):
+        """Remove todas as chaves."""
+        self._items.clear()
+
+
+class TrigramIndex:
+    """Índice invertido de trigramas para busca por substring.
+
+    Cada chave (matrícula) é indexada pelos trigramas do seu texto já
+    normalizado. Uma consulta com pelo menos três caracteres devolve apenas
+    as chaves que contêm todos os trigramas da consulta, um superconjunto
+    exato dos textos que contêm a consulta como substring.
+    """
+
+    N = 3
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._texts: Dict[str, str] = {}
+
+    @classmethod
+    def _grams(cls, text: str) -> Set[str]:
+        """Retorna o conjunto de n-gramas do texto."""
+        return {text[i:i + cls.N] for i in range(len(text) - cls.N + 1)}
+
+    def add(self, key: str, text: str):
+        """Indexa o texto associado à chave."""
+        self._texts[key] = text
+        for gram in self._grams(text):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: str):
+        """Remove a chave do índice."""
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        for gram in self._grams(text):
+            keys = self._postings.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._postings[gram]
+
+    def text(self, key: str) -> Optional[str]:
+        """Retorna o texto normalizado indexado para a chave."""
+        return self._texts.get(key)
+
+    def candidates(self, query: str) -> Optional[Set[str]]:
+        """Chaves que podem conter a consulta, ou None se ela for curta demais."""
+        grams = self._grams(query)
+        if not grams:
+            return None
+
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        result = set(postings[0])
+        for keys in postings[1:]:
+            if not result:
+                break
+            result &= keys
+        return result
+
+    def clear(self):
+        """Remove todas as chaves."""
+        self._postings.clear()
+        self._texts.clear()
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Distância de edição (inserção, remoção e substituição) entre a e b."""
+    if a == b:
+        return 0
+    # Prefixo e sufixo comuns não alteram a distância.
+    start = 0
+    limit = min(len(a), len(b))
+    while start < limit and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        left = i
+        for j, char_b in enumerate(b):
+            cost = previous[j] if char_a == char_b else previous[j] + 1
+            above = previous[j + 1] + 1
+            left = left + 1
+            if above < left:
+                left = above
+            if cost < left:
+                left = cost
+            current.append(left)
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """Árvore BK sobre a distância de Levenshtein.
+
+    A desigualdade triangular permite visitar só os filhos cuja distância
+    ao nó está em [d - raio, d + raio], evitando comparar a consulta com
+    todo o vocabulário.
+    """
+
+    def __init__(self):
+        self._root = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str):
+        """Insere a palavra (palavras repetidas são ignoradas)."""
+        if self._root is None:
+            self._root = (word, {})
+            self._size = 1
+            return
+        node = self._root
+        while True:
+            distance = levenshtein(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self._size += 1
+                return
+            node = child
+
+    def search(self, word: str, radius: int) -> Dict[str, int]:
+        """Palavras a no máximo ``radius`` de distância, com suas distâncias."""
+        found = {}
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node_word, children = stack.pop()
+            distance = levenshtein(word, node_word)
+            if distance <= radius:
+                found[node_word] = distance
+            for edge, child in children.items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        return found
+
+    def clear(self):
+        """Remove todas as palavras."""
+        self._root = None
+        self._size = 0
+
+
+class FuzzyNameIndex:
+    """Índice para busca aproximada de nomes, palavra por palavra.
+
+    O vocabulário de palavras dos nomes fica em uma árvore BK e cada palavra
+    aponta para as chaves que a contêm. Palavras que deixam de ser usadas
+    permanecem na árvore, sem chaves associadas, até passarem de
+    ``DEAD_FRACTION`` do vocabulário; então a árvore é refeita só com as
+    palavras em uso.
+    """
+
+    DEAD_FRACTION = 0.5
+
+    def __init__(self):
+        self._tree = BKTree()
+        self._postings: Dict[str, Set[str]] = {}
+        self._tokens: Dict[str, List[str]] = {}
+        # Palavras na árvore sem nenhuma chave.
+        self._dead = 0
+
+    def add(self, key: str, text: str):
+        """Indexa as palavras do texto normalizado da chave."""
+        tokens = text.split()
+        self._tokens[key] = tokens
+        for token in tokens:
+            keys = self._postings.get(token)
+            if keys is None:
+                keys = self._postings[token] = set()
+                self._tree.add(token)
+            elif not keys:
+                self._dead -= 1
+            keys.add(key)
+
+    def remove(self, key: str):
+        """Remove a chave do índice."""
+        for token in self._tokens.pop(key, ()):
+            keys = self._postings.get(token)
+            if keys is not None and key in keys:
+                keys.discard(key)
+                if not keys:
+                    self._dead += 1
+        if self._dead > len(self._postings) * self.DEAD_FRACTION:
+            self._compact()
+
+    def _compact(self):
+        """Refaz a árvore sem as palavras que não têm mais chaves."""
+        self._postings = {word: keys for word, keys in self._postings.items() if keys}
+        self._tree.clear()
+        for word in self._postings:
+            self._tree.add(word)
+        self._dead = 0
+
+    def search(self, query: str, max_distance: int) -> Dict[str, int]:
+        """Chaves cujo nome casa com todas as palavras da consulta.
+
+        O custo de uma chave é a soma, para cada palavra da consulta, da
+        menor distância a uma palavra do nome; só entram custos até
+        ``max_distance``.
+        """
+        costs: Optional[Dict[str, int]] = None
+        for token in query.split():
+            best: Dict[str, int] = {}
+            for word, distance in self._tree.search(token, max_distance).items():
+                for key in self._postings.get(word, ()):
+                    if costs is not None and key not in costs:
+                        continue
+                    if distance < best.get(key, max_distance + 1):
+                        best[key] = distance
+            if costs is None:
+                costs = best
+            else:
+                costs = {key: costs[key] + distance for key, distance in best.items()
+                         if costs[key] + distance <= max_distance}
+            if not costs:
+                return {}
+        return costs or {}
+
+    def clear(self):
+        """Remove todas as chaves."""
+        self._tree.clear()
+        self._postings.clear()
+        self._tokens.clear()
+        self._dead = 0
+
+
+class CourseAggregate:
+    """Contagem e estatísticas de idade de um curso."""
+
+    __slots__ = ('count', 'age_sum', '_ages')
+
+    def __init__(self):
+        self.count = 0
+        self.age_sum = 0
+        # Histograma de idades: min/max continuam O(1) mesmo após remoções,
+        # pois as idades válidas formam um intervalo pequeno e fixo.
+        self._ages: Dict[int, int] = {}
+
+    def add(self, age: int, count: int = 1):
+        """Contabiliza ``count`` estudantes com a idade dada."""
+        self.count += count
+        self.age_sum += age * count
+        self._ages[age] = self._ages.get(age, 0) + count
+
+    def remove(self, age: int):
+        """Descontabiliza um estudante com a idade dada."""
+        self.count -= 1
+        self.age_sum -= age
+        remaining = self._ages[age] - 1
+        if remaining:
+            self._ages[age] = remaining
+        else:
+            del self._ages[age]
+
+    @property
+    def min_age(self) -> Optional[int]:
+        return min(self._ages) if self._ages else None
+
+    @property
+    def max_age(self) -> Optional[int]:
+        return max(self._ages) if self._ages else None
+
+    @property
+    def mean_age(self) -> Optional[float]:
+        return self.age_sum / self.count if self.count else None
+
+
+class RosterAggregates:
+    """Agregados do cadastro mantidos a cada inclusão e remoção.
+
+    Guarda, por curso, a quantidade e as estatísticas de idade, e a
+    quantidade de cadastros por dia.
+    """
+
+    def __init__(self):
+        self._courses: Dict[str, CourseAggregate] = {}
+        self._per_day: Dict[str, int] = {}
+
+    def add(self, course: str, age: int, registration_date: str):
+        """Contabiliza um estudante."""
+        aggregate = self._courses.get(course)
+        if aggregate is None:
+            aggregate = self._courses[course] = CourseAggregate()
+        aggregate.add(age)
+        self._per_day[registration_date] = self._per_day.get(registration_date, 0) + 1
+
+    def load(self, students):
+        """Recalcula os agregados a partir de todos os estudantes."""
+        self.clear()
+        by_course_age = Counter((s.course, s.age) for s in students)
+        for (course, age), count in by_course_age.items():
+            aggregate = self._courses.get(course)
+            if aggregate is None:
+                aggregate = self._courses[course] = CourseAggregate()
+            aggregate.add(age, count)
+        self._per_day = dict(Counter(s.registration_date for s in students))
+
+    def remove(self, course: str, age: int, registration_date: str):
+        """Descontabiliza um estudante."""
+        aggregate = self._courses[course]
+        aggregate.remove(age)
+        if not aggregate.count:
+            del self._courses[course]
+        remaining = self._per_day[registration_date] - 1
+        if remaining:
+            self._per_day[registration_date] = remaining
+        else:
+            del self._per_day[registration_date]
+
+    def courses(self) -> Dict[str, CourseAggregate]:
+        """Agregados por curso (não modifique o dicionário retornado)."""
+        return self._courses
+
+    def registrations_per_day(self) -> Dict[str, int]:
+        """Cópia da quantidade de cadastros por dia."""
+        return dict(self._per_day)
+
+    def clear(self):
+        """Zera todos os agregados."""
+        self._courses.clear()
+        self._per_day.clear()
@@ -0,0 +1,137 @@
+"""
+Loadgen - Gerador de carga local para medir o servidor do TrackStudent.
+
+Uso: python loadgen.py --clientes 50 --requisicoes 200 --escritas 0.3
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from server import StudentServer
+
+
+class LoadResult:
+    """Resultado de uma rodada de carga: vazão e latências."""
+
+    def __init__(self, latencies: List[float], errors: int, elapsed: float):
+        self.latencies = sorted(latencies)
+        self.errors = errors
+        self.elapsed = elapsed
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Latência (em segundos) abaixo da qual fica ``fraction`` das requisições."""
+        if not self.latencies:
+            return 0.0
+        index = min(len(self.latencies) - 1, int(fraction * len(self.latencies)))
+        return self.latencies[index]
+
+    def to_dict(self) -> Dict:
+        return {'requests': self.requests, 'errors': self.errors,
+                'seconds': round(self.elapsed, 6),
+                'ops_per_second': round(self.ops_per_second, 1),
+                'p50_ms': round(self.percentile(0.50) * 1000, 3),
+                'p99_ms': round(self.percentile(0.99) * 1000, 3)}
+
+    def __str__(self) -> str:
+        return (f"{self.requests} requisição(ões), {self.errors} com erro, "
+                f"{self.elapsed:.3f}s ({self.ops_per_second:.0f} ops/s), "
+                f"p50 {self.percentile(0.50) * 1000:.2f} ms, "
+                f"p99 {self.percentile(0.99) * 1000:.2f} ms")
+
+
+async def _client(number: int, requests: int, write_ratio: float, run_id: str,
+                  host: str, port: int, path: Optional[str],
+                  latencies: List[float]) -> int:
+    """Um cliente: cadastra estudantes e consulta os que cadastrou."""
+    if path:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    rng = random.Random(f"{run_id}-{number}")
+    added: List[str] = []
+    errors = 0
+    try:
+        for i in range(requests):
+            if not added or rng.random() < write_ratio:
+                request = {'cmd': 'add', 'name': "Aluno Carga",
+                           'email': f"carga{run_id}c{number}n{i}@gmail.com",
+                           'course': rng.choice(("ADS", "BES", "Engenharia")),
+                           'age': rng.randint(17, 60)}
+            else:
+                request = {'cmd': 'search', 'matricula': rng.choice(added)}
+            request['id'] = i
+
+            start = time.perf_counter()
+            writer.write(json.dumps(request).encode('utf-8') + b"\n")
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - start)
+
+            if not response['ok']:
+                errors += 1
+            elif request['cmd'] == 'add':
+                added.append(response['matricula'])
+    finally:
+        writer.close()
+    return errors
+
+
+async def run_load(clients: int = 10, requests: int = 100, write_ratio: float = 0.5,
+                   host: str = StudentServer.DEFAULT_HOST,
+                   port: int = StudentServer.DEFAULT_PORT,
+                   path: Optional[str] = None) -> LoadResult:
+    """Dispara ``clients`` conexões simultâneas com ``requests`` requisições cada.
+
+    ``write_ratio`` é a fração de cadastros; as demais requisições consultam
+    por matrícula estudantes cadastrados pelo próprio cliente.
+    """
+    run_id = uuid.uuid4().hex[:8]
+    latencies: List[float] = []
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(
+        _client(number, requests, write_ratio, run_id, host, port, path, latencies)
+        for number in range(clients)
+    ))
+    return LoadResult(latencies, sum(errors), time.perf_counter() - start)
+
+
+def parse_args(argv=None):
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(description="Gerador de carga para o servidor do TrackStudent")
+    parser.add_argument("--host", default=StudentServer.DEFAULT_HOST)
+    parser.add_argument("--porta", type=int, default=StudentServer.DEFAULT_PORT)
+    parser.add_argument("--socket", help="Socket Unix do servidor (em vez de TCP)")
+    parser.add_argument("--clientes", type=int, default=10, help="Conexões simultâneas")
+    parser.add_argument("--requisicoes", type=int, default=100, help="Requisições por cliente")
+    parser.add_argument("--escritas", type=float, default=0.5,
+                        help="Fração de cadastros entre as requisições (0 a 1)")
+    parser.add_argument("--json", action="store_true", help="Escreve o resultado em JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Executa uma rodada de carga e exibe o resultado."""
+    args = parse_args(argv)
+    result = asyncio.run(run_load(args.clientes, args.requisicoes, args.escritas,
+                                  args.host, args.porta, args.socket))
+    print(json.dumps(result.to_dict()) if args.json else result)
+    return 0 if not result.errors else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Locking - Travas para uso concorrente do cadastro (threads e processos).
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class ReadWriteLock:
+    """Trava de leitores e escritor dentro de um processo.
+
+    Vários leitores entram juntos; o escritor entra sozinho. Escritores à
+    espera têm preferência sobre novos leitores, para não ficarem parados
+    enquanto as leituras se sucedem. A trava é reentrante: quem já a detém
+    (para ler ou escrever) pode ler de novo, e o escritor pode escrever de
+    novo. Promover uma leitura a escrita não é permitido.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def held(self) -> bool:
+        """Indica se a thread atual detém a trava (leitura ou escrita)."""
+        return self._writer == threading.get_ident() or getattr(self._local, 'reads', 0) > 0
+
+    def held_for_write(self) -> bool:
+        """Indica se a thread atual é o escritor."""
+        return self._writer == threading.get_ident()
+
+    @contextmanager
+    def read(self):
+        """Bloco de leitura, compartilhado com outros leitores."""
+        if self.held():
+            yield
+            return
+
+        with self._cond:
+            while self._writer is not None or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        self._local.reads = 1
+        try:
+            yield
+        finally:
+            self._local.reads = 0
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        """Bloco de escrita, exclusivo."""
+        if self.held_for_write():
+            yield
+            return
+        if self.held():
+            raise RuntimeError("Leitura em andamento não pode ser promovida a escrita")
+
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = threading.get_ident()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = None
+                self._cond.notify_all()
+
+
+class FileLock:
+    """Trava consultiva entre processos sobre um arquivo auxiliar.
+
+    Usa ``flock`` (compartilhada ou exclusiva) onde existir; no Windows,
+    ``msvcrt.locking``, em que toda trava é exclusiva. Deve ser usada sob
+    uma trava de escrita do processo, pois não distingue threads.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._depth = 0
+
+    @contextmanager
+    def shared(self):
+        """Bloco em que outros processos podem ler, mas não escrever."""
+        with self._locked(exclusive=False):
+            yield
+
+    @contextmanager
+    def exclusive(self):
+        """Bloco em que nenhum outro processo lê ou escreve."""
+        with self._locked(exclusive=True):
+            yield
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        """Trava o arquivo auxiliar; blocos aninhados reaproveitam a trava."""
+        if self._depth:
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+
+        if self._file is None:
+            self._file = open(self.path, 'a+b')
+        self._acquire(exclusive)
+        self._depth = 1
+        try:
+            yield
+        finally:
+            self._depth = 0
+            self._release()
+
+    def _acquire(self, exclusive: bool):
+        fd = self._file.fileno()
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            return
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+
+    def _release(self):
+        fd = self._file.fileno()
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+    def close(self):
+        """Fecha o arquivo auxiliar."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
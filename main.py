@@ -5,8 +5,19 @@ Versão otimizada sem funcionalidades de estatísticas.
 Autores: Tiago Kasprzak Gorri, Mateus Zanettin, Matheus Muller, Vitor Vieira
 """
 
+import argparse
+import asyncio
+import json
+import sys
+
 from validators import StudentValidator
 from database import DatabaseManager
+from backends import SQLiteBackend
+from migrate import MigrationError, migrate_json_to_sqlite
+from changefeed import ChangeFeed
+from commands import CommandRunner
+from metrics import metrics
+from server import StudentServer, serve
 from reports import ReportManager
 from handlers import MenuHandler, StudentInputHandler, StudentUpdateHandler, SearchHandler
 
@@ -14,9 +25,18 @@ from handlers import MenuHandler, StudentInputHandler, StudentUpdateHandler, Sea
 class TrackStudent:
     """Sistema principal de gerenciamento de estudantes."""
     
-    def __init__(self):
-        """Inicializa o sistema com todos os componentes necessários."""
-        self.db_manager = DatabaseManager()
+    REPORT_PAGE_SIZE = 20
+    
+    def __init__(self, sqlite_path=None, change_feed=False):
+        """Inicializa o sistema com todos os componentes necessários.
+        
+        Com ``sqlite_path`` o cadastro fica no banco SQLite indicado em vez
+        do arquivo JSON; com ``change_feed`` as alterações são publicadas no
+        feed de alterações.
+        """
+        backend = SQLiteBackend(sqlite_path) if sqlite_path else None
+        self.db_manager = DatabaseManager(concurrent=True, backend=backend,
+                                          change_feed=change_feed)
         self.report_manager = ReportManager(self.db_manager)
         self.validator = StudentValidator()
         self.menu_handler = MenuHandler()
@@ -54,7 +74,8 @@ class TrackStudent:
             '2': self._search_student,
             '3': self._update_student,
             '4': self._remove_student,
-            '5': self._generate_reports
+            '5': self._generate_reports,
+            '6': self._show_metrics
         }
         
         action = menu_actions.get(choice)
@@ -71,6 +92,10 @@ class TrackStudent:
         if not student:
             return
         
+        if self.db_manager.is_email_taken(student.email):
+            print("Email já cadastrado para outro estudante!")
+            return
+        
         if self.db_manager.add_student(student):
             print(f"\nEstudante cadastrado com sucesso!")
             print(f"Matrícula gerada: {student.matricula}")
@@ -93,6 +118,11 @@ class TrackStudent:
         
         updated_data = self.update_handler.collect_updated_data(student)
         
+        if 'email' in updated_data and self.db_manager.is_email_taken(
+                updated_data['email'], student.matricula):
+            print("Email já cadastrado para outro estudante!")
+            return
+        
         if updated_data:
             if self.db_manager.update_student(matricula, updated_data):
                 print("Dados atualizados com sucesso!")
@@ -120,6 +150,35 @@ class TrackStudent:
         else:
             print("Operação cancelada.")
     
+    def import_students(self, path):
+        """Importa estudantes de um arquivo CSV ou JSONL e exibe o resumo."""
+        print(f"Importando estudantes de {path}...")
+        result = self.db_manager.import_students(path)
+        
+        for line_number, message in result.rejected:
+            print(f"Linha {line_number}: {message}")
+        omitted = result.rejected_count - len(result.rejected)
+        if omitted:
+            print(f"... e mais {omitted} linha(s) rejeitada(s)")
+        print(result)
+        return not result.rejected_count
+    
+    def run_batch(self, lines, json_output=False, output=None):
+        """Executa comandos sem menu e informa a vazão na saída de erros."""
+        runner = CommandRunner(self.db_manager, json_output,
+                               sys.stdout if output is None else output)
+        try:
+            summary = runner.run(lines)
+        except Exception as e:
+            print(f"Erro ao executar o lote, nenhuma alteração foi gravada: {e}",
+                  file=sys.stderr)
+            return False
+        if json_output:
+            print(json.dumps(summary.to_dict()), file=sys.stderr)
+        else:
+            print(summary, file=sys.stderr)
+        return not summary.failed
+    
     def _confirm_removal(self):
         """Confirma se o usuário quer remover o estudante."""
         confirm = input("Tem certeza que deseja remover este estudante? (s/n): ").strip().lower()
@@ -134,19 +193,155 @@ class TrackStudent:
         choice = input("Escolha o tipo de relatório: ").strip()
         
         if choice == '1':
-            print(self.report_manager.generate_all_students_report())
+            self._show_all_students_report()
         elif choice == '2':
-            print(self.report_manager.generate_course_report())
+            self.report_manager.write_report(self.report_manager.iter_course_report())
         else:
             print("Opção inválida!")
+    
+    def _show_metrics(self):
+        """Exibe as métricas das operações e oferece gravá-las em JSON."""
+        self.report_manager.write_report(metrics.iter_report())
+        if not metrics.enabled:
+            return
+        
+        path = input("\nArquivo para salvar em JSON (Enter para não salvar): ").strip()
+        if path:
+            metrics.dump(path)
+            print(f"Métricas salvas em {path}")
+    
+    def _show_all_students_report(self):
+        """Exibe o relatório de estudantes uma página por vez."""
+        page_size = self.REPORT_PAGE_SIZE
+        pages = self.report_manager.count_pages(page_size)
+        
+        for page in range(pages):
+            lines = self.report_manager.iter_all_students_report(page * page_size, page_size)
+            self.report_manager.write_report(lines)
+            
+            if page + 1 < pages:
+                prompt = f"\nPágina {page + 1} de {pages} - Enter para continuar, 'q' para sair: "
+                if input(prompt).strip().lower() == 'q':
+                    break
+
+
+def parse_args(argv=None):
+    """Interpreta os argumentos de linha de comando."""
+    parser = argparse.ArgumentParser(
+        description="TrackStudent - Sistema de Gerenciamento de Estudantes"
+    )
+    parser.add_argument("--sqlite", metavar="BANCO",
+                        help="Usa o banco SQLite indicado em vez do arquivo JSON")
+    parser.add_argument("--feed", action="store_true",
+                        help="Publica cada alteração no feed de alterações (<cadastro>.changes)")
+    parser.add_argument("--metricas", metavar="ARQUIVO",
+                        help="Grava as métricas de desempenho em JSON ao sair")
+    parser.add_argument("--sem-metricas", action="store_true",
+                        help="Desliga a coleta de métricas de desempenho")
+    subparsers = parser.add_subparsers(dest="command")
+    
+    import_parser = subparsers.add_parser(
+        "import", help="Importa estudantes de um arquivo CSV ou JSONL"
+    )
+    import_parser.add_argument("arquivo", help="Caminho do arquivo .csv ou .jsonl")
+    
+    batch_parser = subparsers.add_parser(
+        "batch", help="Executa comandos de um script ou da entrada padrão"
+    )
+    batch_parser.add_argument("script", nargs="?", default="-",
+                              help="Arquivo de comandos (padrão: entrada padrão)")
+    batch_parser.add_argument("--json", action="store_true",
+                              help="Escreve um resultado JSON por linha")
+    
+    serve_parser = subparsers.add_parser(
+        "serve", help="Atende vários clientes em um único processo (linhas JSON)"
+    )
+    serve_parser.add_argument("--host", default=StudentServer.DEFAULT_HOST,
+                              help=f"Endereço TCP (padrão: {StudentServer.DEFAULT_HOST})")
+    serve_parser.add_argument("--porta", type=int, default=StudentServer.DEFAULT_PORT,
+                              help=f"Porta TCP (padrão: {StudentServer.DEFAULT_PORT})")
+    serve_parser.add_argument("--socket", help="Socket Unix (em vez de TCP)")
+    serve_parser.add_argument("--janela", type=float, default=StudentServer.WINDOW * 1000,
+                              help="Janela, em ms, para agrupar alterações em um commit")
+    
+    changes_parser = subparsers.add_parser(
+        "changes", help="Lista as alterações do feed, uma linha JSON por evento"
+    )
+    changes_parser.add_argument("--desde", type=int, default=0,
+                                help="Lista só os eventos após este número de sequência")
+    changes_parser.add_argument("--seguir", action="store_true",
+                                help="Continua aguardando novas alterações")
+    
+    migrate_parser = subparsers.add_parser(
+        "migrate", help="Converte o cadastro JSON para um banco SQLite"
+    )
+    migrate_parser.add_argument("banco", help="Caminho do banco SQLite de destino")
+    migrate_parser.add_argument("--origem", default="students_data.json",
+                                help="Arquivo JSON de origem (padrão: students_data.json)")
+    migrate_parser.add_argument("--substituir", action="store_true",
+                                help="Sobrescreve um banco de destino que já tenha estudantes")
+    
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Ponto de entrada: menu interativo ou subcomando."""
+    args = parse_args(argv)
+    metrics.reset()
+    if not args.sem_metricas:
+        metrics.enable()
+    try:
+        return run_command(args)
+    finally:
+        if args.metricas:
+            metrics.dump(args.metricas)
+        metrics.disable()
+
+
+def run_command(args):
+    """Executa o subcomando escolhido (ou o menu interativo)."""
+    if args.command == "migrate":
+        try:
+            count = migrate_json_to_sqlite(args.origem, args.banco, args.substituir)
+        except MigrationError as e:
+            print(f"Erro na migração: {e}")
+            return 1
+        print(f"{count} estudante(s) migrado(s) para {args.banco}")
+        return 0
+    
+    if args.command == "changes":
+        feed = ChangeFeed((args.sqlite or "students_data.json") + ChangeFeed.SUFFIX)
+        events = feed.tail(args.desde) if args.seguir else feed.read(args.desde)
+        for event in events:
+            print(json.dumps(event, ensure_ascii=False), flush=True)
+        return 0
+    
+    if args.command == "serve":
+        backend = SQLiteBackend(args.sqlite) if args.sqlite else None
+        db_manager = DatabaseManager(backend=backend, change_feed=args.feed)
+        asyncio.run(serve(db_manager, args.host, args.porta, args.socket, args.janela / 1000))
+        return 0
+    
+    system = TrackStudent(args.sqlite, args.feed)
+    
+    if args.command == "import":
+        return 0 if system.import_students(args.arquivo) else 1
+    
+    if args.command == "batch":
+        if args.script == "-":
+            return 0 if system.run_batch(sys.stdin, args.json) else 1
+        with open(args.script, 'r', encoding='utf-8') as script:
+            return 0 if system.run_batch(script, args.json) else 1
+    
+    system.run()
+    return 0
 
 
 if __name__ == "__main__":
     try:
-        system = TrackStudent()
-        system.run()
+        sys.exit(main())
     except KeyboardInterrupt:
         print("\n\nPrograma interrompido pelo usuário.")
     except Exception as e:
         print(f"\nErro inesperado: {e}")
-        print("Encerrando o programa...")
\ No newline at end of file
+        print("Encerrando o programa...")
@@ -0,0 +1,222 @@
+"""
+Metrics - Contagem de chamadas, histogramas de latência e bytes gravados.
+"""
+
+import json
+import math
+import threading
+import time
+from collections import Counter
+from functools import wraps
+from types import GeneratorType
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from database import DatabaseManager
+from reports import ReportManager
+from validators import StudentValidator
+
+
+class LatencyHistogram:
+    """Histograma de latências em faixas logarítmicas, com memória constante.
+
+    Cada faixa é 10% mais larga que a anterior, a partir de 1 µs; os
+    percentis são estimados pelo limite superior da faixa (erro de até 10%).
+    """
+
+    BASE = 1e-6
+    GROWTH = 1.1
+    BUCKETS = 256
+
+    def __init__(self):
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        if seconds <= self.BASE:
+            bucket = 0
+        else:
+            bucket = min(self.BUCKETS - 1,
+                         int(math.log(seconds / self.BASE) / math.log(self.GROWTH)) + 1)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """Latência (em segundos) abaixo da qual fica ``fraction`` das chamadas."""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(self.BASE * self.GROWTH ** bucket, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {'count': self.count, 'total_s': round(self.total, 6),
+                'mean_ms': round(self.total / self.count * 1000, 4) if self.count else 0.0,
+                'p50_ms': round(self.percentile(0.50) * 1000, 4),
+                'p95_ms': round(self.percentile(0.95) * 1000, 4),
+                'p99_ms': round(self.percentile(0.99) * 1000, 4),
+                'max_ms': round(self.max * 1000, 4)}
+
+
+class Metrics:
+    """Métricas das operações públicas do cadastro, dos relatórios e da validação.
+
+    ``enable()`` envolve os métodos públicos das classes em ``TARGETS`` (e
+    os métodos internos de carga e gravação do DatabaseManager) com
+    medidores de tempo; ``disable()`` devolve os métodos originais, então
+    desligadas as métricas não custam nada. Geradores, como os relatórios,
+    são medidos durante todo o consumo, sem contar o tempo de quem consome.
+    """
+
+    TARGETS = (DatabaseManager, ReportManager, StudentValidator)
+    # Métodos internos também medidos: carga e gravação do cadastro.
+    INTERNAL_METHODS = {DatabaseManager: ('_load_data', '_save_data', '_append_journal')}
+    # Métodos cujos bytes gravados pelo backend são contabilizados.
+    WRITE_METHODS = frozenset({'_save_data', '_append_journal'})
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._counters: Counter = Counter()
+        self._originals: List[Tuple[type, str, object]] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._originals)
+
+    def observe(self, name: str, seconds: float):
+        """Registra a duração de uma chamada da operação ``name``."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def add(self, name: str, amount: int = 1):
+        """Soma ``amount`` ao contador ``name``."""
+        with self._lock:
+            self._counters[name] += amount
+
+    def reset(self):
+        """Descarta as medições feitas até aqui."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> Dict:
+        """Cópia das métricas atuais, pronta para virar JSON."""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'operations': {name: histogram.to_dict()
+                               for name, histogram in sorted(self._histograms.items())},
+                'counters': dict(sorted(self._counters.items())),
+            }
+
+    def dump(self, path: str):
+        """Grava as métricas atuais em ``path``, em JSON."""
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.snapshot(), file, ensure_ascii=False, indent=2)
+
+    def iter_report(self) -> Iterator[str]:
+        """Gera, linha a linha, a tabela de métricas (operações mais lentas primeiro)."""
+        data = self.snapshot()
+        yield "\n=== MÉTRICAS DE DESEMPENHO ==="
+        if not data['operations']:
+            yield ("Nenhuma operação medida." if data['enabled']
+                   else "Métricas desligadas.")
+            return
+
+        yield f"{'Operação':<44}{'Chamadas':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Total s':>10}"
+        operations = sorted(data['operations'].items(), key=lambda item: -item[1]['total_s'])
+        for name, stats in operations:
+            yield (f"{name:<44}{stats['count']:>9}{stats['p50_ms']:>10.3f}"
+                   f"{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}{stats['total_s']:>10.3f}")
+        for name, value in data['counters'].items():
+            yield f"{name}: {value}"
+
+    def enable(self, targets: Optional[Tuple[type, ...]] = None):
+        """Instala os medidores nas classes (por padrão, ``TARGETS``)."""
+        if self.enabled:
+            return
+        for cls in targets or self.TARGETS:
+            names = [name for name in vars(cls) if not name.startswith('_')]
+            names.extend(self.INTERNAL_METHODS.get(cls, ()))
+            for name in names:
+                original = vars(cls)[name]
+                wrapped = self._wrap_attribute(cls, name, original)
+                if wrapped is not None:
+                    setattr(cls, name, wrapped)
+                    self._originals.append((cls, name, original))
+
+    def disable(self):
+        """Remove os medidores, devolvendo os métodos originais."""
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals = []
+
+    def _wrap_attribute(self, cls: type, name: str, attribute):
+        """Versão medida do atributo da classe, ou None se não for um método."""
+        if isinstance(attribute, staticmethod):
+            return staticmethod(self._timed(f"{cls.__name__}.{name}", attribute.__func__))
+        if isinstance(attribute, classmethod):
+            return classmethod(self._timed(f"{cls.__name__}.{name}", attribute.__func__))
+        if callable(attribute) and not isinstance(attribute, type):
+            if name in self.WRITE_METHODS:
+                return self._timed_write(f"{cls.__name__}.{name}", attribute)
+            return self._timed(f"{cls.__name__}.{name}", attribute)
+        return None
+
+    def _timed(self, name: str, function):
+        observe = self.observe
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = function(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            if isinstance(result, GeneratorType):
+                return self._timed_generator(name, result, elapsed)
+            observe(name, elapsed)
+            return result
+        return wrapper
+
+    def _timed_write(self, name: str, method):
+        """Mede o método e soma os bytes que o backend gravou durante a chamada."""
+        timed = self._timed(name, method)
+
+        @wraps(method)
+        def wrapper(db, *args, **kwargs):
+            before = db.backend.bytes_written
+            try:
+                return timed(db, *args, **kwargs)
+            finally:
+                self.add('bytes_written', db.backend.bytes_written - before)
+        return wrapper
+
+    def _timed_generator(self, name: str, generator, elapsed: float):
+        """Repassa os itens do gerador somando só o tempo gasto dentro dele."""
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    elapsed += time.perf_counter() - start
+                    return
+                elapsed += time.perf_counter() - start
+                yield item
+        finally:
+            generator.close()
+            self.observe(name, elapsed)
+
+
+metrics = Metrics()
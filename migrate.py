@@ -0,0 +1,38 @@
+"""
+Migrate - Conversão do cadastro em JSON para um banco SQLite.
+"""
+
+import os
+
+from backends import SQLiteBackend
+from database import DatabaseManager
+
+
+class MigrationError(Exception):
+    """Migração recusada: origem ilegível ou destino que seria sobrescrito."""
+
+
+def migrate_json_to_sqlite(json_path: str, sqlite_path: str, replace: bool = False) -> int:
+    """Copia o cadastro (com o journal pendente) para o banco SQLite.
+
+    A ordem de cadastro é preservada. A origem precisa existir e ser lida
+    sem erros; um banco de destino com estudantes só é substituído com
+    ``replace=True``. Retorna a quantidade de estudantes migrados.
+    """
+    source = DatabaseManager(json_path)
+    if not any(os.path.exists(path) for path in (json_path, source.backend.journal_filename)):
+        raise MigrationError(f"Cadastro de origem não encontrado: {json_path}")
+    if not source.loaded:
+        raise MigrationError(f"Não foi possível ler o cadastro de origem: {json_path}")
+    students = source.get_all_students()
+
+    backend = SQLiteBackend(sqlite_path)
+    try:
+        existing = backend.count()
+        if existing and not replace:
+            raise MigrationError(f"O banco {sqlite_path} já tem {existing} estudante(s); "
+                                 "use --substituir para sobrescrevê-lo")
+        backend.save(students)
+    finally:
+        backend.close()
+    return len(students)
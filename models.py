@@ -2,26 +2,127 @@
 Models - Definição das classes de modelo do sistema TrackStudent.
 """
 
-from datetime import datetime
-from typing import Dict
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+
+class MatriculaGenerator:
+    """Gera matrículas únicas, crescentes e ordenáveis.
+    
+    Formato: ``STU`` + ``AAAAMMDDHHMMSS`` + sequência no segundo (6 dígitos)
+    + identificador do processo (7 dígitos). O prefixo com o timestamp é o
+    mesmo das matrículas antigas, que continuam válidas e ordenam antes das
+    novas geradas no mesmo segundo. Se a sequência de um segundo se esgota,
+    o relógio lógico avança para o segundo seguinte.
+    """
+    
+    PREFIX = "STU"
+    STAMP_FORMAT = '%Y%m%d%H%M%S'
+    SEQUENCE_DIGITS = 6
+    NODE_DIGITS = 7
+    
+    def __init__(self, node: int = None):
+        self._fixed_node = node
+        self._reset()
+    
+    def _reset(self):
+        """Reinicia o estado (também usado no processo filho após fork)."""
+        self._lock = threading.Lock()
+        node = self._fixed_node if self._fixed_node is not None else os.getpid()
+        self._node = f"{node % 10 ** self.NODE_DIGITS:0{self.NODE_DIGITS}d}"
+        self._capacity = 10 ** self.SEQUENCE_DIGITS
+        self._second = 0
+        self._sequence = 0
+        self._stamp = ""
+    
+    def next(self) -> str:
+        """Retorna a próxima matrícula."""
+        with self._lock:
+            now = int(time.time())
+            if now > self._second:
+                self._advance(now)
+            elif self._sequence >= self._capacity:
+                self._advance(self._second + 1)
+            
+            sequence = self._sequence
+            self._sequence += 1
+            stamp = self._stamp
+        
+        return f"{self.PREFIX}{stamp}{sequence:0{self.SEQUENCE_DIGITS}d}{self._node}"
+    
+    def next_many(self, count: int) -> List[str]:
+        """Reserva ``count`` matrículas consecutivas de uma só vez."""
+        with self._lock:
+            now = int(time.time())
+            if now > self._second:
+                self._advance(now)
+            elif self._sequence >= self._capacity:
+                self._advance(self._second + 1)
+            
+            start = self._sequence
+            taken = min(count, self._capacity - start)
+            self._sequence += taken
+            base = f"{self.PREFIX}{self._stamp}"
+        
+        width, node = self.SEQUENCE_DIGITS, self._node
+        ids = [f"{base}{sequence:0{width}d}{node}"
+               for sequence in range(start, start + taken)]
+        if taken < count:
+            ids.extend(self.next_many(count - taken))
+        return ids
+    
+    def _advance(self, second: int):
+        """Passa o relógio lógico para ``second`` e zera a sequência.
+        
+        O carimbo usa a hora local, que pode se repetir (fim do horário de
+        verão, ajuste do relógio). Nesse caso o último carimbo é mantido e
+        sua sequência continua; esgotada, o carimbo avança um segundo.
+        """
+        self._second = second
+        stamp = time.strftime(self.STAMP_FORMAT, time.localtime(second))
+        if stamp <= self._stamp:
+            if self._sequence < self._capacity:
+                return
+            last = datetime.strptime(self._stamp, self.STAMP_FORMAT)
+            stamp = (last + timedelta(seconds=1)).strftime(self.STAMP_FORMAT)
+        self._sequence = 0
+        self._stamp = stamp
+
+
+_matricula_generator = MatriculaGenerator()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_matricula_generator._reset)
+
+
+def _intern(value):
+    """Interna strings muito repetidas (curso, data) para compartilhá-las."""
+    return sys.intern(value) if type(value) is str else value
 
 
 class Student:
     """Classe que representa um estudante no sistema TrackStudent."""
     
+    # Sem __dict__ por instância: reduz a memória de cadastros grandes.
+    __slots__ = ('matricula', 'name', 'email', 'course', 'age', 'registration_date')
+    
     def __init__(self, name: str, email: str, course: str, age: int):
         """Inicializa uma nova instância de Student."""
         self.matricula = self._generate_matricula()
         self.name = name
         self.email = email
-        self.course = course
+        self.course = _intern(course)
         self.age = age
-        self.registration_date = datetime.now().strftime("%Y-%m-%d")
+        self.registration_date = _intern(datetime.now().strftime("%Y-%m-%d"))
     
     @staticmethod
     def _generate_matricula() -> str:
         """Gera uma matrícula única baseada no timestamp atual."""
-        return f"STU{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        return _matricula_generator.next()
     
     def to_dict(self) -> Dict:
         """Converte a instância do estudante para um dicionário."""
@@ -37,9 +138,24 @@ class Student:
     @classmethod
     def from_dict(cls, data: Dict) -> 'Student':
         """Cria uma instância de Student a partir de um dicionário."""
-        student = cls(data['name'], data['email'], data['course'], data['age'])
-        student.matricula = data['matricula']
-        student.registration_date = data['registration_date']
+        return cls.from_fields(data['matricula'], data['name'], data['email'],
+                               data['course'], data['age'], data['registration_date'])
+    
+    @classmethod
+    def from_fields(cls, matricula: str, name: str, email: str, course: str,
+                    age: int, registration_date: str) -> 'Student':
+        """Recria um estudante já cadastrado sem passar pelo construtor.
+        
+        Não gera matrícula nem consulta o relógio, o que torna o
+        carregamento de cadastros grandes bem mais barato.
+        """
+        student = cls.__new__(cls)
+        student.matricula = matricula
+        student.name = name
+        student.email = email
+        student.course = _intern(course)
+        student.age = age
+        student.registration_date = _intern(registration_date)
         return student
     
     def __str__(self) -> str:
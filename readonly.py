@@ -0,0 +1,204 @@
+"""
+ReadOnly - Consulta somente leitura do cadastro via snapshot mapeado em memória.
+"""
+
+import os
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from models import Student
+from database import DatabaseManager
+from importer import ImportResult
+from indexes import CourseAggregate, normalize_text
+from snapshot import MappedSnapshot, SnapshotError
+
+
+class ReadOnlyDatabaseManager(DatabaseManager):
+    """Gerenciador somente leitura para terminais de consulta.
+
+    Abre o snapshot binário (``<arquivo>.bin``) via mmap em vez de carregar
+    todos os estudantes: a inicialização tem custo constante e a busca por
+    matrícula decodifica um único registro. Vários processos compartilham
+    as páginas do arquivo em cache no sistema operacional.
+
+    Se o snapshot não puder ser usado (ausente, desatualizado, de versão
+    antiga ou com journal pendente), o cadastro é carregado em memória como
+    no ``DatabaseManager``. Consultas sem caminho próprio no snapshot (busca
+    aproximada, filtros, ordenação por data) também carregam o cadastro, na
+    primeira vez em que forem usadas.
+    """
+
+    READ_ONLY_MESSAGE = "Banco de dados aberto somente para leitura."
+
+    def __init__(self, filename: str = "students_data.json"):
+        self._snapshot: Optional[MappedSnapshot] = None
+        super().__init__(filename, journal=False, binary_snapshot=False)
+
+    def _load_data(self) -> bool:
+        """Mapeia o snapshot binário; sem ele, carrega o cadastro em memória."""
+        self._snapshot = self._open_snapshot()
+        if self._snapshot is None:
+            return super()._load_data()
+        return True
+
+    def _open_snapshot(self) -> Optional[MappedSnapshot]:
+        """Abre o snapshot mapeado, ou None se ele não refletir o cadastro."""
+        if not self.backend.binary_current():
+            return None
+        journal_filename = self.backend.journal_filename
+        if os.path.exists(journal_filename) and os.path.getsize(journal_filename):
+            return None
+
+        try:
+            return MappedSnapshot(self.backend.binary_filename)
+        except (SnapshotError, OSError, ValueError) as e:
+            print(f"Snapshot binário ignorado: {e}")
+            return None
+
+    def _materialize(self):
+        """Carrega todo o cadastro em memória e fecha o mapeamento."""
+        if self._snapshot is None:
+            return
+        snapshot, self._snapshot = self._snapshot, None
+        self._by_matricula = {s.matricula: s for s in snapshot.iter_rows()}
+        snapshot.close()
+        self._rebuild_indexes()
+
+    def close(self):
+        """Libera o snapshot mapeado, se houver."""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+
+    @property
+    def students(self) -> List[Student]:
+        """Lista dos estudantes na ordem de cadastro."""
+        return self.get_all_students()
+
+    def _read_only(self) -> bool:
+        """Recusa uma alteração."""
+        print(self.READ_ONLY_MESSAGE)
+        return False
+
+    def add_student(self, student: Student) -> bool:
+        return self._read_only()
+
+    def update_student(self, matricula: str, updated_data: Dict) -> bool:
+        return self._read_only()
+
+    def remove_student(self, matricula: str) -> bool:
+        return self._read_only()
+
+    def compact(self) -> bool:
+        return self._read_only()
+
+    def import_students(self, path: str, *args, **kwargs) -> ImportResult:
+        raise PermissionError(self.READ_ONLY_MESSAGE)
+
+    def find_student_by_matricula(self, matricula: str) -> Optional[Student]:
+        """Busca binária no índice do snapshot; decodifica só um registro."""
+        if self._snapshot is None:
+            return super().find_student_by_matricula(matricula)
+        if not matricula:
+            return None
+        return self._snapshot.find(matricula.strip())
+
+    def _find_email_row(self, email: str) -> Optional[int]:
+        """Linha do primeiro estudante com o email dado."""
+        key = self._email_key(email)
+        for row, value in enumerate(self._snapshot.column('email')):
+            if self._email_key(value) == key:
+                return row
+        return None
+
+    def find_student_by_email(self, email: str) -> Optional[Student]:
+        """Busca pelo email percorrendo apenas a coluna de emails."""
+        if self._snapshot is None:
+            return super().find_student_by_email(email)
+        if not email:
+            return None
+        row = self._find_email_row(email)
+        return self._snapshot.student(row) if row is not None else None
+
+    def is_email_taken(self, email: str, exclude_matricula: Optional[str] = None) -> bool:
+        """Indica se o email já pertence a outro estudante."""
+        if self._snapshot is None:
+            return super().is_email_taken(email, exclude_matricula)
+        owner = self.find_student_by_email(email)
+        return owner is not None and owner.matricula != exclude_matricula
+
+    def find_students_by_name(self, name: str,
+                              accent_insensitive: bool = False) -> List[Student]:
+        """Busca parcial pelo nome percorrendo apenas a coluna de nomes."""
+        if self._snapshot is None:
+            return super().find_students_by_name(name, accent_insensitive)
+        if not name:
+            return []
+
+        name_lower = name.strip().lower()
+        names = self._snapshot.column('name')
+        if accent_insensitive:
+            folded = normalize_text(name_lower)
+            rows = [row for row, value in enumerate(names) if folded in normalize_text(value)]
+        else:
+            rows = [row for row, value in enumerate(names) if name_lower in value.lower()]
+        return [self._snapshot.student(row) for row in rows]
+
+    def find_students_fuzzy(self, name: str, max_distance: int = 2,
+                            limit: int = 10) -> List[Student]:
+        self._materialize()
+        return super().find_students_fuzzy(name, max_distance, limit)
+
+    def find_students(self, *args, **kwargs) -> List[Student]:
+        self._materialize()
+        return super().find_students(*args, **kwargs)
+
+    def get_students_page(self, order_by: str = 'matricula',
+                          page_size: int = DatabaseManager.PAGE_SIZE,
+                          token: Optional[str] = None,
+                          offset: int = 0) -> Tuple[List[Student], Optional[str]]:
+        """Página por matrícula lida direto do índice ordenado do snapshot."""
+        if self._snapshot is None or order_by != 'matricula':
+            self._materialize()
+            return super().get_students_page(order_by, page_size, token, offset)
+
+        if token:
+            _, key = self._decode_token(token, order_by)
+            start = self._snapshot.bisect(key, after=True)
+        else:
+            start = offset
+        end = min(start + page_size, len(self._snapshot))
+
+        students = list(self._snapshot.iter_by_matricula(start, end))
+        has_more = end < len(self._snapshot)
+        last = students[-1].matricula if students else None
+        next_token = self._encode_token(order_by, (last, last)) if has_more else None
+        return students, next_token
+
+    def get_all_students(self) -> List[Student]:
+        """Decodifica todos os estudantes, na ordem de cadastro."""
+        if self._snapshot is None:
+            return super().get_all_students()
+        return list(self._snapshot.iter_rows())
+
+    def get_students_count(self) -> int:
+        if self._snapshot is None:
+            return super().get_students_count()
+        return len(self._snapshot)
+
+    def get_course_stats(self) -> Dict[str, CourseAggregate]:
+        """Agregados por curso calculados a partir das colunas do snapshot."""
+        if self._snapshot is None:
+            return super().get_course_stats()
+        stats: Dict[str, CourseAggregate] = {}
+        pairs = Counter(zip(self._snapshot.column('course'), self._snapshot.column('age')))
+        for (course, age), count in pairs.items():
+            aggregate = stats.get(course)
+            if aggregate is None:
+                aggregate = stats[course] = CourseAggregate()
+            aggregate.add(age, count)
+        return stats
+
+    def get_registrations_per_day(self) -> Dict[str, int]:
+        if self._snapshot is None:
+            return super().get_registrations_per_day()
+        return dict(Counter(self._snapshot.column('registration_date')))
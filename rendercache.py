@@ -0,0 +1,99 @@
+"""
+Rendercache - Cache LRU das linhas de estudantes e dos relatórios já formatados.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, List, Optional
+
+from models import Student
+
+
+class RenderCache:
+    """Textos formatados guardados contra a versão do cadastro.
+
+    Linhas de estudante ficam por matrícula e são invalidadas uma a uma
+    quando o estudante muda (``invalidate``). Corpos de relatório ficam com a
+    versão em que foram montados e só valem enquanto ela não mudar. Se a
+    versão avançar sem aviso por matrícula (recarga do disco, alteração feita
+    por outro processo), todas as linhas são descartadas. Os dois caches são
+    LRU com limite: ``max_lines`` linhas de estudante e ``max_report_lines``
+    linhas somando todos os relatórios.
+    """
+
+    MAX_LINES = 100_000
+    MAX_REPORT_LINES = 200_000
+
+    def __init__(self, max_lines: int = MAX_LINES, max_report_lines: int = MAX_REPORT_LINES):
+        self.max_lines = max_lines
+        self.max_report_lines = max_report_lines
+        self.version = 0
+        self._lines: "OrderedDict[str, str]" = OrderedDict()
+        self._reports: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._report_lines = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def _sync(self, version: int):
+        """Descarta as linhas se o cadastro mudou sem avisar quais estudantes.
+
+        Chamado com ``_lock`` adquirida.
+        """
+        if version != self.version:
+            self._lines.clear()
+            self.version = version
+
+    def invalidate(self, matricula: str, version: int):
+        """Descarta a linha do estudante alterado; a versão nova já está refletida."""
+        with self._lock:
+            if self.version == version - 1:
+                self._lines.pop(matricula, None)
+                self.version = version
+            else:
+                self._sync(version)
+
+    def student_line(self, student: Student, version: int) -> str:
+        """Texto de ``str(student)``, formatado só na primeira vez."""
+        lines = self._lines
+        matricula = student.matricula
+        with self._lock:
+            self._sync(version)
+            text = lines.pop(matricula, None)
+            if text is None:
+                text = str(student)
+                while len(lines) >= self.max_lines:
+                    lines.popitem(last=False)
+            lines[matricula] = text
+        return text
+
+    def report(self, key: Hashable, version: int) -> Optional[List[str]]:
+        """Corpo do relatório ``key`` montado nesta versão, ou None."""
+        with self._lock:
+            entry = self._reports.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self._reports.move_to_end(key)
+            return entry[1]
+
+    def store_report(self, key: Hashable, version: int, lines: List[str]):
+        """Guarda o corpo de um relatório, se couber no limite."""
+        if len(lines) > self.max_report_lines:
+            return
+        with self._lock:
+            previous = self._reports.pop(key, None)
+            if previous is not None:
+                self._report_lines -= len(previous[1])
+            self._reports[key] = (version, lines)
+            self._report_lines += len(lines)
+            while self._report_lines > self.max_report_lines:
+                _, (_, evicted) = self._reports.popitem(last=False)
+                self._report_lines -= len(evicted)
+
+    def clear(self):
+        """Esvazia os dois caches."""
+        with self._lock:
+            self._lines.clear()
+            self._reports.clear()
+            self._report_lines = 0
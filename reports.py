@@ -2,50 +2,140 @@
 Reports - Módulo de geração de relatórios do sistema TrackStudent.
 """
 
+import sys
 from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, TextIO
+from backends import ShardedJsonBackend
 from database import DatabaseManager
+from indexes import CourseAggregate
 
 
 class ReportManager:
     """Gerenciador de relatórios do sistema."""
     
+    EMPTY_MESSAGE = "Nenhum estudante cadastrado."
+    CHUNK_LINES = 1000
+    
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
     
-    def generate_all_students_report(self) -> str:
-        """Gera relatório de todos os estudantes."""
-        students = self.db_manager.get_all_students()
-        if not students:
-            return "Nenhum estudante cadastrado."
+    def iter_all_students_report(self, offset: int = 0,
+                                 limit: Optional[int] = None) -> Iterator[str]:
+        """Gera, linha a linha, o relatório de todos os estudantes.
+        
+        ``offset`` e ``limit`` selecionam uma faixa dos estudantes (a
+        numeração continua a do relatório completo); o cabeçalho só é
+        gerado na primeira página (``offset == 0``). O corpo fica no cache
+        de relatórios até a próxima alteração do cadastro.
+        """
+        total = self.db_manager.get_students_count()
+        if not total:
+            yield self.EMPTY_MESSAGE
+            return
+        
+        if offset == 0:
+            yield "\n=== RELATÓRIO DE ESTUDANTES ==="
+            yield f"Total de estudantes: {total}"
+            yield f"Data do relatório: {datetime.now().strftime('%d/%m/%Y %H:%M')}\n"
+        
+        yield from self._cached_body(('all', offset, limit),
+                                     lambda version: self._student_lines(offset, limit, version))
+    
+    def _student_lines(self, offset: int, limit: Optional[int], version: int) -> Iterator[str]:
+        """Linhas numeradas dos estudantes da faixa pedida."""
+        page_size = min(limit, self.CHUNK_LINES) if limit else self.CHUNK_LINES
+        students = self.db_manager.iter_students(page_size=page_size, offset=offset)
+        if limit is not None:
+            students = islice(students, limit)
+        
+        cache = self.db_manager.render_cache
+        if (limit or self.db_manager.get_students_count()) > cache.max_lines:
+            # Faixas maiores que o cache só o fariam descartar linhas úteis.
+            for i, student in enumerate(students, offset + 1):
+                yield f"{i}. {student}"
+            return
+        line = cache.student_line
+        for i, student in enumerate(students, offset + 1):
+            yield f"{i}. {line(student, version)}"
+    
+    def _cached_body(self, key, build) -> Iterator[str]:
+        """Corpo de relatório do cache, ou montado por ``build`` e guardado.
         
-        report = [
-            "\n=== RELATÓRIO DE ESTUDANTES ===",
-            f"Total de estudantes: {len(students)}",
-            f"Data do relatório: {datetime.now().strftime('%d/%m/%Y %H:%M')}\n"
-        ]
+        Só é guardado o corpo consumido até o fim e que caiba no cache; os
+        maiores continuam sendo gerados sob demanda, sem acumular linhas.
+        """
+        db = self.db_manager
+        cache = db.render_cache
+        version = db.version
+        body = cache.report(key, version)
+        if body is not None:
+            yield from body
+            return
         
-        report.extend(f"{i}. {student}" for i, student in enumerate(students, 1))
+        body = []
+        for line in build(version):
+            if body is not None:
+                body.append(line)
+                if len(body) > cache.max_report_lines:
+                    body = None
+            yield line
+        if body is not None:
+            cache.store_report(key, version, body)
+    
+    def iter_course_report(self, parallel: bool = False) -> Iterator[str]:
+        """Gera, linha a linha, o relatório por curso a partir dos agregados.
+        
+        Com ``parallel=True`` e armazenamento em shards, os agregados são
+        recalculados a partir dos arquivos, um shard por processo, e
+        combinados; caso contrário vêm dos agregados mantidos em memória.
+        O corpo fica no cache de relatórios até a próxima alteração.
+        """
+        if not self.db_manager.get_students_count():
+            yield self.EMPTY_MESSAGE
+            return
         
-        return "\n".join(report)
+        yield "\n=== RELATÓRIO POR CURSO ==="
+        yield f"Data do relatório: {datetime.now().strftime('%d/%m/%Y %H:%M')}\n"
+        yield from self._cached_body(('course', parallel),
+                                     lambda version: self._course_lines(parallel))
+    
+    def _course_lines(self, parallel: bool) -> Iterator[str]:
+        """Uma linha por curso, em ordem alfabética."""
+        courses = {course: stats.count
+                   for course, stats in self.course_stats(parallel).items()}
+        for course, count in sorted(courses.items()):
+            yield f"Curso: {course} - {count} estudante(s)"
+    
+    def course_stats(self, parallel: bool = False) -> Dict[str, CourseAggregate]:
+        """Agregados por curso; por shard, em paralelo, se pedido e disponível."""
+        backend = self.db_manager.backend
+        if parallel and isinstance(backend, ShardedJsonBackend):
+            stats, _ = backend.aggregates()
+            return stats
+        return self.db_manager.get_course_stats()
+    
+    def write_report(self, lines: Iterable[str], stream: TextIO = None,
+                     chunk_lines: int = CHUNK_LINES) -> int:
+        """Escreve as linhas no stream em blocos; retorna quantas escreveu."""
+        stream = stream if stream is not None else sys.stdout
+        written = 0
+        lines = iter(lines)
+        while True:
+            chunk = list(islice(lines, chunk_lines))
+            if not chunk:
+                return written
+            stream.write("\n".join(chunk) + "\n")
+            written += len(chunk)
+    
+    def count_pages(self, page_size: int) -> int:
+        """Quantidade de páginas do relatório de estudantes."""
+        return max(1, -(-self.db_manager.get_students_count() // page_size))
+    
+    def generate_all_students_report(self) -> str:
+        """Gera relatório de todos os estudantes."""
+        return "\n".join(self.iter_all_students_report())
     
     def generate_course_report(self) -> str:
-        """Gera relatório por curso."""
-        students = self.db_manager.get_all_students()
-        if not students:
-            return "Nenhum estudante cadastrado."
-        
-        courses = {}
-        for student in students:
-            courses[student.course] = courses.get(student.course, 0) + 1
-        
-        report = [
-            "\n=== RELATÓRIO POR CURSO ===",
-            f"Data do relatório: {datetime.now().strftime('%d/%m/%Y %H:%M')}\n"
-        ]
-        
-        report.extend(
-            f"Curso: {course} - {count} estudante(s)"
-            for course, count in sorted(courses.items())
-        )
-        
-        return "\n".join(report)
\ No newline at end of file
+        """Gera relatório por curso a partir dos agregados do banco."""
+        return "\n".join(self.iter_course_report())
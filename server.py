@@ -0,0 +1,201 @@
+"""
+Server - Serviço local (asyncio) que compartilha um cadastro entre vários clientes.
+"""
+
+import asyncio
+import json
+import os
+from typing import Dict, List, Optional
+
+from commands import CommandError, CommandRunner
+from database import DatabaseManager
+
+
+class StudentServer:
+    """Servidor de linhas JSON sobre TCP local ou socket Unix.
+
+    Cada requisição é uma linha JSON com ``cmd`` (add, search, update,
+    remove ou report), os argumentos do comando, como no modo ``batch``, e
+    opcionalmente um ``id``, devolvido na resposta. Cada resposta também é
+    uma linha JSON.
+
+    Consultas são respondidas na hora, pelos índices em memória. Alterações
+    entram em uma fila: as que chegam dentro da janela ``window`` são
+    aplicadas juntas e gravadas em um único commit, feito em outra thread,
+    e só então respondidas. Durante a gravação o laço continua atendendo
+    consultas, que já enxergam as alterações do lote sendo gravado. Com
+    um backend de consultas, como o SQLite, o lote inteiro roda em outra
+    thread, por uma conexão própria de escrita, e as consultas enxergam o
+    cadastro até o último commit.
+
+    As requisições de uma conexão são atendidas em ordem, então cada
+    cliente sempre lê as próprias alterações. O servidor deve ser o único
+    a alterar o cadastro; use um ``DatabaseManager`` sem ``concurrent``.
+    """
+
+    WRITE_COMMANDS = frozenset({'add', 'update', 'remove'})
+    DEFAULT_HOST = "127.0.0.1"
+    DEFAULT_PORT = 8765
+    WINDOW = 0.002
+    MAX_BATCH = 1000
+
+    def __init__(self, db_manager: DatabaseManager, window: float = WINDOW,
+                 max_batch: int = MAX_BATCH):
+        self.db_manager = db_manager
+        self.runner = CommandRunner(db_manager)
+        self.window = window
+        self.max_batch = max_batch
+        # Gravações em disco e alterações gravadas, para medir o agrupamento.
+        self.commits = 0
+        self.writes = 0
+        # Conexão de escrita própria, usada com backends de consultas.
+        self._write_runner: Optional[CommandRunner] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Future] = None
+        self._server = None
+        self._path: Optional[str] = None
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                    path: Optional[str] = None):
+        """Abre o socket (Unix, se ``path`` for informado) e a fila de escrita."""
+        db = self.db_manager
+        if db.backend.pushdown:
+            writer = DatabaseManager(backend=type(db.backend)(db.backend.path))
+            writer.change_feed = db.change_feed
+            self._write_runner = CommandRunner(writer)
+        self._queue = asyncio.Queue()
+        self._writer = asyncio.ensure_future(self._write_loop())
+        if path:
+            self._server = await asyncio.start_unix_server(self._handle_client, path)
+            self._path = path
+        else:
+            self._server = await asyncio.start_server(self._handle_client, host, port)
+        return self._server
+
+    async def close(self):
+        """Para de aceitar conexões e grava as alterações que ainda estão na fila."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._path and os.path.exists(self._path):
+            os.unlink(self._path)
+        if self._writer is not None:
+            self._queue.put_nowait(None)
+            await self._writer
+        if self._write_runner is not None:
+            self._write_runner.db_manager.backend.close()
+            self._write_runner = None
+
+    async def handle(self, line: str) -> Dict:
+        """Atende uma requisição e devolve a resposta."""
+        try:
+            command = CommandRunner.parse(line)
+        except CommandError as e:
+            return {'ok': False, 'error': str(e)}
+
+        request_id = command.pop('id', None)
+        if command['cmd'] in self.WRITE_COMMANDS:
+            done = asyncio.get_running_loop().create_future()
+            self._queue.put_nowait((command, done))
+            response = await done
+        else:
+            response = self.runner.execute(command)
+        if request_id is not None:
+            response['id'] = request_id
+        return response
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter):
+        """Lê as requisições de uma conexão e responde uma a uma."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self.handle(line.decode('utf-8', errors='replace'))
+                writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _write_loop(self):
+        """Junta as alterações que chegam dentro da janela e as grava de uma vez."""
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            if self.window:
+                await asyncio.sleep(self.window)
+
+            group = [item]
+            stopping = False
+            while len(group) < self.max_batch and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                group.append(item)
+
+            responses = await self._commit([command for command, _ in group])
+            for (_, done), response in zip(group, responses):
+                if not done.cancelled():
+                    done.set_result(response)
+            if stopping:
+                return
+
+    async def _commit(self, commands: List[Dict]) -> List[Dict]:
+        """Aplica um grupo de alterações e o grava em um único commit.
+
+        No modo em memória as alterações são aplicadas no laço de eventos e
+        a gravação roda em outra thread, sem bloquear as consultas. Em
+        backends de consultas, como o SQLite, o grupo é uma transação da
+        conexão de escrita, executada inteira em outra thread.
+        """
+        db = self.db_manager
+        try:
+            if self._write_runner is not None:
+                loop = asyncio.get_running_loop()
+                responses = await loop.run_in_executor(None, self._commit_pushdown, commands)
+            else:
+                db.begin_batch()
+                try:
+                    responses = [self.runner.execute(command) for command in commands]
+                except BaseException:
+                    db.end_batch(commit=False)
+                    raise
+                loop = asyncio.get_running_loop()
+                if not await loop.run_in_executor(None, db.end_batch):
+                    db.end_batch(commit=False)
+                    raise IOError("Erro ao gravar lote de alterações")
+        except Exception as e:
+            return [{'ok': False, 'error': str(e)} for _ in commands]
+
+        written = sum(1 for response in responses if response['ok'])
+        if written:
+            self.commits += 1
+            self.writes += written
+        return responses
+
+    def _commit_pushdown(self, commands: List[Dict]) -> List[Dict]:
+        """Executa o grupo em uma transação da conexão de escrita."""
+        runner = self._write_runner
+        with runner.db_manager.batch():
+            return [runner.execute(command) for command in commands]
+
+
+async def serve(db_manager: DatabaseManager, host: str = StudentServer.DEFAULT_HOST,
+                port: int = StudentServer.DEFAULT_PORT, path: Optional[str] = None,
+                window: float = StudentServer.WINDOW):
+    """Atende clientes até ser interrompido."""
+    server = StudentServer(db_manager, window)
+    await server.start(host, port, path)
+    print(f"TrackStudent atendendo em {path or f'{host}:{port}'}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+        print(f"{server.writes} alteração(ões) gravada(s) em {server.commits} commit(s)")
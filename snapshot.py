@@ -0,0 +1,331 @@
+"""
+Snapshot - Formato binário compacto para carregar o cadastro rapidamente.
+
+Layout (inteiros little-endian):
+
+    cabeçalho: magic "TSTB" | versão (u16) | reservado (u16) |
+               quantidade de registros (u32) | tamanho do corpo (u64) |
+               CRC32 do corpo (u32)
+    corpo:     cinco colunas de texto (matrícula, nome, email, curso e data
+               de cadastro), cada uma com tamanho (u64) seguido dos valores
+               em UTF-8 separados por NUL, e a coluna de idades como u16.
+
+A versão 2 acrescenta ao corpo um índice de deslocamentos, usado pela
+leitura via mmap: para cada coluna de texto, o início de cada valor (u32,
+quantidade + 1 entradas); as matrículas ordenadas, com largura fixa e
+completadas com NUL, seguidas do número da linha de cada uma (u32); e, no
+fim, um rodapé de tamanho fixo com as posições de cada seção.
+
+Guardar cada campo em uma coluna permite decodificar tudo com poucas
+chamadas (``bytes.decode`` e ``str.split``) em vez de interpretar registro
+por registro.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Iterable, Iterator, List, Optional
+from models import Student
+
+_U32 = 'I' if array('I').itemsize == 4 else 'L'
+
+
+def _to_bytes(values: array) -> bytes:
+    """Bytes de um array em little-endian."""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data) -> array:
+    """Array a partir de bytes em little-endian."""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+class SnapshotError(Exception):
+    """Snapshot binário ausente, corrompido ou de versão desconhecida."""
+
+
+class BinarySnapshot:
+    """Leitura e escrita do snapshot binário do cadastro."""
+
+    MAGIC = b"TSTB"
+    VERSION = 2
+    SUPPORTED_VERSIONS = (1, 2)
+    HEADER = struct.Struct('<4sHHIQI')
+    LENGTH = struct.Struct('<Q')
+    # Posições (relativas ao corpo) das cinco colunas de texto, das idades,
+    # dos deslocamentos, das matrículas ordenadas e das linhas; largura da
+    # matrícula.
+    TRAILER = struct.Struct('<9QH')
+    SEPARATOR = "\x00"
+    TEXT_FIELDS = ('matricula', 'name', 'email', 'course', 'registration_date')
+
+    @classmethod
+    def encode(cls, students: Iterable[Student]) -> bytes:
+        """Serializa os estudantes no formato binário (versão 2)."""
+        students = list(students)
+        parts = []
+        position = 0
+        column_starts = []
+        column_offsets = []
+        for field in cls.TEXT_FIELDS:
+            values = [getattr(student, field) for student in students]
+            column = cls.SEPARATOR.join(values)
+            if column.count(cls.SEPARATOR) != max(len(values) - 1, 0):
+                raise SnapshotError(f"Campo '{field}' contém caractere NUL")
+            data = column.encode('utf-8')
+            if len(data) >= 2 ** 32:
+                raise SnapshotError(f"Coluna '{field}' grande demais para o índice")
+            parts.append(cls.LENGTH.pack(len(data)))
+            position += cls.LENGTH.size
+            column_starts.append(position)
+            parts.append(data)
+            position += len(data)
+            column_offsets.append(cls._value_offsets(values))
+
+        ages_start = position
+        ages = _to_bytes(array('H', (int(student.age) for student in students)))
+        parts.append(ages)
+        position += len(ages)
+
+        offsets_start = position
+        for offsets in column_offsets:
+            data = _to_bytes(offsets)
+            parts.append(data)
+            position += len(data)
+
+        keys = sorted((student.matricula.encode('utf-8'), row)
+                      for row, student in enumerate(students))
+        key_width = max((len(key) for key, _ in keys), default=0)
+        keys_start = position
+        data = b"".join(key.ljust(key_width, b"\x00") for key, _ in keys)
+        parts.append(data)
+        position += len(data)
+        rows_start = position
+        parts.append(_to_bytes(array(_U32, (row for _, row in keys))))
+
+        parts.append(cls.TRAILER.pack(*column_starts, ages_start, offsets_start,
+                                      keys_start, rows_start, key_width))
+        payload = b"".join(parts)
+        header = cls.HEADER.pack(cls.MAGIC, cls.VERSION, 0, len(students),
+                                 len(payload), zlib.crc32(payload))
+        return header + payload
+
+    @staticmethod
+    def _value_offsets(values: List[str]) -> array:
+        """Início, em bytes, de cada valor da coluna (mais uma posição final)."""
+        offsets = array(_U32, [0])
+        position = 0
+        for value in values:
+            position += len(value.encode('utf-8')) + 1
+            offsets.append(position)
+        return offsets
+
+    @classmethod
+    def read_header(cls, data) -> tuple:
+        """Valida o cabeçalho e retorna (versão, quantidade, tamanho, crc)."""
+        if len(data) < cls.HEADER.size:
+            raise SnapshotError("Snapshot truncado")
+
+        magic, version, _, count, size, checksum = cls.HEADER.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise SnapshotError("Arquivo não é um snapshot TrackStudent")
+        if version not in cls.SUPPORTED_VERSIONS:
+            raise SnapshotError(f"Versão de snapshot não suportada: {version}")
+        if len(data) - cls.HEADER.size != size:
+            raise SnapshotError("Tamanho do snapshot não confere")
+        return version, count, size, checksum
+
+    @classmethod
+    def decode(cls, data: bytes) -> List[Student]:
+        """Reconstrói os estudantes a partir do conteúdo binário."""
+        _, count, _, checksum = cls.read_header(data)
+
+        payload = memoryview(data)[cls.HEADER.size:]
+        if zlib.crc32(payload) != checksum:
+            raise SnapshotError("Checksum do snapshot não confere")
+
+        columns = []
+        position = 0
+        for _ in cls.TEXT_FIELDS:
+            (length,) = cls.LENGTH.unpack_from(payload, position)
+            position += cls.LENGTH.size
+            text = bytes(payload[position:position + length]).decode('utf-8')
+            columns.append(text.split(cls.SEPARATOR) if count else [])
+            position += length
+        columns.append(_from_bytes('H', payload[position:position + 2 * count]))
+
+        if any(len(column) != count for column in columns):
+            raise SnapshotError("Quantidade de registros não confere")
+
+        matriculas, names, emails, courses, dates, ages = columns
+        # Mesmo efeito de Student.from_fields, sem uma chamada por registro.
+        courses = map(sys.intern, courses)
+        dates = map(sys.intern, dates)
+        new = Student.__new__
+        students = []
+        append = students.append
+        for matricula, name, email, course, registration_date, age in zip(
+                matriculas, names, emails, courses, dates, ages):
+            student = new(Student)
+            student.matricula = matricula
+            student.name = name
+            student.email = email
+            student.course = course
+            student.age = age
+            student.registration_date = registration_date
+            append(student)
+        return students
+
+    @classmethod
+    def write(cls, path: str, students: Iterable[Student]):
+        """Grava o snapshot de forma atômica (arquivo temporário + rename)."""
+        data = cls.encode(students)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def read(cls, path: str) -> List[Student]:
+        """Lê e valida o snapshot gravado em ``path``."""
+        with open(path, 'rb') as file:
+            return cls.decode(file.read())
+
+
+class MappedSnapshot:
+    """Acesso somente leitura a um snapshot versão 2 via mmap.
+
+    A abertura lê apenas o cabeçalho e o rodapé, em tempo constante; cada
+    consulta decodifica só os registros de que precisa. Processos que mapeiam
+    o mesmo arquivo compartilham o cache de páginas do sistema. O checksum
+    não é conferido na abertura, pois isso exigiria ler o arquivo inteiro;
+    use ``verify()`` quando necessário.
+    """
+
+    U16 = struct.Struct('<H')
+    U32 = struct.Struct('<I')
+    SPAN = struct.Struct('<II')
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as file:
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._open()
+        except (SnapshotError, struct.error):
+            self.close()
+            raise
+
+    def _open(self):
+        """Interpreta cabeçalho e rodapé."""
+        version, self._count, size, self._checksum = BinarySnapshot.read_header(self._mm)
+        if version < 2:
+            raise SnapshotError("Snapshot sem índice de deslocamentos (versão 1)")
+
+        base = BinarySnapshot.HEADER.size
+        trailer = BinarySnapshot.TRAILER.unpack_from(
+            self._mm, base + size - BinarySnapshot.TRAILER.size)
+        column_starts = trailer[:5]
+        ages_start, offsets_start, keys_start, rows_start, key_width = trailer[5:]
+        self._columns = [base + start for start in column_starts]
+        self._ages = base + ages_start
+        self._offsets = base + offsets_start
+        self._keys = base + keys_start
+        self._rows = base + rows_start
+        self._key_width = key_width
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self):
+        """Libera o mapeamento."""
+        self._mm.close()
+
+    def verify(self) -> bool:
+        """Confere o checksum do arquivo inteiro."""
+        return zlib.crc32(self._mm[BinarySnapshot.HEADER.size:]) == self._checksum
+
+    def _value(self, column: int, row: int) -> str:
+        """Decodifica um campo de texto de uma linha."""
+        table = self._offsets + column * (self._count + 1) * 4
+        start, end = self.SPAN.unpack_from(self._mm, table + row * 4)
+        base = self._columns[column]
+        return self._mm[base + start:base + end - 1].decode('utf-8')
+
+    def name(self, row: int) -> str:
+        """Nome do estudante da linha, sem decodificar o restante."""
+        return self._value(1, row)
+
+    def student(self, row: int) -> Student:
+        """Decodifica o estudante da linha ``row``."""
+        matricula, name, email, course, registration_date = (
+            self._value(column, row) for column in range(5))
+        (age,) = self.U16.unpack_from(self._mm, self._ages + row * 2)
+        return Student.from_fields(matricula, name, email, course, age, registration_date)
+
+    def _key(self, position: int) -> bytes:
+        """Matrícula (com preenchimento) na posição ordenada ``position``."""
+        start = self._keys + position * self._key_width
+        return self._mm[start:start + self._key_width]
+
+    def _row(self, position: int) -> int:
+        """Linha do registro na posição ordenada ``position``."""
+        (row,) = self.U32.unpack_from(self._mm, self._rows + position * 4)
+        return row
+
+    def bisect(self, matricula: str, after: bool = False) -> int:
+        """Posição ordenada da primeira matrícula >= (ou >, com ``after``)."""
+        target = matricula.encode('utf-8')[:self._key_width].ljust(self._key_width, b"\x00")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            key = self._key(middle)
+            if key < target or (after and key == target):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def find(self, matricula: str) -> Optional[Student]:
+        """Busca binária pela matrícula no índice; decodifica um registro."""
+        encoded = matricula.encode('utf-8')
+        if len(encoded) > self._key_width:
+            return None
+        position = self.bisect(matricula)
+        if position < self._count and self._key(position).rstrip(b"\x00") == encoded:
+            return self.student(self._row(position))
+        return None
+
+    def iter_by_matricula(self, start: int = 0,
+                          end: Optional[int] = None) -> Iterator[Student]:
+        """Estudantes em ordem de matrícula entre as posições dadas."""
+        end = self._count if end is None else min(end, self._count)
+        for current in range(start, end):
+            yield self.student(self._row(current))
+
+    def iter_rows(self) -> Iterator[Student]:
+        """Estudantes na ordem em que foram gravados (ordem de cadastro)."""
+        for row in range(self._count):
+            yield self.student(row)
+
+    def column(self, field: str) -> List:
+        """Todos os valores de um campo (texto ou idade), na ordem das linhas."""
+        if field == 'age':
+            return _from_bytes('H', self._mm[self._ages:self._ages + 2 * self._count])
+        if not self._count:
+            return []
+        start = self._columns[BinarySnapshot.TEXT_FIELDS.index(field)]
+        (length,) = BinarySnapshot.LENGTH.unpack_from(self._mm, start - BinarySnapshot.LENGTH.size)
+        return self._mm[start:start + length].decode('utf-8').split(BinarySnapshot.SEPARATOR)
@@ -0,0 +1,24 @@
+"""Fábricas de estudantes e utilitários compartilhados pelos testes."""
+
+from models import Student
+
+
+def make_student(matricula, name="Ana", email=None, course="ADS", age=20,
+                 registration_date=None):
+    """Estudante com matrícula fixa; o email padrão é derivado dela."""
+    student = Student(name, email or f"{matricula.lower()}@gmail.com", course, age)
+    student.matricula = matricula
+    if registration_date:
+        student.registration_date = registration_date
+    return student
+
+
+def fill_roster(db, make, count):
+    """Cadastra ``make(i)`` para i em range(count), em um único lote."""
+    with db.batch():
+        for i in range(count):
+            assert db.add_student(make(i))
+
+
+def dicts(students):
+    return [s.to_dict() for s in students]
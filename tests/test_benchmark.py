@@ -0,0 +1,57 @@
+import copy
+import json
+
+from benchmark import BenchmarkSuite, compare, main, synthetic_students
+
+CASES = {'load', 'name_index', 'find_student_by_matricula', 'find_students_by_name',
+         'update_student', 'add_student', 'remove_student', 'report_all', 'report_all_cached',
+         'report_course', 'report_course_cached', 'validate', 'validate_records'}
+
+
+def test_synthetic_students_are_valid_and_unique():
+    students = synthetic_students(50) + synthetic_students(50, start=50)
+    assert len({s.matricula for s in students}) == 100
+    assert len({s.email for s in students}) == 100
+    assert [s.matricula for s in students] == sorted(s.matricula for s in students)
+
+
+def test_suite_measures_every_case(tmp_path):
+    result = BenchmarkSuite(str(tmp_path), ops=20, write_ops=2, repeat=1).run([200, 400])
+
+    assert set(result['results']) == {"200", "400"}
+    for cases in result['results'].values():
+        assert set(cases) == CASES
+        assert all(case['seconds'] > 0 and case['peak_bytes'] > 0 for case in cases.values())
+    assert result['results']["200"]['update_student']['ops'] == 2
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_compare_flags_regressions(tmp_path):
+    baseline = BenchmarkSuite(str(tmp_path), ops=10, write_ops=1, repeat=1, memory=False).run([100])
+    current = copy.deepcopy(baseline)
+    current['results']["100"]['load']['per_op'] *= 2
+    current['results']["100"]['report_all']['per_op'] *= 1.1
+
+    rows = compare(baseline, current, tolerance=0.25)
+    assert [(row['case'], row['metric']) for row in rows if row['regression']] == [('load', 'per_op')]
+    assert all(row['metric'] == 'per_op' for row in rows)
+
+    for name, data in (("base.json", baseline), ("atual.json", current)):
+        (tmp_path / name).write_text(json.dumps(data), encoding="utf-8")
+    assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "atual.json")]) == 1
+    assert main(["compare", str(tmp_path / "base.json"), str(tmp_path / "base.json")]) == 0
+
+
+def test_report_cases_build_the_report_every_round(tmp_path, monkeypatch):
+    from reports import ReportManager
+    builds = []
+    original = ReportManager._student_lines
+
+    def counting(self, *args):
+        builds.append(1)
+        return original(self, *args)
+    monkeypatch.setattr(ReportManager, "_student_lines", counting)
+
+    BenchmarkSuite(str(tmp_path), ops=5, write_ops=1, repeat=3, memory=False).run([50])
+    # Uma montagem por rodada sem cache; as rodadas com cache reaproveitam a última.
+    assert len(builds) == 3
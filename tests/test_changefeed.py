@@ -0,0 +1,142 @@
+import json
+import os
+import threading
+from itertools import islice
+
+import pytest
+
+from backends import SQLiteBackend
+from changefeed import ChangeFeed
+from database import DatabaseManager
+from helpers import make_student
+from main import main
+
+
+def _mutate(db):
+    assert db.add_student(make_student("STU1"))
+    assert db.add_student(make_student("STU2"))
+    assert db.update_student("STU1", {'age': 30, 'course': "BES"})
+    assert db.remove_student("STU2")
+
+
+def test_mutations_are_published_in_order(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"), change_feed=True)
+    received = []
+    db.change_feed.subscribe(received.append)
+    _mutate(db)
+    assert not db.update_student("STU9", {'age': 30})
+
+    assert [(e['seq'], e['op'], e['matricula']) for e in received] == [
+        (1, 'add', "STU1"), (2, 'add', "STU2"), (3, 'update', "STU1"), (4, 'remove', "STU2")]
+    assert received[0]['before'] is None and received[0]['after']['email'] == "stu1@gmail.com"
+    assert received[2]['before'] == {'age': 20, 'course': "ADS"}
+    assert received[2]['after'] == {'age': 30, 'course': "BES"}
+    assert received[3]['before']['matricula'] == "STU2" and received[3]['after'] is None
+    assert list(ChangeFeed(str(tmp_path / "db.json.changes")).read()) == received
+
+
+def test_batches_publish_only_after_commit(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"), journal=True, change_feed=True)
+    received = []
+    db.change_feed.subscribe(received.append)
+
+    with db.batch():
+        _mutate(db)
+        assert received == []
+    assert [e['seq'] for e in received] == [1, 2, 3, 4]
+
+    with pytest.raises(RuntimeError):
+        with db.batch():
+            db.add_student(make_student("STU3"))
+            raise RuntimeError("falha")
+    assert len(received) == 4
+    assert db.change_feed.last_seq == 4
+
+
+def test_read_and_subscribe_from_any_seq(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"), change_feed=True)
+    db.change_feed.INDEX_EVERY = 3
+    with db.batch():
+        for i in range(10):
+            db.add_student(make_student(f"STU{i}"))
+
+    feed = ChangeFeed(db.change_feed.path)
+    assert feed.last_seq == 10
+    for since in range(12):
+        assert [e['seq'] for e in feed.read(since)] == list(range(since + 1, 11))
+
+    received = []
+    db.change_feed.subscribe(received.append, since=7)
+    db.remove_student("STU0")
+    assert [e['seq'] for e in received] == [8, 9, 10, 11]
+
+
+def test_processes_share_the_feed(tmp_path):
+    path = str(tmp_path / "db.json")
+    first = DatabaseManager(path, concurrent=True, change_feed=True)
+    second = DatabaseManager(path, concurrent=True, change_feed=True)
+    first.add_student(make_student("STU1"))
+    second.add_student(make_student("STU2"))
+    first.update_student("STU2", {'name': "Bia"})
+
+    stop = threading.Event()
+    tail = ChangeFeed(path + ChangeFeed.SUFFIX).tail(since=1, poll_interval=0.01, stop=stop)
+    assert [e['seq'] for e in islice(tail, 2)] == [2, 3]
+    threading.Timer(0.05, second.remove_student, ["STU1"]).start()
+    event = next(tail)
+    stop.set()
+    assert (event['seq'], event['op'], event['before']['name']) == (4, 'remove', "Ana")
+
+
+def test_incomplete_last_line_is_discarded(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"), change_feed=True)
+    db.add_student(make_student("STU1"))
+    with open(db.change_feed.path, "ab") as file:
+        file.write(b'{"seq": 2, "op": "ad')
+
+    db = DatabaseManager(str(tmp_path / "db.json"), change_feed=True)
+    db.add_student(make_student("STU2"))
+    assert [e['matricula'] for e in db.change_feed.read()] == ["STU1", "STU2"]
+
+
+def test_readers_leave_a_partial_line_in_place(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"), change_feed=True)
+    db.add_student(make_student("STU1"))
+    partial = b'{"seq": 2, "op": "ad'
+    with open(db.change_feed.path, "ab") as file:
+        file.write(partial)
+    size = os.path.getsize(db.change_feed.path)
+
+    reader = ChangeFeed(db.change_feed.path)
+    assert [e['seq'] for e in reader.read()] == [1]
+    assert reader.last_seq == 1
+    assert os.path.getsize(db.change_feed.path) == size
+
+    with open(db.change_feed.path, "ab") as file:
+        file.write(b'd", "matricula": "STU2", "before": null, "after": null, "time": ""}\n')
+    assert [e['seq'] for e in reader.read()] == [1, 2]
+
+
+def test_sqlite_backend_publishes_changes(tmp_path):
+    db = DatabaseManager(backend=SQLiteBackend(str(tmp_path / "db.sqlite")), change_feed=True)
+    with db.batch():
+        _mutate(db)
+    assert not db.add_student(make_student("STU1"))
+
+    events = list(db.change_feed.read())
+    assert [e['op'] for e in events] == ['add', 'add', 'update', 'remove']
+    assert events[2]['before'] == {'age': 20, 'course': "ADS"}
+    db.backend.close()
+
+
+def test_main_lists_changes(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    script = tmp_path / "script.txt"
+    script.write_text("add name=Ana email=ana@gmail.com course=ADS age=20 matricula=STU1\n"
+                      "update matricula=STU1 age=21\n", encoding="utf-8")
+    assert main(["--feed", "batch", str(script)]) == 0
+    capsys.readouterr()
+
+    assert main(["changes", "--desde", "1"]) == 0
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(e['seq'], e['op'], e['after']) for e in events] == [(2, 'update', {'age': 21})]
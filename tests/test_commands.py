@@ -0,0 +1,102 @@
+import io
+import json
+
+from commands import CommandRunner
+from database import DatabaseManager
+from main import main
+
+
+def _run(db, lines, json_output=True):
+    output = io.StringIO()
+    summary = CommandRunner(db, json_output, output).run(lines)
+    results = [json.loads(line) for line in output.getvalue().splitlines()] if json_output else output.getvalue()
+    return summary, results
+
+
+def test_commands_in_both_syntaxes(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    summary, results = _run(db, [
+        '# comentário',
+        'add name="Ana Souza" email=ana@gmail.com course=ADS age=20 matricula=STU1',
+        '{"cmd": "add", "name": "João", "email": "joao@gmail.com", "course": "BES", "age": 22, "matricula": "STU2"}',
+        '',
+        'add name=Bia email=ANA@gmail.com course=ADS age=21',
+        'search name=joao',
+        'update matricula=STU1 age=30 course=Análise',
+        'update matricula=STU1 age=90',
+        'search course=analise age_min=25',
+        'remove matricula=STU2',
+        'remove matricula=STU2',
+        'report type=course',
+        'voar',
+        'add name="sem fim',
+    ])
+
+    assert summary.commands == 12
+    assert summary.failed == 5
+    assert summary.ops_per_second > 0
+    assert [r['ok'] for r in results] == [True, True, False, True, True, False, True, True, False, True, False, False]
+    assert results[2]['error'] == "Email já cadastrado para outro estudante"
+    assert [s['matricula'] for s in results[3]['students']] == ["STU2"]
+    assert results[5] == {'ok': False, 'error': "Idade inválida", 'line': 8}
+    assert [s['age'] for s in results[6]['students']] == [30]
+    assert results[9]['lines'][-1] == "Curso: Análise - 1 estudante(s)"
+    assert [s.matricula for s in DatabaseManager(str(tmp_path / "db.json")).get_all_students()] == ["STU1"]
+
+
+def test_batch_saves_once(tmp_path, monkeypatch):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    saves = []
+    original_save = db._save_data
+    monkeypatch.setattr(db, "_save_data", lambda: saves.append(1) or original_save())
+
+    lines = [f'add name=Aluno email=a{i}@gmail.com course=ADS age=20 matricula=STU{i}' for i in range(50)]
+    summary, output = _run(db, lines + ["remove matricula=STU0"], json_output=False)
+
+    assert saves == [1]
+    assert summary.failed == 0
+    assert output.splitlines()[-1] == "remove: STU0"
+    assert DatabaseManager(str(tmp_path / "db.json")).get_students_count() == 49
+
+
+def test_main_batch_from_script(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    script = tmp_path / "script.txt"
+    script.write_text("add name=Ana email=ana@gmail.com course=ADS age=20\nsearch email=ana@gmail.com\n",
+                      encoding="utf-8")
+
+    assert main(["batch", str(script), "--json"]) == 0
+    captured = capsys.readouterr()
+    assert [json.loads(line)['ok'] for line in captured.out.splitlines()] == [True, True]
+    assert json.loads(captured.err)['commands'] == 2
+
+
+def test_bad_argument_types_fail_only_their_command(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    summary, results = _run(db, [
+        '{"cmd": "add", "name": "Ana", "email": "ana@gmail.com", "course": "ADS", "age": 20, "matricula": "STU1"}',
+        '{"cmd": "search", "registered_from": 5}',
+        '{"cmd": "search", "age_min": null}',
+        '{"cmd": "search", "course": ["ADS"]}',
+        '{"cmd": ["x"]}',
+        '{"cmd": "search", "matricula": "STU1"}',
+    ])
+
+    assert [r['ok'] for r in results] == [True, False, False, False, False, True]
+    assert results[1]['error'] == "Data inválida (use AAAA-MM-DD)"
+    assert results[2]['error'] == "Idade inválida"
+    assert summary.failed == 4
+    assert DatabaseManager(str(tmp_path / "db.json")).get_students_count() == 1
+
+
+def test_main_batch_fails_when_the_batch_is_not_saved(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    script = tmp_path / "script.txt"
+    script.write_text("add name=Ana email=ana@gmail.com course=ADS age=20\n", encoding="utf-8")
+
+    def failing_save(self, students, changes=None):
+        raise OSError("disco cheio")
+    monkeypatch.setattr("backends.JsonBackend.save", failing_save)
+
+    assert main(["batch", str(script)]) == 1
+    assert "nenhuma alteração foi gravada" in capsys.readouterr().err
@@ -0,0 +1,98 @@
+import multiprocessing
+import threading
+
+import pytest
+from database import DatabaseManager
+from helpers import make_student
+from locking import ReadWriteLock
+
+
+def test_read_write_lock_shares_reads_and_excludes_writes():
+    lock = ReadWriteLock()
+    inside = []
+    both_reading = threading.Barrier(2, timeout=5)
+
+    def reader():
+        with lock.read():
+            both_reading.wait()
+            with lock.read():
+                inside.append("leitura")
+
+    threads = [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert inside == ["leitura", "leitura"]
+
+    with lock.write():
+        with lock.write(), lock.read():
+            assert lock.held_for_write()
+    with lock.read():
+        with pytest.raises(RuntimeError):
+            with lock.write():
+                pass
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_threads_mixed_reads_and_writes(tmp_path, journal):
+    db = DatabaseManager(str(tmp_path / "db.json"), journal=journal, concurrent=True)
+    errors = []
+
+    def worker(number):
+        try:
+            for i in range(30):
+                matricula = f"STU{number:02d}{i:04d}"
+                assert db.add_student(make_student(matricula, "Aluno"))
+                assert db.find_student_by_matricula(matricula) is not None
+                assert db.update_student(matricula, {'name': f"Aluno {number} {i}"})
+                db.find_students_by_name("aluno")
+                db.get_students_page(page_size=10)
+                if i % 3 == 0:
+                    assert db.remove_student(matricula)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert db.get_students_count() == 8 * 20
+    reloaded = DatabaseManager(str(tmp_path / "db.json"))
+    assert sorted(s.to_dict()['name'] for s in reloaded.get_all_students()) == \
+        sorted(s.name for s in db.get_all_students())
+
+
+def _process_worker(path, journal, number, count):
+    db = DatabaseManager(path, journal=journal, concurrent=True)
+    for i in range(count):
+        assert db.add_student(make_student(f"STU{number:02d}{i:04d}", "Aluno"))
+        db.get_students_count()
+        db.find_students_by_name("aluno")
+    with db.batch():
+        db.update_student(f"STU{number:02d}0000", {'name': "Primeiro"})
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_processes_do_not_lose_writes(tmp_path, journal):
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("requer processos com fork")
+    context = multiprocessing.get_context("fork")
+    path = str(tmp_path / "db.json")
+    observer = DatabaseManager(path, journal=journal, concurrent=True)
+
+    processes = [context.Process(target=_process_worker, args=(path, journal, n, 15))
+                 for n in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [process.exitcode for process in processes] == [0] * 4
+    # O observador percebe as alterações dos outros processos sozinho.
+    assert observer.get_students_count() == 4 * 15
+    assert len(observer.find_students_by_name("primeiro")) == 4
+    assert not observer.refresh()
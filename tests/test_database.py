@@ -1,8 +1,12 @@
+import json
+
+import pytest
 from database import DatabaseManager
+from helpers import make_student
 from models import Student
 
-def test_add_and_find_student():
-    db = DatabaseManager("test_db.json")
+def test_add_and_find_student(tmp_path):
+    db = DatabaseManager(str(tmp_path / "test_db.json"))
     student = Student("Ana", "ana@gmail.com", "ADS", 20)
 
     result = db.add_student(student)
@@ -10,3 +14,196 @@ def test_add_and_find_student():
 
     found = db.find_student_by_matricula(student.matricula)
     assert found is not None
+
+
+def _assert_index_consistent(db):
+    students = db.get_all_students()
+    assert len(students) == db.get_students_count()
+    assert [s.matricula for s in students] == list(db._by_matricula)
+    for s in students:
+        assert db.find_student_by_matricula(s.matricula) is s
+
+
+def test_index_consistent_across_mutations(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    for i in range(5):
+        assert db.add_student(make_student(f"STU{i}"))
+    assert db.add_student(make_student("STU2")) == False
+    _assert_index_consistent(db)
+
+    assert db.update_student("STU1", {"name": "Bia", "matricula": "X"})
+    assert db.find_student_by_matricula("STU1").name == "Bia"
+    assert db.remove_student("STU3")
+    assert db.remove_student("STU3") == False
+    assert db.find_student_by_matricula("STU3") is None
+    _assert_index_consistent(db)
+
+    reloaded = DatabaseManager(str(tmp_path / "db.json"))
+    assert [s.matricula for s in reloaded.get_all_students()] == ["STU0", "STU1", "STU2", "STU4"]
+    _assert_index_consistent(reloaded)
+
+
+def test_update_converts_age_before_reindexing(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    for i in range(3):
+        assert db.add_student(make_student(f"STU{i}", age=20 + i))
+
+    assert db.update_student("STU1", {"age": "30"})
+    assert db.find_student_by_matricula("STU1").age == 30
+    assert not db.update_student("STU2", {"age": "trinta"})
+    assert not db.update_student("STU2", {"age": None})
+    assert db.find_student_by_matricula("STU2").age == 22
+    assert [s.matricula for s in db.find_students(age_min=22)] == ["STU1", "STU2"]
+    _assert_index_consistent(db)
+
+
+def test_duplicate_legacy_email_stays_taken_while_a_holder_remains(tmp_path):
+    path = tmp_path / "db.json"
+    students = [make_student("STU1", email="ana@gmail.com"), make_student("STU2"),
+                make_student("STU3", email="ANA@gmail.com")]
+    path.write_text(json.dumps([s.to_dict() for s in students]), encoding="utf-8")
+    db = DatabaseManager(str(path))
+
+    assert db.update_student("STU1", {"email": "nova@gmail.com"})
+    assert db.is_email_taken("ana@gmail.com")
+    assert db.find_student_by_email("ana@gmail.com").matricula == "STU3"
+    assert not db.add_student(make_student("STU4", email="ana@gmail.com"))
+
+    assert db.remove_student("STU3")
+    assert not db.is_email_taken("ana@gmail.com")
+    assert db.add_student(make_student("STU4", email="ana@gmail.com"))
+
+
+def test_journal_mode_appends_and_replays(tmp_path):
+    path = str(tmp_path / "db.json")
+    db = DatabaseManager(path, journal=True)
+    db.add_student(make_student("STU1"))
+    db.add_student(make_student("STU2", name="Bia"))
+    db.update_student("STU1", {"age": 30})
+    db.remove_student("STU2")
+
+    assert not (tmp_path / "db.json").exists()
+    assert len((tmp_path / "db.json.journal").read_text(encoding="utf-8").splitlines()) == 4
+
+    reloaded = DatabaseManager(path, journal=True)
+    assert [s.matricula for s in reloaded.get_all_students()] == ["STU1"]
+    assert reloaded.find_student_by_matricula("STU1").age == 30
+
+    assert reloaded.compact()
+    assert not (tmp_path / "db.json.journal").exists()
+    assert DatabaseManager(path).find_student_by_matricula("STU1").age == 30
+
+
+def test_journal_discards_torn_last_record(tmp_path):
+    path = str(tmp_path / "db.json")
+    db = DatabaseManager(path, journal=True)
+    db.add_student(make_student("STU1"))
+    with open(path + ".journal", "a", encoding="utf-8") as file:
+        file.write('{"op": "add", "student": {"matr')
+
+    reloaded = DatabaseManager(path, journal=True)
+    assert [s.matricula for s in reloaded.get_all_students()] == ["STU1"]
+
+    reloaded.add_student(make_student("STU2"))
+    assert [s.matricula for s in DatabaseManager(path, journal=True).get_all_students()] == ["STU1", "STU2"]
+
+
+def test_batch_writes_once(tmp_path, monkeypatch):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    saves = []
+    original_save = db._save_data
+    monkeypatch.setattr(db, "_save_data", lambda: saves.append(1) or original_save())
+
+    with db.batch():
+        for i in range(50):
+            assert db.add_student(make_student(f"STU{i}"))
+        db.update_student("STU0", {"name": "Bia"})
+        db.remove_student("STU1")
+        assert not (tmp_path / "db.json").exists()
+
+    assert len(saves) == 1
+    reloaded = DatabaseManager(str(tmp_path / "db.json"))
+    assert reloaded.get_students_count() == 49
+    assert reloaded.find_student_by_matricula("STU0").name == "Bia"
+
+
+@pytest.mark.parametrize("journal", [False, True])
+def test_batch_rolls_back_on_error(tmp_path, journal):
+    path = str(tmp_path / "db.json")
+    db = DatabaseManager(path, journal=journal)
+    db.add_student(make_student("STU1"))
+    db.add_student(make_student("STU2"))
+
+    with pytest.raises(RuntimeError):
+        with db.batch():
+            db.add_student(make_student("STU3"))
+            db.update_student("STU1", {"name": "Bia", "age": 40})
+            db.remove_student("STU2")
+            raise RuntimeError("falha no meio do lote")
+
+    expected = ["STU1", "STU2"]
+    assert [s.matricula for s in db.get_all_students()] == expected
+    assert db.find_student_by_matricula("STU1").name == "Ana"
+    assert db.find_student_by_matricula("STU1").age == 20
+    assert [s.matricula for s in DatabaseManager(path, journal=journal).get_all_students()] == expected
+
+
+def test_email_unique_on_add_and_update(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    assert db.add_student(make_student("STU1", email="ana@gmail.com"))
+    assert db.add_student(make_student("STU2", email=" ANA@Gmail.com ")) == False
+    assert db.add_student(make_student("STU3", email="bia@gmail.com"))
+
+    assert db.find_student_by_email("Ana@GMAIL.com").matricula == "STU1"
+    assert db.update_student("STU3", {"email": "ana@gmail.com", "name": "Bia"}) == False
+    assert db.find_student_by_matricula("STU3").name == "Ana"
+    assert db.update_student("STU1", {"email": "Ana@gmail.com"})
+
+    assert db.update_student("STU1", {"email": "ana.souza@gmail.com"})
+    assert db.find_student_by_email("ana@gmail.com") is None
+    assert db.add_student(make_student("STU4", email="ana@gmail.com"))
+
+    db.remove_student("STU4")
+    assert db.find_student_by_email("ana@gmail.com") is None
+
+
+@pytest.mark.parametrize("order_by", ["matricula", "registration_date"])
+def test_pages_cover_roster_in_order(tmp_path, order_by):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    with db.batch():
+        for i in (5, 3, 9, 1, 7, 2, 8, 4, 6, 0):
+            student = make_student(f"STU{i}")
+            student.registration_date = f"2025-09-0{(i * 7) % 10}"
+            db.add_student(student)
+
+    students, token = db.get_students_page(order_by, page_size=3)
+    seen = list(students)
+    while token:
+        students, token = db.get_students_page(order_by, page_size=3, token=token)
+        seen.extend(students)
+
+    key = (lambda s: s.matricula) if order_by == "matricula" else (lambda s: (s.registration_date, s.matricula))
+    assert seen == sorted(db.get_all_students(), key=key)
+    assert list(db.iter_students(order_by, page_size=4)) == seen
+    assert list(db.iter_students(order_by, page_size=4, offset=8)) == seen[8:]
+
+
+def test_pages_stable_under_mutation(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    for i in range(10):
+        db.add_student(make_student(f"STU{i}"))
+
+    first, token = db.get_students_page(page_size=4)
+    db.remove_student("STU4")
+    db.remove_student("STU1")
+    db.add_student(make_student("STU35"))
+    db.add_student(make_student("STU0a"))
+    second, token = db.get_students_page(page_size=4, token=token)
+    third, token = db.get_students_page(page_size=4, token=token)
+
+    assert [s.matricula for s in first] == ["STU0", "STU1", "STU2", "STU3"]
+    assert [s.matricula for s in second + third] == ["STU35", "STU5", "STU6", "STU7", "STU8", "STU9"]
+    assert token is None
+
+    with pytest.raises(ValueError):
+        db.get_students_page("registration_date", token=db.get_students_page(page_size=1)[1])
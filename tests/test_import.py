@@ -0,0 +1,115 @@
+import json
+import time
+
+import pytest
+from database import DatabaseManager
+from helpers import make_student
+from main import main
+
+
+def _write_csv(path, rows):
+    lines = ["matricula,name,email,course,age"]
+    lines.extend(",".join(str(value) for value in row) for row in rows)
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_import_csv_reports_rejected_lines(tmp_path):
+    source = tmp_path / "alunos.csv"
+    _write_csv(source, [
+        ("STU1", "Ana Souza", "ana@gmail.com", "ADS", 20),
+        ("STU2", "Bia123", "bia@gmail.com", "ADS", 21),
+        ("STU3", "Caio", "caio@gmail", "BES", 22),
+        ("STU4", "Duda", "duda@gmail.com", "BES", 15),
+        ("STU1", "Eva", "eva@gmail.com", "BES", 30),
+        ("STU5", "Fabio", "fabio@gmail.com", "Medicina", "19"),
+    ])
+
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    result = db.import_students(str(source), chunk_size=2)
+
+    assert result.accepted == 2
+    assert [line for line, _ in result.rejected] == [3, 4, 5, 6]
+    assert result.rejected[0][1] == "Nome inválido"
+    assert result.rejected[3][1] == "Matrícula duplicada"
+    assert db.find_student_by_matricula("STU5").age == 19
+    assert DatabaseManager(str(tmp_path / "db.json")).get_students_count() == 2
+
+
+def test_import_jsonl_commits_in_batches(tmp_path, monkeypatch):
+    source = tmp_path / "alunos.jsonl"
+    lines = [json.dumps({"matricula": f"STU{i}", "name": "Ana", "email": f"a{i}@x.com",
+                         "course": "ADS", "age": 20}) for i in range(10)]
+    lines.insert(3, "{nao e json")
+    lines.insert(5, "")
+    source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    db = DatabaseManager(str(tmp_path / "db.json"), journal=True)
+    appends = []
+    original_append = db._append_journal
+    monkeypatch.setattr(db, "_append_journal",
+                        lambda records: appends.append(len(records)) or original_append(records))
+
+    result = db.import_students(str(source), chunk_size=3, commit_size=4)
+
+    assert result.accepted == 10
+    assert result.rejected == [(4, "Registro malformado")]
+    assert sum(appends) == 10 and max(appends) <= 6
+    assert DatabaseManager(str(tmp_path / "db.json"), journal=True).get_students_count() == 10
+
+
+def test_rejected_lines_are_counted_but_only_the_first_are_kept(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr("importer.ImportResult.MAX_REJECTED", 3)
+    source = tmp_path / "alunos.csv"
+    _write_csv(source, [(f"STU{i}", "Ana", f"a{i}@gmail", "ADS", 20) for i in range(50)]
+               + [("STU99", "Bia", "bia@gmail.com", "ADS", 20)])
+
+    result = DatabaseManager(str(tmp_path / "db.json")).import_students(str(source))
+    assert result.accepted == 1
+    assert result.rejected_count == 50
+    assert [line for line, _ in result.rejected] == [2, 3, 4]
+
+    assert main(["import", str(source)]) == 1
+    out = capsys.readouterr().out
+    assert out.count("Email inválido") == 3
+    assert "... e mais 47 linha(s) rejeitada(s)" in out
+
+
+def test_import_rejects_unknown_format(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    with pytest.raises(ValueError):
+        db.import_students(str(tmp_path / "alunos.xlsx"))
+
+
+@pytest.mark.slow
+def test_import_one_million_rows_throughput(tmp_path):
+    source = tmp_path / "alunos.csv"
+    with open(source, "w", encoding="utf-8") as file:
+        file.write("matricula,name,email,course,age\n")
+        for i in range(1_000_000):
+            file.write(f"STU{i:09d},Aluno Teste,aluno{i}@gmail.com,ADS,{16 + i % 60}\n")
+
+    db = DatabaseManager(str(tmp_path / "db.json"), journal=True)
+    start = time.perf_counter()
+    result = db.import_students(str(source))
+    elapsed = time.perf_counter() - start
+
+    assert result.accepted == 1_000_000 and not result.rejected
+    assert 1_000_000 / elapsed >= 20_000, f"{1_000_000 / elapsed:.0f} linhas/s"
+
+
+def test_import_rejects_duplicate_emails(tmp_path):
+    source = tmp_path / "alunos.csv"
+    _write_csv(source, [
+        ("STU1", "Ana", "ana@gmail.com", "ADS", 20),
+        ("STU2", "Bia", "bia@gmail.com", "ADS", 21),
+        ("STU3", "Ana Souza", "ANA@gmail.com", "ADS", 22),
+        ("STU4", "Caio", "caio@gmail.com", "BES", 23),
+    ])
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    db.add_student(make_student("STU0", email="caio@gmail.com"))
+
+    result = db.import_students(str(source))
+
+    assert result.accepted == 2
+    assert result.rejected == [(4, "Email duplicado"), (5, "Email duplicado")]
@@ -0,0 +1,83 @@
+import json
+import os
+
+import pytest
+
+from database import DatabaseManager
+from main import main
+from metrics import LatencyHistogram, Metrics
+from models import Student
+from reports import ReportManager
+from validators import StudentValidator
+
+
+@pytest.fixture
+def metrics():
+    registry = Metrics()
+    registry.enable()
+    yield registry
+    registry.disable()
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for i in range(1, 101):
+        histogram.record(i / 1000)
+
+    assert histogram.count == 100
+    assert histogram.percentile(0.50) == pytest.approx(0.050, rel=0.1)
+    assert histogram.percentile(0.99) == pytest.approx(0.099, rel=0.1)
+    assert histogram.percentile(1.0) == histogram.max == 0.1
+    assert LatencyHistogram().percentile(0.5) == 0.0
+
+
+def test_operations_are_counted(tmp_path, metrics):
+    path = str(tmp_path / "db.json")
+    db = DatabaseManager(path)
+    for i in range(3):
+        db.add_student(Student("Ana", f"ana{i}@gmail.com", "ADS", 20))
+    assert StudentValidator.validate_email("ana@gmail.com")
+    assert StudentValidator.validate_age(20)
+    lines = list(ReportManager(db).iter_all_students_report())
+
+    operations = metrics.snapshot()['operations']
+    assert operations['DatabaseManager.add_student']['count'] == 3
+    assert operations['DatabaseManager._save_data']['count'] == 3
+    assert operations['DatabaseManager._load_data']['count'] == 1
+    assert operations['StudentValidator.validate_email']['count'] == 1
+    assert operations['StudentValidator.validate_age']['count'] == 1
+    assert operations['ReportManager.iter_all_students_report']['count'] == 1
+    assert len(lines) == 6
+    assert metrics.snapshot()['counters']['bytes_written'] > os.path.getsize(path)
+    assert any("DatabaseManager.add_student" in line for line in metrics.iter_report())
+
+
+def test_disable_restores_original_methods():
+    originals = (DatabaseManager.add_student, vars(StudentValidator)['validate_email'],
+                 ReportManager.iter_course_report)
+    registry = Metrics()
+    registry.enable()
+    assert registry.enabled
+    assert DatabaseManager.add_student is not originals[0]
+    registry.disable()
+
+    assert not registry.enabled
+    assert (DatabaseManager.add_student, vars(StudentValidator)['validate_email'],
+            ReportManager.iter_course_report) == originals
+    assert list(registry.iter_report())[-1] == "Métricas desligadas."
+
+
+def test_main_dumps_metrics_on_exit(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    add_student = DatabaseManager.add_student
+    script = tmp_path / "script.txt"
+    script.write_text("add name=Ana email=ana@gmail.com course=ADS age=20\n", encoding="utf-8")
+
+    assert main(["--metricas", "metricas.json", "batch", str(script)]) == 0
+    data = json.loads((tmp_path / "metricas.json").read_text(encoding="utf-8"))
+    assert data['operations']['DatabaseManager.add_student']['count'] == 1
+    assert data['counters']['bytes_written'] > 0
+    assert DatabaseManager.add_student is add_student
+
+    assert main(["--sem-metricas", "--metricas", "vazio.json", "batch", str(script)]) == 1
+    assert json.loads((tmp_path / "vazio.json").read_text(encoding="utf-8"))['operations'] == {}
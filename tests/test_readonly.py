@@ -0,0 +1,84 @@
+import os
+
+import pytest
+from database import DatabaseManager
+from models import Student
+from readonly import ReadOnlyDatabaseManager
+from snapshot import MappedSnapshot
+
+
+def _build(tmp_path, count=30):
+    path = str(tmp_path / "db.json")
+    db = DatabaseManager(path, binary_snapshot=True)
+    with db.batch():
+        for i in range(count):
+            student = Student(f"Aluno Ção {i}", f"aluno{i}@gmail.com", ["ADS", "BES"][i % 2], 18 + i % 5)
+            # Cadastradas fora de ordem para que ordem de cadastro e de
+            # matrícula não coincidam.
+            student.matricula = f"STU{(i * 7) % count:06d}"
+            student.registration_date = f"2025-09-{1 + i % 3:02d}"
+            db.add_student(student)
+    return path, db
+
+
+def test_mapped_snapshot_finds_single_records(tmp_path):
+    path, db = _build(tmp_path)
+    snapshot = MappedSnapshot(path + ".bin")
+    try:
+        assert len(snapshot) == 30
+        assert snapshot.verify()
+        assert snapshot.find("STU000014").to_dict() == db.find_student_by_matricula("STU000014").to_dict()
+        assert snapshot.find("STU999999") is None
+        assert snapshot.find("STU0000140") is None
+        assert [s.matricula for s in snapshot.iter_by_matricula(0, 3)] == ["STU000000", "STU000001", "STU000002"]
+    finally:
+        snapshot.close()
+
+
+def test_read_only_queries_match_database(tmp_path):
+    path, db = _build(tmp_path)
+    kiosk = ReadOnlyDatabaseManager(path)
+    assert kiosk._snapshot is not None
+
+    assert kiosk.get_students_count() == 30
+    assert kiosk.find_student_by_matricula(" STU000021 ").name == db.find_student_by_matricula("STU000021").name
+    assert [s.matricula for s in kiosk.find_students_by_name("cao 1", accent_insensitive=True)] == \
+        [s.matricula for s in db.find_students_by_name("cao 1", accent_insensitive=True)]
+    assert kiosk.find_student_by_email("ALUNO3@gmail.com").matricula == db.find_student_by_email("aluno3@gmail.com").matricula
+    assert {c: (a.count, a.min_age, a.max_age) for c, a in kiosk.get_course_stats().items()} == \
+        {c: (a.count, a.min_age, a.max_age) for c, a in db.get_course_stats().items()}
+    assert kiosk.get_registrations_per_day() == db.get_registrations_per_day()
+
+    assert [s.matricula for s in kiosk.iter_students(page_size=7)] == [s.matricula for s in db.iter_students(page_size=7)]
+    page, token = kiosk.get_students_page(page_size=5, offset=10)
+    assert [s.matricula for s in page] == [f"STU{i:06d}" for i in range(10, 15)]
+    assert kiosk.get_students_page(page_size=5, token=token)[0][0].matricula == "STU000015"
+    assert kiosk._snapshot is not None
+
+    # Consultas sem caminho próprio carregam o cadastro em memória.
+    assert len(kiosk.find_students(course="ads")) == 15
+    assert kiosk._snapshot is None
+    assert kiosk.find_student_by_matricula("STU000021") is not None
+
+
+def test_read_only_rejects_changes(tmp_path):
+    path, _ = _build(tmp_path)
+    kiosk = ReadOnlyDatabaseManager(path)
+
+    assert not kiosk.add_student(Student("Novo Aluno", "novo@gmail.com", "ADS", 20))
+    assert not kiosk.update_student("STU000001", {'name': "Outro"})
+    assert not kiosk.remove_student("STU000001")
+    with pytest.raises(PermissionError):
+        kiosk.import_students(str(tmp_path / "alunos.csv"))
+    assert kiosk.get_students_count() == 30
+    kiosk.close()
+
+
+def test_read_only_falls_back_without_current_snapshot(tmp_path):
+    path, _ = _build(tmp_path)
+    DatabaseManager(path, journal=True).remove_student("STU000001")
+
+    kiosk = ReadOnlyDatabaseManager(path)
+    assert kiosk._snapshot is None
+    assert kiosk.get_students_count() == 29
+    assert os.path.getsize(path + ".journal")
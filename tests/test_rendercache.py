@@ -0,0 +1,189 @@
+import threading
+
+from backends import SQLiteBackend
+from database import DatabaseManager
+from helpers import make_student
+from rendercache import RenderCache
+from reports import ReportManager
+
+
+def _db(tmp_path, count=3, **kwargs):
+    db = DatabaseManager(str(tmp_path / "db.json"), **kwargs)
+    for i in range(count):
+        assert db.add_student(make_student(f"STU{i}"))
+    return db
+
+
+def test_version_advances_on_every_change(tmp_path):
+    db = _db(tmp_path, count=0)
+    versions = [db.version]
+    assert db.add_student(make_student("STU1"))
+    versions.append(db.version)
+    assert db.update_student("STU1", {'age': 30})
+    versions.append(db.version)
+    assert db.remove_student("STU1")
+    versions.append(db.version)
+    assert versions == sorted(set(versions))
+
+    assert not db.remove_student("STU1")
+    assert db.version == versions[-1]
+
+
+def test_update_invalidates_only_the_changed_line(tmp_path):
+    db = _db(tmp_path)
+    students = db.get_all_students()
+    lines = [db.format_student(student) for student in students]
+    assert lines == [str(student) for student in students]
+
+    assert db.update_student("STU1", {'name': "Beatriz"})
+    assert "Beatriz" in db.format_student(db.find_student_by_matricula("STU1"))
+    assert db.format_student(students[0]) is lines[0]
+    assert db.format_student(students[2]) is lines[2]
+
+
+def test_repeated_report_reuses_cached_body(tmp_path, monkeypatch):
+    db = _db(tmp_path)
+    reports = ReportManager(db)
+    first = list(reports.iter_all_students_report())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("relatório deveria vir do cache")
+    monkeypatch.setattr(db, 'iter_students', fail)
+    assert list(reports.iter_all_students_report()) == first
+    monkeypatch.undo()
+
+    assert db.update_student("STU0", {'name': "Beatriz"})
+    changed = list(reports.iter_all_students_report())
+    assert any("Beatriz" in line for line in changed)
+    assert len(changed) == len(first)
+
+
+def test_course_report_sees_new_students(tmp_path):
+    db = _db(tmp_path)
+    reports = ReportManager(db)
+    assert any("ADS - 3 " in line for line in reports.iter_course_report())
+    assert db.add_student(make_student("STU9", course="BES"))
+    lines = list(reports.iter_course_report())
+    assert any("ADS - 3 " in line for line in lines)
+    assert any("BES - 1 " in line for line in lines)
+
+
+def test_partially_consumed_report_is_not_cached(tmp_path):
+    db = _db(tmp_path)
+    reports = ReportManager(db)
+    report = reports.iter_all_students_report()
+    next(report)
+    next(report)
+    report.close()
+    assert db.render_cache.report(('all', 0, None), db.version) is None
+
+
+def test_rollback_discards_cached_lines(tmp_path):
+    db = _db(tmp_path)
+    student = db.find_student_by_matricula("STU0")
+    db.format_student(student)
+    version = db.version
+
+    db.begin_batch()
+    assert db.update_student("STU0", {'name': "Beatriz"})
+    assert "Beatriz" in db.format_student(db.find_student_by_matricula("STU0"))
+    db.end_batch(commit=False)
+
+    assert db.version > version
+    assert "Beatriz" not in db.format_student(db.find_student_by_matricula("STU0"))
+
+
+def test_line_cache_is_bounded():
+    cache = RenderCache(max_lines=2, max_report_lines=3)
+    students = [make_student(f"STU{i}") for i in range(3)]
+    for student in students:
+        cache.student_line(student, 1)
+    assert len(cache) == 2
+
+    cache.store_report('a', 1, ["x", "y"])
+    cache.store_report('b', 1, ["z", "w"])
+    assert cache.report('a', 1) is None
+    assert cache.report('b', 1) == ["z", "w"]
+    cache.store_report('c', 1, ["1", "2", "3", "4"])
+    assert cache.report('c', 1) is None
+    assert cache.report('b', 2) is None
+
+
+def test_sqlite_writes_from_other_connections_change_version(tmp_path):
+    path = str(tmp_path / "db.sqlite")
+    db = DatabaseManager(path, backend=SQLiteBackend(path))
+    assert db.add_student(make_student("STU1"))
+    reports = ReportManager(db)
+    list(reports.iter_all_students_report())
+    version = db.version
+
+    other = DatabaseManager(path, backend=SQLiteBackend(path))
+    assert other.update_student("STU1", {'name': "Beatriz"})
+    assert db.version > version
+    assert any("Beatriz" in line for line in reports.iter_all_students_report())
+
+
+def test_concurrent_mode_checks_the_disk_once_per_listing(tmp_path, monkeypatch):
+    db = _db(tmp_path, count=5, concurrent=True)
+    students = db.get_all_students()
+    refreshes = []
+    original = db.refresh
+    monkeypatch.setattr(db, 'refresh', lambda: refreshes.append(1) or original())
+
+    assert db.format_students(students) == [str(student) for student in students]
+    assert len(refreshes) == 1
+
+
+def test_line_cache_is_safe_across_threads():
+    cache = RenderCache(max_lines=50)
+    students = [make_student(f"STU{i}") for i in range(200)]
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(2000):
+                student = students[(i * 7 + offset) % len(students)]
+                assert cache.student_line(student, 1) == str(student)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(cache) <= 50
+
+
+def test_sqlite_writes_invalidate_only_the_changed_line(tmp_path):
+    path = str(tmp_path / "db.sqlite")
+    db = DatabaseManager(path, backend=SQLiteBackend(path))
+    for i in range(3):
+        assert db.add_student(make_student(f"STU{i}"))
+    students = db.get_all_students()
+    lines = db.format_students(students)
+
+    assert db.update_student("STU1", {'name': "Beatriz"})
+    assert db.add_student(make_student("STU9"))
+    assert db.format_students(students[:1])[0] is lines[0]
+    assert "Beatriz" in db.format_student(db.find_student_by_matricula("STU1"))
+
+    other = DatabaseManager(path, backend=SQLiteBackend(path))
+    assert other.update_student("STU2", {'name': "Carla"})
+    assert db.format_student(students[0]) is not lines[0]
+
+
+def test_sqlite_rolled_back_batch_discards_cached_lines(tmp_path):
+    path = str(tmp_path / "db.sqlite")
+    db = DatabaseManager(path, backend=SQLiteBackend(path))
+    assert db.add_student(make_student("STU1"))
+    try:
+        with db.batch():
+            assert db.update_student("STU1", {'name': "Beatriz"})
+            assert "Beatriz" in db.format_student(db.find_student_by_matricula("STU1"))
+            raise RuntimeError("falha no meio do lote")
+    except RuntimeError:
+        pass
+    assert db.add_student(make_student("STU2"))
+    assert "Beatriz" not in db.format_student(db.find_student_by_matricula("STU1"))
@@ -0,0 +1,80 @@
+import io
+import random
+from collections import Counter
+
+from database import DatabaseManager
+from models import Student
+from reports import ReportManager
+
+
+def _roster(tmp_path, size=200):
+    rng = random.Random(11)
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    with db.batch():
+        for i in range(size):
+            student = Student("Aluno", f"aluno{i}@gmail.com", rng.choice(["ADS", "BES", "bes", "Medicina"]),
+                              rng.randint(16, 80))
+            student.matricula = f"STU{i:05d}"
+            student.registration_date = f"2025-09-{rng.randint(1, 5):02d}"
+            db.add_student(student)
+    return db
+
+
+def _assert_aggregates_match(db):
+    students = db.get_all_students()
+    stats = db.get_course_stats()
+    assert {c: s.count for c, s in stats.items()} == dict(Counter(s.course for s in students))
+    for course, aggregate in stats.items():
+        ages = [s.age for s in students if s.course == course]
+        assert aggregate.age_sum == sum(ages)
+        assert (aggregate.min_age, aggregate.max_age) == (min(ages), max(ages))
+    assert db.get_registrations_per_day() == dict(Counter(s.registration_date for s in students))
+
+
+def test_aggregates_follow_mutations(tmp_path):
+    db = _roster(tmp_path)
+    _assert_aggregates_match(db)
+
+    students = db.get_all_students()
+    db.update_student(students[0].matricula, {"course": "Direito", "age": 80})
+    db.update_student(students[1].matricula, {"age": 16})
+    for student in students[2:60]:
+        db.remove_student(student.matricula)
+    _assert_aggregates_match(db)
+
+    _assert_aggregates_match(DatabaseManager(db.filename))
+
+
+def test_course_report_uses_aggregates(tmp_path):
+    db = _roster(tmp_path)
+    report = ReportManager(db).generate_course_report()
+
+    counts = Counter(s.course for s in db.get_all_students())
+    expected = [f"Curso: {course} - {count} estudante(s)" for course, count in sorted(counts.items())]
+    assert report.splitlines()[4:] == expected
+
+    assert ReportManager(DatabaseManager(str(tmp_path / "vazio.json"))).generate_course_report() == \
+        "Nenhum estudante cadastrado."
+
+
+def test_streamed_report_pages_match_full_report(tmp_path):
+    db = _roster(tmp_path, size=45)
+    reports = ReportManager(db)
+    full = reports.generate_all_students_report().splitlines()
+
+    pages = [list(reports.iter_all_students_report(offset, 20)) for offset in (0, 20, 40)]
+    assert len(pages[0]) == 3 + 20 and len(pages[1]) == 20 and len(pages[2]) == 5
+    assert pages[1][0].startswith("21. ")
+    assert "\n".join(line for page in pages for line in page).splitlines()[1:] == full[1:]
+    assert reports.count_pages(20) == 3
+
+
+def test_write_report_streams_chunks(tmp_path):
+    db = _roster(tmp_path, size=25)
+    reports = ReportManager(db)
+    stream = io.StringIO()
+
+    written = reports.write_report(reports.iter_all_students_report(), stream, chunk_lines=7)
+
+    assert written == 3 + 25
+    assert stream.getvalue() == reports.generate_all_students_report() + "\n"
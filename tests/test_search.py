@@ -0,0 +1,165 @@
+import random
+import time
+from datetime import date
+
+import pytest
+
+from database import DatabaseManager
+from indexes import FuzzyNameIndex
+from models import Student
+
+NAMES = ["João Silva", "Joana Souza", "Maria José", "José Antônio", "Ana Luíza",
+         "Luiz Fernando", "Fernanda Lima", "Conceição Alves", "Tiago Gorri", "Ana"]
+
+
+def _roster(tmp_path, names=NAMES):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    with db.batch():
+        for i, name in enumerate(names):
+            student = Student(name, f"aluno{i}@gmail.com", "ADS", 20)
+            student.matricula = f"STU{i:05d}"
+            db.add_student(student)
+    return db
+
+
+def _brute_force(db, query):
+    query = query.strip().lower()
+    return [s for s in db.get_all_students() if query in s.name.lower()]
+
+
+def test_name_search_matches_substring_semantics(tmp_path):
+    rng = random.Random(42)
+    names = [rng.choice(NAMES) + " " + rng.choice(NAMES) for _ in range(300)]
+    db = _roster(tmp_path, names)
+
+    queries = ["jo", "joã", "JOÃO", "ana", "na l", "Fernando", " silva ", "xyz", "a", "ção"]
+    for query in queries:
+        assert db.find_students_by_name(query) == _brute_force(db, query), query
+
+
+def test_name_search_accent_insensitive(tmp_path):
+    db = _roster(tmp_path)
+
+    assert [s.name for s in db.find_students_by_name("joao")] == []
+    assert [s.name for s in db.find_students_by_name("joao", accent_insensitive=True)] == ["João Silva"]
+    assert [s.name for s in db.find_students_by_name("CONCEICAO", accent_insensitive=True)] == ["Conceição Alves"]
+    assert len(db.find_students_by_name("jose", accent_insensitive=True)) == 2
+
+
+def test_name_index_follows_update_and_remove(tmp_path):
+    db = _roster(tmp_path)
+
+    db.update_student("STU00008", {"name": "Tiago Kasprzak"})
+    assert db.find_students_by_name("gorri") == []
+    assert [s.matricula for s in db.find_students_by_name("kasprzak")] == ["STU00008"]
+
+    db.remove_student("STU00000")
+    assert db.find_students_by_name("silva") == []
+    assert db.find_students_by_name("joao", accent_insensitive=True) == []
+
+
+def test_fuzzy_search_ranks_by_distance(tmp_path):
+    db = _roster(tmp_path)
+
+    assert [s.name for s in db.find_students_fuzzy("joao silav")] == ["João Silva"]
+    assert [s.name for s in db.find_students_fuzzy("ana", max_distance=1)] == ["Ana Luíza", "Ana"]
+    assert [s.name for s in db.find_students_fuzzy("ana", max_distance=2)] == [
+        "Ana Luíza", "Ana", "Joana Souza"]
+    assert db.find_students_fuzzy("ana", max_distance=2, limit=1)[0].name == "Ana Luíza"
+    assert db.find_students_fuzzy("fernandes lima", max_distance=1) == []
+    assert [s.name for s in db.find_students_fuzzy("fernandes lima", max_distance=2)] == ["Fernanda Lima"]
+    assert db.find_students_fuzzy("   ") == []
+
+
+def test_fuzzy_index_follows_update_and_remove(tmp_path):
+    db = _roster(tmp_path)
+
+    db.update_student("STU00008", {"name": "Thiago Kasprzak"})
+    assert db.find_students_fuzzy("tiago gorri") == []
+    assert [s.matricula for s in db.find_students_fuzzy("tiago kasprsak")] == ["STU00008"]
+
+    db.remove_student("STU00008")
+    assert db.find_students_fuzzy("tiago kasprsak") == []
+
+
+def test_fuzzy_index_does_not_grow_under_churn():
+    index = FuzzyNameIndex()
+    for i in range(20):
+        index.add(f"STU{i}", f"aluno{i} silva")
+    for cycle in range(50):
+        for i in range(20):
+            index.remove(f"STU{i}")
+            index.add(f"STU{i}", f"nome{cycle}x{i} silva")
+
+    assert len(index._tree) <= 2 * 21
+    assert index.search("nome49x3 silva", 0) == {"STU3": 0}
+    assert index.search("nome48x3", 0) == {}
+
+
+@pytest.mark.slow
+def test_fuzzy_search_latency(tmp_path):
+    rng = random.Random(7)
+    first = ["joao", "maria", "jose", "ana", "luiz", "fernanda", "tiago", "pedro",
+             "carla", "bruno", "rafael", "juliana", "mateus", "vitor", "beatriz"]
+    last = ["silva", "souza", "oliveira", "santos", "lima", "gorri", "pereira",
+            "costa", "almeida", "ribeiro", "zanettin", "muller", "vieira", "kasprzak"]
+    names = [f"{rng.choice(first)} {rng.choice(last)} {rng.choice(last)}{rng.randrange(5000)}"
+             for _ in range(100_000)]
+    db = _roster(tmp_path, names)
+
+    latencies = []
+    for _ in range(200):
+        query = f"{rng.choice(first)[:-1]}x {rng.choice(last)}"
+        start = time.perf_counter()
+        db.find_students_fuzzy(query, max_distance=2, limit=10)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95)]
+    assert p95 < 0.25, f"p95 = {p95 * 1000:.1f} ms"
+
+
+def _filtered_roster(tmp_path):
+    rng = random.Random(3)
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    with db.batch():
+        for i in range(400):
+            student = Student("Aluno", f"aluno{i}@gmail.com", rng.choice(["BES", "bes", "ADS", "Computação"]),
+                              rng.randint(16, 40))
+            student.matricula = f"STU{i:05d}"
+            student.registration_date = f"2025-09-{rng.randint(1, 30):02d}"
+            db.add_student(student)
+    return db
+
+
+def test_find_students_matches_brute_force(tmp_path):
+    db = _filtered_roster(tmp_path)
+    everyone = db.get_all_students()
+
+    result = db.find_students(course="BES", age_min=18, age_max=21,
+                              registered_from=date(2025, 9, 10), registered_to="2025-09-20")
+    expected = [s for s in everyone if s.course.lower() == "bes" and 18 <= s.age <= 21
+                and "2025-09-10" <= s.registration_date <= "2025-09-20"]
+    assert result == expected and expected
+
+    assert db.find_students(course="computacao") == [s for s in everyone if s.course == "Computação"]
+    assert db.find_students(age_max=16) == [s for s in everyone if s.age == 16]
+    assert db.find_students(registered_from="2025-09-30") == [
+        s for s in everyone if s.registration_date == "2025-09-30"]
+    assert db.find_students() == everyone
+    assert db.find_students(course="Medicina") == []
+
+
+def test_find_students_indexes_follow_updates(tmp_path):
+    db = _filtered_roster(tmp_path)
+    student = db.find_students(course="ADS", age_min=16, age_max=16)[0]
+
+    db.update_student(student.matricula, {"course": "Medicina", "age": 50})
+    assert db.find_students(course="medicina") == [student]
+    assert db.find_students(age_min=50) == [student]
+    assert student not in db.find_students(course="ADS")
+    assert student not in db.find_students(age_max=16)
+
+    db.remove_student(student.matricula)
+    assert db.find_students(course="Medicina") == []
+    assert db.find_students(age_min=50) == []
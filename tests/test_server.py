@@ -0,0 +1,186 @@
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+
+from backends import SQLiteBackend
+from database import DatabaseManager
+from loadgen import run_load
+from models import Student
+from server import StudentServer
+
+
+async def _request(port, *requests):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    responses = []
+    for request in requests:
+        line = request if isinstance(request, str) else json.dumps(request)
+        writer.write(line.encode('utf-8') + b"\n")
+        await writer.drain()
+        responses.append(json.loads(await reader.readline()))
+    writer.close()
+    return responses
+
+
+def _add(i):
+    return {'cmd': 'add', 'id': i, 'name': "Aluno", 'email': f"a{i}@gmail.com",
+            'course': "ADS", 'age': 20, 'matricula': f"STU{i:03d}"}
+
+
+async def _serving(db, scenario, window=StudentServer.WINDOW):
+    server = StudentServer(db, window)
+    sockets = (await server.start(port=0)).sockets
+    try:
+        return await scenario(sockets[0].getsockname()[1]), server
+    finally:
+        await server.close()
+
+
+def test_concurrent_writes_share_commits(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+
+    async def scenario(port):
+        results = await asyncio.gather(*(_request(port, _add(i)) for i in range(40)))
+        return [response for responses in results for response in responses]
+
+    responses, server = asyncio.run(_serving(db, scenario, window=0.02))
+
+    assert all(response['ok'] for response in responses)
+    assert sorted(response['id'] for response in responses) == list(range(40))
+    assert server.writes == 40
+    assert server.commits < 40
+    assert DatabaseManager(str(tmp_path / "db.json")).get_students_count() == 40
+
+
+def test_requests_on_a_connection_are_answered_in_order(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+
+    async def scenario(port):
+        return await _request(port, _add(1), {'cmd': 'search', 'matricula': "STU001"},
+                              {'cmd': 'update', 'matricula': "STU001", 'age': 31},
+                              'search name=aluno', _add(1), "voar", "{quebrado",
+                              {'cmd': 'remove', 'matricula': "STU001"},
+                              {'cmd': 'report', 'type': 'course'})
+
+    responses, _ = asyncio.run(_serving(db, scenario))
+
+    assert [r['ok'] for r in responses] == [True, True, True, True, False, False, False, True, True]
+    assert responses[1]['students'][0]['email'] == "a1@gmail.com"
+    assert responses[3]['students'][0]['age'] == 31
+    assert responses[4] == {'ok': False, 'error': "Email já cadastrado para outro estudante", 'id': 1}
+    assert DatabaseManager(str(tmp_path / "db.json")).get_students_count() == 0
+
+
+def test_malformed_request_gets_an_error_reply(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+
+    async def scenario(port):
+        return await _request(port, {'cmd': 'search', 'id': 1, 'age_min': None},
+                              {'cmd': ['x'], 'id': 2}, _add(3),
+                              {'cmd': 'search', 'registered_from': 5})
+
+    responses, _ = asyncio.run(_serving(db, scenario))
+
+    assert responses[0] == {'ok': False, 'error': "Idade inválida", 'id': 1}
+    assert [r['ok'] for r in responses] == [False, False, True, False]
+
+
+def test_reads_are_not_blocked_by_disk_writes(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+    db.add_student(Student("Ana", "ana@gmail.com", "ADS", 20))
+    saving, release = threading.Event(), threading.Event()
+    original_save = db.backend.save
+
+    def slow_save(students, changes=None):
+        saving.set()
+        release.wait(5)
+        original_save(students, changes)
+
+    db.backend.save = slow_save
+
+    async def scenario(port):
+        write = asyncio.ensure_future(_request(port, _add(1)))
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, saving.wait, 5)
+        read = await _request(port, {'cmd': 'search', 'email': "ana@gmail.com"})
+        pending = not write.done()
+        release.set()
+        return read, pending, await write
+
+    (read, pending, write), _ = asyncio.run(_serving(db, scenario))
+
+    assert pending
+    assert read[0]['students'][0]['name'] == "Ana"
+    assert write[0]['ok']
+
+
+def test_sqlite_reads_are_served_during_a_slow_commit(tmp_path):
+    db = DatabaseManager(backend=SQLiteBackend(str(tmp_path / "db.sqlite")))
+    db.add_student(Student("Ana", "ana@gmail.com", "ADS", 20))
+    committing, release = threading.Event(), threading.Event()
+
+    async def run():
+        server = StudentServer(db)
+        port = (await server.start(port=0)).sockets[0].getsockname()[1]
+        writer_backend = server._write_runner.db_manager.backend
+        original_transaction = writer_backend.transaction
+
+        @contextmanager
+        def slow_transaction():
+            with original_transaction():
+                yield
+                committing.set()
+                release.wait(5)
+        writer_backend.transaction = slow_transaction
+
+        try:
+            write = asyncio.ensure_future(_request(port, _add(1)))
+            await asyncio.get_running_loop().run_in_executor(None, committing.wait, 5)
+            read = await asyncio.wait_for(
+                _request(port, {'cmd': 'search', 'email': "ana@gmail.com"}), 2)
+            pending = not write.done()
+            release.set()
+            return read, pending, await write
+        finally:
+            release.set()
+            await server.close()
+
+    read, pending, write = asyncio.run(run())
+
+    assert pending
+    assert read[0]['students'][0]['name'] == "Ana"
+    assert write[0]['ok']
+    assert db.find_student_by_matricula("STU001") is not None
+
+
+def test_failed_commit_is_rolled_back(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+
+    def failing_save(students, changes=None):
+        raise OSError("disco cheio")
+
+    db.backend.save = failing_save
+
+    async def scenario(port):
+        return await _request(port, _add(1), {'cmd': 'search', 'matricula': "STU001"})
+
+    (write, read), _ = asyncio.run(_serving(db, scenario))
+
+    assert write == {'ok': False, 'error': "Erro ao gravar lote de alterações", 'id': 1}
+    assert read['students'] == []
+    assert db.get_students_count() == 0
+
+
+def test_load_generator(tmp_path):
+    db = DatabaseManager(str(tmp_path / "db.json"))
+
+    async def scenario(port):
+        return await run_load(clients=5, requests=20, write_ratio=0.5, port=port)
+
+    result, server = asyncio.run(_serving(db, scenario))
+
+    assert result.requests == 100
+    assert result.errors == 0
+    assert result.ops_per_second > 0
+    assert result.to_dict()['p99_ms'] >= result.to_dict()['p50_ms']
+    assert db.get_students_count() == server.writes
@@ -0,0 +1,114 @@
+import glob
+import os
+
+import pytest
+from backends import ShardedJsonBackend
+from helpers import dicts, fill_roster, make_student
+from database import DatabaseManager
+from models import Student
+from reports import ReportManager
+
+
+def _make_student(i):
+    return make_student(f"STU{(i * 11) % 60 if i < 60 else i:03d}", f"Aluno {i}",
+                        f"aluno{i}@gmail.com", ["ADS", "BES", "SI", "Análise"][i % 4],
+                        18 + i % 7, f"2025-09-{1 + i % 4:02d}")
+
+
+def _fill(db):
+    fill_roster(db, _make_student, 60)
+    db.remove_student("STU011")
+    db.update_student("STU022", {"course": "SI", "name": "Outro"})
+    db.add_student(_make_student(100))
+
+
+def _dicts(db):
+    return dicts(db.get_all_students())
+
+
+@pytest.mark.parametrize("by", ["matricula", "course"])
+@pytest.mark.parametrize("processes", [True, False])
+def test_shards_round_trip_in_roster_order(tmp_path, by, processes):
+    plain = DatabaseManager(str(tmp_path / "plain.json"))
+    path = str(tmp_path / "db.json")
+    sharded = DatabaseManager(backend=ShardedJsonBackend(path, shards=4, by=by, workers=2, processes=processes))
+    _fill(plain)
+    _fill(sharded)
+
+    assert len(glob.glob(path + ".shard-*")) == 4
+    reloaded = DatabaseManager(backend=ShardedJsonBackend(path, shards=4, by=by, workers=2, processes=processes))
+    assert _dicts(reloaded) == _dicts(plain)
+
+
+def test_save_rewrites_only_affected_shards(tmp_path):
+    path = str(tmp_path / "db.json")
+    backend = ShardedJsonBackend(path, shards=4, by="course")
+    db = DatabaseManager(backend=backend)
+    _fill(db)
+
+    def stamps():
+        return {p: os.stat(p).st_ino for p in glob.glob(path + ".shard-*")}
+
+    before = stamps()
+    student = _make_student(101)
+    db.add_student(student)
+    changed = {p for p, ino in stamps().items() if before[p] != ino}
+    assert changed == {backend.shard_filename(backend.shard_for(student))}
+
+    # Mudar de curso leva o registro para outro shard: os dois são reescritos.
+    old_shard = backend.shard_for(student)
+    course = next(c for c in ("ADS", "SI", "Análise", "Direito", "Medicina")
+                  if backend.shard_for(Student("X", "x@x.com", c, 20)) != old_shard)
+    before = stamps()
+    db.update_student(student.matricula, {"course": course})
+    changed = {p for p, ino in stamps().items() if before[p] != ino}
+    assert len(changed) == 2
+    assert DatabaseManager(backend=ShardedJsonBackend(path, shards=4, by="course")) \
+        .find_student_by_matricula(student.matricula).course == course
+
+
+def test_reshard_and_split_existing_json(tmp_path):
+    path = str(tmp_path / "db.json")
+    plain = DatabaseManager(path, journal=True)
+    _fill(plain)
+    plain.compact()
+
+    db = DatabaseManager(backend=ShardedJsonBackend(path, shards=4), journal=True)
+    assert _dicts(db) == _dicts(plain)
+    db.remove_student("STU000")
+    db.compact()
+    assert len(glob.glob(path + ".shard-*")) == 4
+
+    resharded = DatabaseManager(backend=ShardedJsonBackend(path, shards=3))
+    assert resharded.get_students_count() == 59
+    resharded.compact()
+    assert sorted(glob.glob(path + ".shard-*")) == [f"{path}.shard-{i:02d}of03" for i in range(3)]
+    assert _dicts(DatabaseManager(backend=ShardedJsonBackend(path, shards=3))) == _dicts(resharded)
+
+
+def test_parallel_course_report_matches_memory(tmp_path):
+    db = DatabaseManager(backend=ShardedJsonBackend(str(tmp_path / "db.json"), shards=4))
+    _fill(db)
+    reports = ReportManager(db)
+
+    parallel = {c: (a.count, a.min_age, a.max_age) for c, a in reports.course_stats(parallel=True).items()}
+    assert parallel == {c: (a.count, a.min_age, a.max_age) for c, a in db.get_course_stats().items()}
+    assert list(reports.iter_course_report(parallel=True))[2:] == list(reports.iter_course_report())[2:]
+    assert db.backend.aggregates()[1] == db.get_registrations_per_day()
+
+
+def test_student_removed_and_added_again_keeps_roster_order(tmp_path):
+    path = str(tmp_path / "db.json")
+    db = DatabaseManager(backend=ShardedJsonBackend(path, shards=2))
+    for matricula in ("STU001", "STU004", "STU002"):
+        assert db.add_student(make_student(matricula))
+    with db.batch():
+        assert db.remove_student("STU001")
+        assert db.add_student(make_student("STU001", "Outra"))
+
+    reloaded = DatabaseManager(backend=ShardedJsonBackend(path, shards=2))
+    assert _dicts(reloaded) == _dicts(db)
+    assert [s.matricula for s in reloaded.get_all_students()] == ["STU004", "STU002", "STU001"]
+
+    reloaded.compact()
+    assert _dicts(DatabaseManager(backend=ShardedJsonBackend(path, shards=2))) == _dicts(db)
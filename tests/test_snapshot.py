@@ -0,0 +1,84 @@
+import os
+import time
+
+import pytest
+from database import DatabaseManager
+from models import Student
+from snapshot import BinarySnapshot, SnapshotError
+
+
+def _students(count):
+    students = []
+    for i in range(count):
+        student = Student(f"Aluno Ção {i}", f"aluno{i}@gmail.com", ["ADS", "BES"][i % 2], 16 + i % 60)
+        student.matricula = f"STU{i:09d}"
+        student.registration_date = f"2025-09-{1 + i % 28:02d}"
+        students.append(student)
+    return students
+
+
+def test_round_trip_preserves_fields():
+    students = _students(50)
+    loaded = BinarySnapshot.decode(BinarySnapshot.encode(students))
+
+    assert [s.to_dict() for s in loaded] == [s.to_dict() for s in students]
+    assert BinarySnapshot.decode(BinarySnapshot.encode([])) == []
+
+
+def test_decode_rejects_corruption():
+    data = bytearray(BinarySnapshot.encode(_students(3)))
+    data[-5] ^= 0xFF
+    with pytest.raises(SnapshotError):
+        BinarySnapshot.decode(bytes(data))
+    with pytest.raises(SnapshotError):
+        BinarySnapshot.decode(b"JSON" + bytes(data[4:]))
+    with pytest.raises(SnapshotError):
+        BinarySnapshot.decode(bytes(data[:10]))
+
+
+def test_database_switches_between_binary_and_json(tmp_path):
+    path = str(tmp_path / "db.json")
+    db = DatabaseManager(path, binary_snapshot=True)
+    with db.batch():
+        for student in _students(20):
+            db.add_student(student)
+    assert os.path.exists(path + ".bin")
+
+    reloaded = DatabaseManager(path, binary_snapshot=True)
+    assert [s.to_dict() for s in reloaded.get_all_students()] == [s.to_dict() for s in db.get_all_students()]
+
+    # JSON editado por fora fica mais novo que o binário: o JSON vence.
+    DatabaseManager(path).remove_student("STU000000000")
+    stat = os.stat(path + ".bin")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert DatabaseManager(path, binary_snapshot=True).find_student_by_matricula("STU000000000") is None
+
+    # Binário corrompido é ignorado em favor do JSON.
+    with open(path + ".bin", "r+b") as file:
+        file.seek(-3, os.SEEK_END)
+        file.write(b"\xff\xff\xff")
+    os.utime(path + ".bin", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert DatabaseManager(path, binary_snapshot=True).get_students_count() == 19
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("count", [10_000, 100_000, 1_000_000])
+def test_load_time(tmp_path, count):
+    path = str(tmp_path / "db.json")
+    db = DatabaseManager(path, binary_snapshot=True)
+    with db.batch():
+        for student in _students(count):
+            db.add_student(student)
+    del db
+
+    start = time.perf_counter()
+    json_db = DatabaseManager(path)
+    json_time = time.perf_counter() - start
+    del json_db
+
+    start = time.perf_counter()
+    binary_db = DatabaseManager(path, binary_snapshot=True)
+    binary_time = time.perf_counter() - start
+
+    assert binary_db.get_students_count() == count
+    assert binary_time < json_time, f"binário {binary_time:.2f}s, JSON {json_time:.2f}s"
@@ -0,0 +1,130 @@
+import pytest
+from backends import SQLiteBackend
+from database import DatabaseManager
+from helpers import dicts as _dicts, fill_roster, make_student
+from main import main
+from migrate import MigrationError, migrate_json_to_sqlite
+
+
+def _make_student(i):
+    return make_student(f"STU{(i * 7) % 40:03d}",
+                        ["João Silva", "Joana Souza", "Ana Lima", "Bruno Sá"][i % 4] + f" {i}",
+                        f"aluno{i}@gmail.com", ["ADS", "Análise", "BES"][i % 3], 17 + i % 9,
+                        f"2025-09-{1 + i % 5:02d}")
+
+
+def _fill(db):
+    fill_roster(db, _make_student, 40)
+    db.update_student("STU007", {"name": "Joâo Pedro", "course": "analise"})
+    db.remove_student("STU014")
+
+
+def test_sqlite_matches_memory(tmp_path):
+    memory = DatabaseManager(str(tmp_path / "db.json"))
+    sqlite = DatabaseManager(backend=SQLiteBackend(str(tmp_path / "db.sqlite")))
+    _fill(memory)
+    _fill(sqlite)
+
+    assert sqlite.get_students_count() == memory.get_students_count() == 39
+    assert _dicts(sqlite.get_all_students()) == _dicts(memory.get_all_students())
+    assert sqlite.find_student_by_matricula(" STU021 ").to_dict() == memory.find_student_by_matricula("STU021").to_dict()
+    assert sqlite.find_student_by_email("ALUNO3@gmail.com").matricula == "STU021"
+    for name, folded in (("joao", True), ("joao", False), ("João", False), ("sa", True), ("", False)):
+        assert _dicts(sqlite.find_students_by_name(name, folded)) == _dicts(memory.find_students_by_name(name, folded))
+    assert _dicts(sqlite.find_students_fuzzy("jaona suza", limit=5)) == _dicts(memory.find_students_fuzzy("jaona suza", limit=5))
+    for filters in ({"course": "ANALISE"}, {"age_min": 20, "age_max": 22},
+                    {"course": "ads", "registered_from": "2025-09-02", "registered_to": "2025-09-03"}):
+        assert _dicts(sqlite.find_students(**filters)) == _dicts(memory.find_students(**filters))
+    for order_by in ("matricula", "registration_date"):
+        assert _dicts(sqlite.iter_students(order_by, page_size=6)) == _dicts(memory.iter_students(order_by, page_size=6))
+        assert _dicts(sqlite.iter_students(order_by, page_size=6, offset=10)) == _dicts(memory.iter_students(order_by, page_size=6, offset=10))
+    assert {c: (a.count, a.min_age, a.max_age) for c, a in sqlite.get_course_stats().items()} == \
+        {c: (a.count, a.min_age, a.max_age) for c, a in memory.get_course_stats().items()}
+    assert sqlite.get_registrations_per_day() == memory.get_registrations_per_day()
+
+
+def test_sqlite_changes_are_durable_and_batches_roll_back(tmp_path):
+    path = str(tmp_path / "db.sqlite")
+    db = DatabaseManager(backend=SQLiteBackend(path))
+    _fill(db)
+    assert not db.add_student(_make_student(0))
+    duplicate_email = _make_student(100)
+    duplicate_email.email = " ALUNO1@gmail.com"
+    assert not db.add_student(duplicate_email)
+    assert not db.update_student("STU000", {"email": "aluno1@gmail.com"})
+
+    with pytest.raises(RuntimeError):
+        with db.batch():
+            db.add_student(_make_student(100))
+            db.update_student("STU000", {"name": "Outro"})
+            db.remove_student("STU021")
+            raise RuntimeError("falha no meio do lote")
+
+    reopened = DatabaseManager(backend=SQLiteBackend(path))
+    assert reopened.get_students_count() == 39
+    assert reopened.find_student_by_matricula("STU000").name == "João Silva 0"
+    assert reopened.find_student_by_matricula("STU007").course == "analise"
+    assert reopened.find_students_fuzzy("joao pedro")[0].matricula == "STU007"
+    assert reopened.compact()
+
+
+def test_sqlite_lookups_use_indexes(tmp_path):
+    backend = SQLiteBackend(str(tmp_path / "db.sqlite"))
+    plans = {
+        "email_key": "SELECT matricula FROM students WHERE email_key = ? ORDER BY id LIMIT 1",
+        "course_key": "SELECT id FROM students WHERE course_key = ?",
+        "matricula": "SELECT id FROM students WHERE matricula = ?",
+    }
+    for column, sql in plans.items():
+        plan = " ".join(row[-1] for row in backend._conn.execute("EXPLAIN QUERY PLAN " + sql, ("x",)))
+        assert "USING" in plan and "INDEX" in plan, (column, plan)
+
+
+def test_migrate_json_to_sqlite(tmp_path):
+    json_path = str(tmp_path / "students_data.json")
+    source = DatabaseManager(json_path, journal=True)
+    _fill(source)
+
+    assert migrate_json_to_sqlite(json_path, str(tmp_path / "db.sqlite")) == 39
+    migrated = DatabaseManager(backend=SQLiteBackend(str(tmp_path / "db.sqlite")))
+    assert _dicts(migrated.get_all_students()) == _dicts(source.get_all_students())
+
+
+def test_sqlite_update_converts_age(tmp_path):
+    db = DatabaseManager(backend=SQLiteBackend(str(tmp_path / "db.sqlite")))
+    _fill(db)
+    assert db.update_student("STU000", {"age": "30"})
+    assert not db.update_student("STU000", {"age": "trinta"})
+    assert db.find_student_by_matricula("STU000").age == 30
+    assert "STU000" in [s.matricula for s in db.find_students(age_min=30, age_max=30)]
+
+
+def test_migrate_refuses_missing_or_unreadable_source(tmp_path):
+    target = str(tmp_path / "db.sqlite")
+    db = DatabaseManager(backend=SQLiteBackend(target))
+    _fill(db)
+    db.backend.close()
+
+    with pytest.raises(MigrationError):
+        migrate_json_to_sqlite(str(tmp_path / "nada.json"), target)
+    corrupt = tmp_path / "corrompido.json"
+    corrupt.write_text("[{", encoding="utf-8")
+    with pytest.raises(MigrationError):
+        migrate_json_to_sqlite(str(corrupt), target)
+    assert DatabaseManager(backend=SQLiteBackend(target)).get_students_count() == 39
+
+
+def test_migrate_replaces_a_populated_target_only_when_asked(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    source = DatabaseManager(str(tmp_path / "students_data.json"))
+    source.add_student(_make_student(0))
+    target = DatabaseManager(backend=SQLiteBackend(str(tmp_path / "db.sqlite")))
+    _fill(target)
+    target.backend.close()
+
+    assert main(["migrate", "db.sqlite"]) == 1
+    assert "--substituir" in capsys.readouterr().out
+    assert DatabaseManager(backend=SQLiteBackend(str(tmp_path / "db.sqlite"))).get_students_count() == 39
+
+    assert main(["migrate", "db.sqlite", "--substituir"]) == 0
+    assert DatabaseManager(backend=SQLiteBackend(str(tmp_path / "db.sqlite"))).get_students_count() == 1
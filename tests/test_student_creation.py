@@ -1,4 +1,13 @@
-from models import Student
+import gc
+import json
+import multiprocessing
+import threading
+import time
+import tracemalloc
+
+import pytest
+
+from models import MatriculaGenerator, Student
 
 def test_student_creation_default():
     student = Student("João Silva", "joao@gmail.com", "ADS", 20)
@@ -8,3 +17,115 @@ def test_student_creation_default():
     assert student.course == "ADS"
     assert student.age == 20
     assert "STU" in student.matricula
+
+
+def _generate_in_child(count, queue):
+    queue.put([Student._generate_matricula() for _ in range(count)])
+
+
+def test_matriculas_unique_and_sorted_in_same_second():
+    generator = MatriculaGenerator(node=7)
+    ids = [generator.next() for _ in range(1000)] + generator.next_many(5000)
+
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    assert all(i.startswith("STU") and len(i) == 30 for i in ids)
+
+
+def test_matriculas_sort_after_legacy_ids():
+    legacy = "STU20250901131429"
+    new = MatriculaGenerator(node=1).next()
+
+    assert sorted([new, legacy]) == [legacy, new]
+    assert new[3:17].isdigit() and new[3:17] > legacy[3:]
+
+
+def test_matricula_sequence_overflow_advances_clock():
+    generator = MatriculaGenerator(node=1)
+    generator._capacity = 10
+    ids = generator.next_many(25)
+
+    assert len(set(ids)) == 25
+    assert ids == sorted(ids)
+    assert len({i[3:17] for i in ids}) >= 3
+
+
+def test_repeated_local_time_does_not_repeat_matriculas(monkeypatch):
+    # Fim do horário de verão: a mesma hora local se repete uma hora depois.
+    clock = [1_700_000_000]
+    monkeypatch.setattr("models.time.time", lambda: clock[0])
+    monkeypatch.setattr("models.time.localtime",
+                        lambda second: time.gmtime(second - 3600 * (second >= 1_700_000_005)))
+    generator = MatriculaGenerator(node=1)
+    generator._capacity = 3
+
+    ids = []
+    for _ in range(20):
+        ids.extend(generator.next_many(2))
+        clock[0] += 1
+
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+
+
+def test_matriculas_unique_across_threads():
+    results = []
+
+    def worker():
+        results.append([Student._generate_matricula() for _ in range(5000)])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ids = [i for chunk in results for i in chunk]
+    assert len(set(ids)) == 8 * 5000
+    assert all(chunk == sorted(chunk) for chunk in results)
+
+
+def test_matriculas_unique_across_processes():
+    queue = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=_generate_in_child, args=(2000, queue))
+                 for _ in range(3)]
+    for process in processes:
+        process.start()
+    ids = [i for _ in processes for i in queue.get(timeout=30)]
+    for process in processes:
+        process.join()
+
+    ids.extend(Student._generate_matricula() for _ in range(2000))
+    assert len(set(ids)) == 4 * 2000
+
+
+def test_student_is_compact():
+    first = Student.from_dict({"matricula": "STU1", "name": "Ana", "email": "a@b.cd",
+                               "course": "".join(["A", "DS"]), "age": 20,
+                               "registration_date": "".join(["2025-09-", "01"])})
+    second = Student("Bia", "b@b.cd", "".join(["AD", "S"]), 21)
+    second.registration_date = first.registration_date
+
+    assert not hasattr(first, "__dict__")
+    assert first.course is second.course
+
+
+@pytest.mark.slow
+def test_memory_per_record(tmp_path):
+    path = tmp_path / "alunos.json"
+    records = [{"matricula": f"STU{i:020d}", "name": f"Aluno {i}", "email": f"a{i}@x.com",
+                "course": ["ADS", "BES", "Medicina"][i % 3], "age": 20 + i % 40,
+                "registration_date": f"2025-09-{1 + i % 30:02d}"} for i in range(100_000)]
+    path.write_text(json.dumps(records), encoding="utf-8")
+    del records
+
+    gc.collect()
+    tracemalloc.start()
+    with open(path, encoding="utf-8") as file:
+        students = [Student.from_dict(data) for data in json.load(file)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Antes de __slots__ e da internação de strings: ~441 B por registro.
+    assert current / len(students) < 320, f"{current / len(students):.0f} B/registro"
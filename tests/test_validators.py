@@ -54,3 +54,41 @@ def test_curso(curso, esperado):
 ])
 def test_idade(idade, esperado):
     assert StudentValidator.validate_age(idade) == esperado
+
+
+# LOTE
+VALORES = ["", "A", "Li", "Ana", "Ana123", "Ana@", " Ana Souza ", "José Conceição", "Ana  Lima",
+           "  ", "a@b.", "email.com", "ana@", "ana@gmail", "a@b.c", "a@b.cd", " joao@gmail.com ",
+           "a@b.c\n", "TI", "ADS", "Medicina", "²²²", 15, 16, 80, 81, "20", " 30 ", 20.9, True,
+           "vinte", None, [], 0]
+
+
+def test_validate_records_matches_single_validators():
+    rows = [{'name': v, 'email': v, 'course': v, 'age': v} for v in VALORES] + [None, {}]
+    mask = StudentValidator.validate_records(rows)
+
+    single = {
+        'name': StudentValidator.validate_name,
+        'email': StudentValidator.validate_email,
+        'course': StudentValidator.validate_course,
+        'age': StudentValidator.validate_age,
+    }
+    for field, validate in single.items():
+        expected = [not validate(v) for v in VALORES] + [True, True]
+        assert mask.errors[field] == expected, field
+
+
+def test_validate_records_masks():
+    rows = [
+        {'name': "Ana", 'email': "ana@gmail.com", 'course': "ADS", 'age': 20},
+        {'name': "Ana1", 'email': "ana@gmail.com", 'course': "TI", 'age': 20},
+        {'name': "Bia", 'email': "bia@gmail.com", 'course': "ADS", 'age': "20"},
+    ]
+    mask = StudentValidator.validate_records(rows)
+
+    assert len(mask) == 3
+    assert mask.rows == [False, True, False]
+    assert mask.invalid_fields(1) == ['name', 'course']
+    assert not mask.valid
+    assert StudentValidator.validate_records([rows[0], rows[2]]).valid
+    assert StudentValidator.validate_records([]).valid
@@ -3,7 +3,7 @@ Validators - Módulo de validação de dados para o sistema TrackStudent.
 """
 
 import re
-from typing import Union
+from typing import Dict, Iterable, List, Optional, Sequence, Union
 
 
 class StudentValidator:
@@ -11,15 +11,16 @@ class StudentValidator:
     
     MIN_AGE, MAX_AGE = 16, 80
     MIN_NAME_LENGTH, MIN_COURSE_LENGTH = 2, 3
+    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{1,}$')
+    FIELDS = ('name', 'email', 'course', 'age')
     
-    @staticmethod
-    def validate_email(email: str) -> bool:
+    @classmethod
+    def validate_email(cls, email: str) -> bool:
         """Valida o formato do endereço de email."""
         if not email or not isinstance(email, str):
             return False
         
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{1,}$'
-        return re.match(pattern, email.strip()) is not None
+        return cls.EMAIL_PATTERN.match(email.strip()) is not None
     
     @classmethod
     def validate_age(cls, age: Union[int, str]) -> bool:
@@ -49,4 +50,88 @@ class StudentValidator:
         if not course or not isinstance(course, str):
             return False
         
-        return len(course.strip()) >= cls.MIN_COURSE_LENGTH
\ No newline at end of file
+        return len(course.strip()) >= cls.MIN_COURSE_LENGTH
+    
+    @classmethod
+    def validate_records(cls, rows: Iterable[Optional[Dict]]) -> 'ValidationMask':
+        """Valida vários registros de uma vez, campo a campo.
+        
+        Registros ausentes (None) ou sem algum campo contam como inválidos
+        nesse campo. O resultado é idêntico ao dos validadores individuais.
+        """
+        rows = list(rows)
+        columns = {field: [row.get(field) if row is not None else None for row in rows]
+                   for field in cls.FIELDS}
+        return cls.validate_columns(columns)
+    
+    @classmethod
+    def validate_columns(cls, columns: Dict[str, Sequence]) -> 'ValidationMask':
+        """Valida colunas inteiras (campo -> valores, uma posição por registro)."""
+        validators = {
+            'name': cls._invalid_names,
+            'email': cls._invalid_emails,
+            'course': cls._invalid_courses,
+            'age': cls._invalid_ages,
+        }
+        return ValidationMask({field: validators[field](values)
+                               for field, values in columns.items()})
+    
+    @classmethod
+    def _invalid_names(cls, names: Sequence) -> List[bool]:
+        stripped = [name.strip() if name and isinstance(name, str) else "" for name in names]
+        minimum = cls.MIN_NAME_LENGTH
+        short = [len(name) < minimum for name in stripped]
+        letters = [name.replace(' ', '') for name in stripped]
+        # Caminho rápido: se a coluna inteira só tem letras, basta um teste.
+        if "".join(letters).isalpha():
+            return short
+        return [too_short or not name.isalpha() for too_short, name in zip(short, letters)]
+    
+    @classmethod
+    def _invalid_emails(cls, emails: Sequence) -> List[bool]:
+        match = cls.EMAIL_PATTERN.match
+        return [not (email and isinstance(email, str) and match(email.strip()))
+                for email in emails]
+    
+    @classmethod
+    def _invalid_courses(cls, courses: Sequence) -> List[bool]:
+        minimum = cls.MIN_COURSE_LENGTH
+        return [not (course and isinstance(course, str) and len(course.strip()) >= minimum)
+                for course in courses]
+    
+    @classmethod
+    def _invalid_ages(cls, ages: Sequence) -> List[bool]:
+        low, high = cls.MIN_AGE, cls.MAX_AGE
+        invalid = []
+        for age in ages:
+            if type(age) is not int:
+                try:
+                    age = int(age)
+                except (ValueError, TypeError):
+                    invalid.append(True)
+                    continue
+            invalid.append(not low <= age <= high)
+        return invalid
+
+
+class ValidationMask:
+    """Resultado de ``validate_records``: máscara de erros por campo e por registro.
+    
+    ``errors[campo][i]`` é True quando o campo do registro ``i`` é inválido.
+    """
+    
+    def __init__(self, errors: Dict[str, List[bool]]):
+        self.errors = errors
+        self.rows = [any(flags) for flags in zip(*errors.values())] if errors else []
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    @property
+    def valid(self) -> bool:
+        """Indica se todos os registros são válidos."""
+        return not any(self.rows)
+    
+    def invalid_fields(self, index: int) -> List[str]:
+        """Campos inválidos do registro ``index``, na ordem das colunas."""
+        return [field for field, flags in self.errors.items() if flags[index]]